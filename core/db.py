@@ -0,0 +1,74 @@
+import fcntl
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.conf import settings
+
+
+def configure_connection(sender, connection, **kwargs):
+    """
+    Tune new SQLite connections for several processes writing at the same time.
+
+    In WAL mode readers don't block the writer nor the writer readers, ``synchronous=NORMAL``
+    only syncs at checkpoints (safe with WAL), and a writer finding the database locked
+    retries for ``SQLITE_BUSY_TIMEOUT`` seconds instead of failing at once.
+    """
+    if connection.vendor != 'sqlite' or not settings.SQLITE_TUNED:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT * 1000)}')
+
+
+class WriteLock(object):
+    """
+    Lock serialising writers across the threads and processes of a host, through ``flock``.
+
+    SQLite fails transactions that read before writing with "database is locked" when
+    another connection writes meanwhile, whatever the busy timeout; writers holding this
+    lock around such transactions never overlap. The lock is reentrant within a thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    @contextmanager
+    def __call__(self) -> Iterator[None]:
+        depth = getattr(self._local, 'depth', 0)
+        if depth:
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+
+        # Every acquisition opens the file, flock locks of separate opens exclude each other, also within a process.
+        with open(self.path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._local.depth = 1
+            try:
+                yield
+            finally:
+                self._local.depth = 0
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_write_locks = {}
+
+
+@contextmanager
+def write_lock() -> Iterator[None]:
+    """Hold the lock of ``DATABASE_WRITE_LOCK_FILE`` while writing, nothing if it isn't set."""
+    path = settings.DATABASE_WRITE_LOCK_FILE
+    if not path:
+        yield
+        return
+    lock = _write_locks.get(path)
+    if lock is None:
+        lock = _write_locks.setdefault(path, WriteLock(path))
+    with lock():
+        yield
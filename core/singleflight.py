@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException = None
+
+
+class SingleFlight(object):
+    """
+    Coalesce concurrent calls with the same key into one.
+
+    While a call for a key is in flight, callers of ``do`` (threads) or ``do_async``
+    (asyncio tasks of the same event loop) with that key wait for it and get its
+    result, or its exception, instead of making the call themselves. Nothing is
+    kept once the call is done, later callers make a new one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[tuple, asyncio.Future] = {}
+        self._counts = {'calls': 0, 'shared': 0}
+
+    def _count(self, shared: bool):
+        self._counts['calls'] += 1
+        if shared:
+            self._counts['shared'] += 1
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+            self._count(shared=not is_leader)
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable]) -> Any:
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(loop_key)
+            self._count(shared=task is not None)
+            if task is None:
+                task = self._tasks[loop_key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda _: self._forget_task(loop_key))
+        # A cancelled caller mustn't cancel the call the others are waiting for.
+        return await asyncio.shield(task)
+
+    def _forget_task(self, loop_key: tuple):
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of calls, and of those that were served by a call already in flight."""
+        with self._lock:
+            return dict(self._counts)
@@ -23,4 +23,5 @@ urlpatterns = [
     path('admin/login/', TelegramUserLoginView.as_view(), name='login'),
     path('admin/', admin.site.urls),
     path('user/', include('telegram_user.urls')),
+    path('api/', include('mobilede_parser.urls')),
 ]
@@ -0,0 +1,31 @@
+import asyncio
+import functools
+
+from asgiref.sync import sync_to_async
+
+
+class AsyncViewMixin(object):
+    """
+    Run a class-based view as a coroutine, so ``async def`` handlers work.
+
+    Django 3.2 only runs function views natively under ASGI, so ``as_view`` wraps the
+    view in a coroutine function. ``request.user`` is loaded in a thread beforehand,
+    as the sync parts of ``dispatch`` (e.g. ``LoginRequiredMixin``) may touch it and
+    the ORM can't be used from the event loop. Under WSGI the view still works, Django
+    runs it in an event loop of its own.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        async def async_view(request, *args, **kwargs):
+            if hasattr(request, 'user'):
+                await sync_to_async(lambda: request.user.is_authenticated)()
+            response = view(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+            return response
+
+        functools.update_wrapper(async_view, view)
+        return async_view
@@ -1,38 +1,129 @@
+from django.conf import settings
 from django.contrib import admin
-from django.contrib.admin import ModelAdmin
+from django.contrib.admin import ModelAdmin, TabularInline
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from django.utils.html import format_html
 
-from .models import Search, Ad
+from .models import Search, Ad, AdSearch, SearchStats
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes the size of unfiltered PostgreSQL tables from planner statistics.
+
+    Small tables, filtered querysets and other databases are still counted exactly.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.exact_count_threshold:
+                return row[0]
+        return super().count
 
 
 class SearchAdmin(ModelAdmin):
-    list_display = ('name', 'url')
-    readonly_fields = ('created_at', 'updated_at', 'url')
+    list_display = ('name', 'url', 'ad_count', 'median_price', 'new_today')
+    list_select_related = ('stats',)
+    readonly_fields = ('created_at', 'updated_at', 'url', 'ad_count', 'average_price', 'median_price', 'new_today')
     search_fields = ('name',)
     filter_horizontal = ('subscribers',)
 
     fieldsets = (
         (None, {'fields': ('name', 'url')}),
+        ('Stats', {'fields': ('ad_count', 'average_price', 'median_price', 'new_today')}),
         ('Other', {'fields': ('subscribers', 'created_at', 'updated_at')}),
     )
 
+    @staticmethod
+    def _get_stats(obj):
+        try:
+            return obj.stats
+        except SearchStats.DoesNotExist:
+            return None
+
+    @admin.display(description='ads')
+    def ad_count(self, obj):
+        stats = self._get_stats(obj)
+        return stats and stats.ad_count
+
+    @admin.display(description='average price')
+    def average_price(self, obj):
+        stats = self._get_stats(obj)
+        return stats and stats.average_price
+
+    @admin.display(description='median price (approx.)')
+    def median_price(self, obj):
+        stats = self._get_stats(obj)
+        return stats and stats.median_price
+
+    @admin.display(description='new today')
+    def new_today(self, obj):
+        stats = self._get_stats(obj)
+        return stats and stats.new_today
+
 
 admin.site.register(Search, SearchAdmin)
 
 
+class AdSearchInline(TabularInline):
+    model = AdSearch
+    fields = ('search', 'last_seen_at')
+    readonly_fields = ('last_seen_at',)
+    autocomplete_fields = ('search',)
+    extra = 0
+
+
 class AdAdmin(ModelAdmin):
-    list_display = ('site_id', 'name', 'price', 'price_net', 'vat', 'date')
-    readonly_fields = ('price_net', 'created_at', 'updated_at', 'url')
+    list_display = ('image', 'site_id', 'name', 'price', 'price_net', 'vat', 'date')
+    list_display_links = ('site_id',)
+    readonly_fields = (
+        'image', 'price_net', 'deal_score', 'price_percentile', 'canonical_ad', 'created_at', 'updated_at', 'url',
+    )
     search_fields = ('site_id', 'name',)
-    filter_horizontal = ('searches',)
-    date_hierarchy = 'date'
+    inlines = (AdSearchInline,)
+    date_hierarchy = None if settings.PARSER_ADMIN_HIGH_VOLUME else 'date'
+
+    if settings.PARSER_ADMIN_HIGH_VOLUME:
+        paginator = EstimatedCountPaginator
+        show_full_result_count = False
 
     fieldsets = (
-        (None, {'fields': ('site_id', 'name')}),
-        ('Financial Info', {'fields': ('price', 'price_net', 'vat')}),
+        (None, {'fields': ('image', 'site_id', 'name')}),
+        ('Financial Info', {'fields': ('price', 'price_net', 'vat', 'deal_score', 'price_percentile')}),
         ('General Info', {'fields': ('date', 'description', 'url', 'image_url')}),
-        ('Other', {'fields': ('searches', 'created_at', 'updated_at')}),
+        ('Vehicle', {'fields': ('mileage', 'first_registration', 'power_kw', 'fuel', 'transmission')}),
+        ('Other', {'fields': ('canonical_ad', 'created_at', 'updated_at')}),
     )
 
+    @admin.display(description='image')
+    def image(self, obj):
+        thumbnail_url = obj.thumbnail_url
+        return format_html('<img src="{}" alt="" height="48" loading="lazy">', thumbnail_url) if thumbnail_url else ''
+
+    def get_search_results(self, request, queryset, search_term):
+        if not settings.PARSER_ADMIN_HIGH_VOLUME:
+            return super().get_search_results(request, queryset, search_term)
+
+        # One indexed lookup instead of OR-ing a cast site_id LIKE with a name LIKE.
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if search_term.isdigit():
+            return queryset.filter(site_id=int(search_term)), False
+        return queryset.filter(name__icontains=search_term), False
+
     def has_add_permission(self, request):
         return False
 
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+
+from core.db import configure_connection
+
+
+def restore_full_text_index(sender, using, **kwargs):
+    from .models.helpers.fulltext import restore_full_text_index
+    restore_full_text_index(using)
 
 
 class MobileDeParserConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'mobilede_parser'
+
+    def ready(self):
+        post_migrate.connect(restore_full_text_index, sender=self)
+        connection_created.connect(configure_connection)
@@ -0,0 +1,254 @@
+import math
+import random
+import threading
+import time
+import zlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from html import escape
+from typing import Dict, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+MAKES = (
+    ('Volkswagen', ('Golf', 'Passat', 'Polo', 'Tiguan')),
+    ('BMW', ('320', '520', 'X3', '118')),
+    ('Skoda', ('Octavia', 'Superb', 'Fabia')),
+    ('Audi', ('A3', 'A4', 'A6', 'Q5')),
+    ('Opel', ('Astra', 'Insignia', 'Corsa')),
+)
+FUELS = ('Diesel', 'Petrol', 'Hybrid (petrol/electric)', 'Electric')
+TRANSMISSIONS = ('Manual gearbox', 'Automatic transmission')
+BODIES = ('Saloon', 'Estate Car', 'Small Car', 'SUV/Off-road Vehicle/Pickup Truck')
+# Prices of fake results are spread over 0..FAKE_MAX_PRICE, to narrow by minPrice/maxPrice.
+FAKE_MAX_PRICE = 100000
+# Fake ad ids start about where those of mobile.de are, every search gets a block of its own.
+FIRST_SITE_ID = 300000000
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def render_ad_item(rng: random.Random, site_id: int, min_price: int, max_price: int) -> str:
+    make, models = rng.choice(MAKES)
+    name = f'{make} {rng.choice(models)} {rng.choice(("1.6 TDI", "2.0 TDI", "1.4 TSI", "xDrive", ""))}'.strip()
+    price = rng.randint(min_price, max(max_price, min_price))
+    registration = f'{rng.randint(1, 12):02d}/{rng.randint(2005, 2021)}'
+    mileage = rng.randrange(1000, 300000, 100)
+    power = rng.randint(44, 250)
+    hour = rng.randint(1, 12)
+
+    if rng.random() < 0.6:
+        vat_block = (
+            f'<span class="u-block u-text-grey-60 u-text-small">19% VAT</span>'
+            f'<span class="u-block seller-currency u-text-grey-60">'
+            f'€{round(price / 1.19):,} (Net)</span>'
+        )
+    else:
+        vat_block = ''
+
+    new_label = '<span class="new-headline-label">NEW</span>' if rng.random() < 0.2 else ''
+    item_class = 'cBox-body--eyeCatcher' if rng.random() < 0.05 else 'cBox-body--resultitem'
+    return (
+        f'<div class="cBox-body {item_class}">'
+        f'<a class="link--muted no--text--decoration result-item" '
+        f'href="https://suchen.mobile.de/fahrzeuge/details.html?id={site_id}&amp;lang=en&amp;action=eyeCatcher">'
+        f'<div class="g-row">'
+        f'<div class="g-col-3"><div class="image-block">'
+        f'<img src="//i.ebayimg.com/00/s/NjAwWDgwMA==/z/{site_id:x}/$_2.JPG" alt="{escape(name)}"/>'
+        f'</div></div>'
+        f'<div class="g-col-9">'
+        f'<div class="headline-block u-margin-bottom-9">'
+        f'{new_label}'
+        f'<span class="h3 u-text-break-word">{escape(name)}</span>'
+        f'<span class="u-block">Ad online since {rng.choice(MONTHS)} {rng.randint(1, 28)}, 2021, '
+        f'{hour}:{rng.randint(0, 59):02d} {rng.choice(("AM", "PM"))}</span>'
+        f'</div>'
+        f'<div class="price-block u-margin-bottom-9">'
+        f'<span class="h3 u-block">€{price:,}</span>{vat_block}'
+        f'</div>'
+        f'<div class="vehicle-data--ad-with-price-rating-label">'
+        f'<div class="rbt-regMilPow">FR {registration}, {mileage:,}\xa0km, {power}\xa0kW ({round(power * 1.36)}\xa0hp)</div>'
+        f'<div>{rng.choice(BODIES)}, {rng.choice(FUELS)}, {rng.choice(TRANSMISSIONS)}, HU 06/2023</div>'
+        f'<div>{rng.randint(2, 7)} Doors, Euro6, Particulate Filter</div>'
+        f'</div>'
+        f'</div>'
+        f'</div>'
+        f'</a>'
+        f'</div>'
+    )
+
+
+def render_search_page(seed: int = 0, num_ads: int = 20, num_pages: int = 1, page_num: int = 1,
+                       first_id: int = None, min_price: int = 0, max_price: int = FAKE_MAX_PRICE) -> str:
+    """
+    Render a search results page with the markup ``Search._parse_page`` expects.
+
+    Ads are numbered from ``first_id`` on over all pages, by default from a block of
+    ``seed``, and priced within ``min_price`` and ``max_price``.
+    """
+    rng = random.Random(f'{seed}:{page_num}')
+    if first_id is None:
+        first_id = FIRST_SITE_ID + seed * num_ads * num_pages
+    first_id += (page_num - 1) * num_ads
+    items = ''.join(
+        render_ad_item(rng, first_id + index, min_price, max_price) for index in range(num_ads)
+    )
+    # Like the real site, only a window of page numbers and the last page are listed.
+    pagination = ''.join(
+        f'<li><span class="btn btn--orange btn--s">{num}</span></li>'
+        for num in sorted({*range(max(page_num - 2, 1), min(page_num + 3, num_pages + 1)), num_pages})
+    )
+    return (
+        '<!DOCTYPE html><html lang="en"><head><title>mobile.de</title></head><body>'
+        '<div class="viewport"><div class="g-row">'
+        f'<div class="cBox cBox--content cBox--resultList">{items}</div>'
+        f'<ul class="pagination">{pagination}</ul>'
+        '</div></div>'
+        '</body></html>'
+    )
+
+
+def render_ad_page(site_id: int) -> str:
+    """Render an ad details page with the markup ``Ad._parse_page`` expects."""
+    rng = random.Random(site_id)
+    make, models = rng.choice(MAKES)
+    name = f'{make} {rng.choice(models)}'
+    price = rng.randrange(1500, 60000, 10)
+    vat = '<span data-testid="vat">19% VAT</span>' if rng.random() < 0.6 else ''
+    return (
+        '<!DOCTYPE html><html lang="en"><head><title>mobile.de</title></head><body>'
+        '<div class="viewport"><div>'
+        '<div class="header"></div>'
+        '<div class="content">'
+        '<div class="g-row"><div class="breadcrumbs"></div></div>'
+        '<div class="g-row">'
+        f'<h1 id="ad-title">  {escape(name)}\n</h1>'
+        f'<div class="gallery"><img src="//i.ebayimg.com/00/s/NjAwWDgwMA==/z/{site_id:x}/$_27.JPG"/></div>'
+        f'<span data-testid="prime-price">€{price:,}</span>{vat}'
+        '</div>'
+        '</div>'
+        '</div></div>'
+        '</body></html>'
+    )
+
+
+def get_seed(params) -> int:
+    """Stable seed of a search, independent of the requested page."""
+    return zlib.crc32(repr(sorted((key, value) for key, value in params if key != 'pageNumber')).encode())
+
+
+def get_price_range(params) -> Tuple[int, int]:
+    """The prices a search is narrowed to by ``minPrice`` and ``maxPrice``, within 0..FAKE_MAX_PRICE."""
+    params = dict(params)
+    try:
+        min_price = max(int(params.get('minPrice') or 0), 0)
+        max_price = min(int(params.get('maxPrice') or FAKE_MAX_PRICE), FAKE_MAX_PRICE)
+    except ValueError:
+        min_price, max_price = 0, FAKE_MAX_PRICE
+    return min_price, max_price
+
+
+def get_num_of_pages(params, num_pages: int, max_pages: int = None) -> int:
+    """
+    Result pages of a search, the ``num_pages`` of a search over all prices scaled to its price range.
+
+    Like mobile.de, no more than ``max_pages`` pages are shown.
+    """
+    min_price, max_price = get_price_range(params)
+    share = max(max_price - min_price + 1, 0) / (FAKE_MAX_PRICE + 1)
+    num_pages = max(math.ceil(num_pages * share), 1)
+    return min(num_pages, max_pages) if max_pages else num_pages
+
+
+class FakeMobileDeServer(ThreadingHTTPServer):
+    """
+    Stand-in for suchen.mobile.de serving generated search result and ad pages.
+
+    Every parameter set gets its own stable results, ``num_pages`` of them for a search
+    over all prices and fewer for narrower price ranges, but at most ``max_pages``, priced
+    within their range. Every parameter set gets its own block of ad ids the first time it is
+    requested, so ads of different searches never share an id. Responses can be delayed by
+    ``latency`` seconds, fail with 500 at ``error_rate`` and with 429 at ``throttle_rate``.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, num_pages: int = 5, ads_per_page: int = 20,
+                 latency: float = 0.0, error_rate: float = 0.0, throttle_rate: float = 0.0, max_pages: int = None):
+        super().__init__(address, FakeMobileDeRequestHandler)
+        self.num_pages = num_pages
+        self.max_pages = max_pages
+        self.ads_per_page = ads_per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.stats = {'requests': 0, 'errors': 0, 'throttled': 0}
+        self._stats_lock = threading.Lock()
+        self._first_ids: Dict[int, int] = {}
+
+    def get_first_id(self, seed: int) -> int:
+        """The first ad id of the search of ``seed``, the next free block if it wasn't requested yet."""
+        with self._stats_lock:
+            if seed not in self._first_ids:
+                self._first_ids[seed] = FIRST_SITE_ID + len(self._first_ids) * self.num_pages * self.ads_per_page
+            return self._first_ids[seed]
+
+    def count(self, stat: str):
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+
+class FakeMobileDeRequestHandler(BaseHTTPRequestHandler):
+    server: FakeMobileDeServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: str = '', headers: dict = None):
+        content = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        server = self.server
+        server.count('requests')
+        if server.latency:
+            time.sleep(random.uniform(server.latency / 2, server.latency * 1.5))
+
+        roll = random.random()
+        if roll < server.throttle_rate:
+            server.count('throttled')
+            return self._send(HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '1'})
+        if roll < server.throttle_rate + server.error_rate:
+            server.count('errors')
+            return self._send(HTTPStatus.INTERNAL_SERVER_ERROR)
+
+        url = urlsplit(self.path)
+        params = parse_qsl(url.query, keep_blank_values=True)
+        if url.path == '/fahrzeuge/search.html':
+            try:
+                page_num = int(dict(params).get('pageNumber', 1))
+            except ValueError:
+                page_num = 1
+            num_pages = get_num_of_pages(params, server.num_pages, server.max_pages)
+            page_num = min(max(page_num, 1), num_pages)
+            seed = get_seed(params)
+            min_price, max_price = get_price_range(params)
+            return self._send(HTTPStatus.OK, render_search_page(
+                seed=seed,
+                num_ads=server.ads_per_page,
+                num_pages=num_pages,
+                page_num=page_num,
+                first_id=server.get_first_id(seed),
+                min_price=min_price,
+                max_price=max_price,
+            ))
+        if url.path == '/fahrzeuge/details.html':
+            try:
+                site_id = int(dict(params)['id'])
+            except (KeyError, ValueError):
+                return self._send(HTTPStatus.NOT_FOUND)
+            return self._send(HTTPStatus.OK, render_ad_page(site_id))
+        return self._send(HTTPStatus.NOT_FOUND)
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.db import write_lock
+from mobilede_parser.models import Ad
+from mobilede_parser.models.helpers.extractors import VehicleAttributes, extract_vehicle_attributes
+
+
+class Command(BaseCommand):
+    help = 'Extract the vehicle attributes of stored ads from their descriptions, in chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--all', action='store_true', help='Also ads that have attributes already.')
+
+    def handle(self, *args, **options):
+        fields = VehicleAttributes._fields
+        ads = Ad.objects.exclude(description='').order_by('site_id').only('site_id', 'description', *fields)
+        if not options['all']:
+            ads = ads.filter(mileage__isnull=True, first_registration__isnull=True, power_kw__isnull=True,
+                             fuel='', transmission='')
+
+        chunk_size = options['chunk_size']
+        updated = 0
+        last_site_id = None
+        while True:
+            chunk = ads if last_site_id is None else ads.filter(site_id__gt=last_site_id)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            last_site_id = chunk[-1].site_id
+
+            changed = []
+            for ad in chunk:
+                attributes = extract_vehicle_attributes(ad.description)
+                if attributes != tuple(getattr(ad, field) for field in fields):
+                    for field, value in attributes._asdict().items():
+                        setattr(ad, field, value)
+                    changed.append(ad)
+            with write_lock(), transaction.atomic():
+                Ad.objects.bulk_update(changed, fields)
+            # The attributes are part of cached ad listings.
+            Ad.bump_search_versions(ad.site_id for ad in changed)
+            updated += len(changed)
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Up to ad {last_site_id}: {updated} updated.')
+
+        self.stdout.write(f'{updated} ads updated.')
@@ -0,0 +1,124 @@
+import multiprocessing
+import statistics
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection, connections
+from django.utils import timezone
+
+from mobilede_parser.models import Ad, Search
+from mobilede_parser.models.helpers.extractors import ParsedAd
+
+# Benchmark ads get ids far above those of mobile.de, still within the 32-bit Ad.site_id column.
+FIRST_SITE_ID = 2 * 10 ** 9
+
+
+def get_site_ids(writer: int, ads: int, overlap: float):
+    first = FIRST_SITE_ID + int(writer * ads * (1 - overlap))
+    return range(first, first + ads)
+
+
+def run_writer(args):
+    writer, search_id, ads, batch_size, overlap, write_lock = args
+    if not write_lock:
+        settings.DATABASE_WRITE_LOCK_FILE = ''
+    # Only the write path of the crawled search is measured, benchmark ads must not reach other searches.
+    settings.PARSER_PERCOLATE_ADS = False
+    settings.PARSER_THUMBNAIL_DIR = None
+
+    search = Search.objects.get(pk=search_id)
+    now = timezone.now()
+    parsed_ads = [
+        ParsedAd(site_id, f'Benchmark {site_id}', now, 1000 + site_id % 50000, 19, '', '')
+        for site_id in get_site_ids(writer, ads, overlap)
+    ]
+    latencies, errors = [], Counter()
+    for start in range(0, len(parsed_ads), batch_size):
+        started_at = time.perf_counter()
+        try:
+            search._save_ads(parsed_ads[start:start + batch_size])
+        except DatabaseError as e:
+            errors[f'{type(e).__name__}: {e}'.split('\n')[0][:80]] += 1
+        latencies.append(time.perf_counter() - started_at)
+    connections.close_all()
+    return latencies, errors
+
+
+class Command(BaseCommand):
+    help = (
+        'Save synthetic ads from several processes at once, like concurrent crawls, and report the throughput '
+        'and failures of the configured database. Benchmark ads and searches are deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8, help='Processes saving ads at the same time.')
+        parser.add_argument('--ads', type=int, default=2000, help='Ads saved by every writer.')
+        parser.add_argument('--batch-size', type=int, default=100, help='Ads per save, like a result page.')
+        parser.add_argument(
+            '--overlap', type=float, default=0.5, help='Share of its ads a writer shares with the next one.',
+        )
+        parser.add_argument('--no-write-lock', action='store_true', help='Leave writes unserialised.')
+        parser.add_argument('--untuned', action='store_true', help='SQLite: rollback journal and default pragmas.')
+
+    def handle(self, *args, **options):
+        if options['untuned'] and connection.vendor == 'sqlite':
+            settings.SQLITE_TUNED = False
+            connection.close()
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA journal_mode=DELETE')
+        write_lock = bool(settings.DATABASE_WRITE_LOCK_FILE) and not options['no_write_lock']
+
+        writers = options['writers']
+        searches = [
+            Search.objects.create(name=f'Write benchmark {writer}', parameters={'maxPrice': '1'})
+            for writer in range(writers)
+        ]
+        site_ids = set()
+        for writer in range(writers):
+            site_ids.update(get_site_ids(writer, options['ads'], options['overlap']))
+        if options['verbosity'] > 1:
+            journal_mode = '-'
+            if connection.vendor == 'sqlite':
+                with connection.cursor() as cursor:
+                    cursor.execute('PRAGMA journal_mode')
+                    journal_mode = cursor.fetchone()[0]
+            self.stdout.write(
+                f'{connection.vendor}, journal mode {journal_mode}, write lock {"on" if write_lock else "off"}, '
+                f'CONN_MAX_AGE {settings.DATABASES["default"]["CONN_MAX_AGE"]}'
+            )
+
+        # Children must open their own connections.
+        connections.close_all()
+        started_at = time.perf_counter()
+        try:
+            with multiprocessing.get_context('fork').Pool(writers) as pool:
+                results = pool.map(run_writer, [
+                    (writer, search.pk, options['ads'], options['batch_size'], options['overlap'], write_lock)
+                    for writer, search in enumerate(searches)
+                ])
+            elapsed = time.perf_counter() - started_at
+
+            latencies = sorted(latency for writer_latencies, _ in results for latency in writer_latencies)
+            errors = sum((writer_errors for _, writer_errors in results), Counter())
+            stored = Ad.objects.filter(site_id__in=site_ids).count()
+            linked = Search.ad_set.through.objects.filter(search__in=searches).count()
+        finally:
+            Ad.objects.filter(site_id__gte=FIRST_SITE_ID).delete()
+            for search in searches:
+                search.delete()
+
+        saves = len(latencies)
+        self.stdout.write(
+            f'{writers} writers, {saves} saves of {options["batch_size"]} ads in {elapsed:.1f}s: '
+            f'{saves / elapsed:.1f} saves/s, {writers * options["ads"] / elapsed:.0f} ads/s, '
+            f'latency p50 {statistics.median(latencies) * 1000:.0f}ms, '
+            f'p95 {latencies[int(len(latencies) * 0.95)] * 1000:.0f}ms, max {latencies[-1] * 1000:.0f}ms'
+        )
+        self.stdout.write(
+            f'{stored} of {len(site_ids)} ads stored, {linked} of {writers * options["ads"]} links, '
+            f'{sum(errors.values())} failed saves'
+        )
+        for error, count in errors.most_common():
+            self.stdout.write(f'  {count} x {error}')
@@ -0,0 +1,133 @@
+import re
+import time
+import unicodedata
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from furl import furl
+
+from mobilede_parser.fakesite import render_search_page
+from mobilede_parser.models.helpers.archive import KIND_SEARCH, PageArchive
+from mobilede_parser.models.helpers.extractors import RESULT_ITEM_CLASS_RE, SearchResultExtractor
+from mobilede_parser.models.helpers.parse_pool import create_parse_pool, parse_search_page
+
+
+def legacy_extract(ad):
+    """Per-ad extraction as ``Search._parse_page`` did it before the extractors module."""
+    url = ad.find('a').get('href')
+    site_id = int(furl(url).args.getlist('id')[0])
+    headline_block = ad.find('div', 'headline-block')
+
+    headline_block = headline_block.find_all('span')
+    headline_block = list(
+        filter(
+            lambda span: {'new-headline-label'} - set(span.get('class')),
+            headline_block,
+        )
+    )
+
+    try:
+        name, date = headline_block
+        name = name.text.strip()
+        date = date.text.strip()
+
+        date = timezone.datetime.strptime(date, 'Ad online since %b %d, %Y, %I:%M %p')
+        current_timezone = timezone.get_current_timezone()
+        date = current_timezone.localize(date)
+    except ValueError:
+        date = None
+        name = headline_block[0].text.strip()
+
+    price_block = ad.find('div', 'price-block')
+    try:
+        price, vat = price_block.find_all('span')[:2]
+        price = int(re.sub(r'\D', '', price.text).strip())
+        vat = round(float(re.sub(r'[^\d,.]', '', vat.text).replace(',', '.')))
+    except ValueError:
+        vat = None
+        price = int(re.sub(r'\D', '', price_block.find('span').text).strip())
+
+    description = re.sub(
+        r'(?:\s+)?(?:</?.*?>)+(?:\s+)?',
+        ' ',
+        str(ad.find('div', re.compile(r'^vehicle-data')))
+    ).strip()
+    description = unicodedata.normalize('NFKD', description)
+
+    image_block = ad.find('div', 'image-block')
+    try:
+        img_el = image_block.find('img')
+        image_url = img_el.get('src') or img_el.get('data-src')
+        if image_url.startswith('//'):
+            image_url = 'https:' + image_url
+        image_url = re.sub(r'\$_\d+', '$_10', image_url)
+    except AttributeError:
+        image_url = ''
+
+    return {
+        'url': url,
+        'site_id': site_id,
+        'name': name,
+        'date': date,
+        'price': price,
+        'vat': vat,
+        'description': description,
+        'image_url': image_url,
+    }
+
+
+class Command(BaseCommand):
+    help = 'Measure the per-ad cost of search result field extraction, before and after the extractors module.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('pages', nargs='*', type=Path, help='Saved search result pages. Generated if omitted.')
+        parser.add_argument('--archive', help='Use the search pages of this page archive.')
+        parser.add_argument('--generated-pages', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument(
+            '--parse-workers', type=int, nargs='*', default=[],
+            help='Also measure whole-page throughput of parse pools of these sizes.',
+        )
+
+    def handle(self, *args, **options):
+        if options['pages']:
+            pages = [path.read_bytes() for path in options['pages']]
+        elif options['archive']:
+            archive = PageArchive(options['archive'])
+            pages = [archive.read(entry) for entry in archive.filter(kind=KIND_SEARCH)]
+            archive.close()
+        else:
+            pages = [render_search_page(seed=seed) for seed in range(options['generated_pages'])]
+
+        items = []
+        for page in pages:
+            content = BeautifulSoup(page, 'lxml').find('div', 'cBox--resultList')
+            if content is not None:
+                items.extend(content.find_all('div', RESULT_ITEM_CLASS_RE))
+        if not items:
+            self.stderr.write('No ads found on the given pages.')
+            return
+
+        extractor = SearchResultExtractor()
+        for name, extract in (('legacy', legacy_extract), ('extractors', extractor.extract)):
+            best = min(self._time(extract, items) for _ in range(options['repeat']))
+            self.stdout.write(f'{name:>10}: {best / len(items) * 1e6:8.1f} us/ad ({len(items)} ads)')
+
+        for workers in options['parse_workers']:
+            with create_parse_pool(workers) as parse_pool:
+                # Warm the workers up before timing.
+                list(parse_pool.map(parse_search_page, pages[:workers]))
+                started_at = time.perf_counter()
+                for _ in range(options['repeat']):
+                    list(parse_pool.map(parse_search_page, pages))
+                elapsed = time.perf_counter() - started_at
+            self.stdout.write(f'{workers:>2} workers: {len(pages) * options["repeat"] / elapsed:8.1f} pages/s')
+
+    @staticmethod
+    def _time(extract, items) -> float:
+        started_at = time.perf_counter()
+        for item in items:
+            extract(item)
+        return time.perf_counter() - started_at
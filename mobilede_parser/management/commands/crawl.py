@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from mobilede_parser.models import Ad, Search
+from mobilede_parser.models.helpers.parse_pool import create_parse_pool
+from mobilede_parser.models.helpers.transport import get_coalescing_stats, get_transport_stats
+
+
+class Command(BaseCommand):
+    help = 'Crawl searches and save their ads.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('search_ids', nargs='*', type=int, help='Searches to crawl. All searches if omitted.')
+        parser.add_argument('--parse-workers', type=int, default=settings.PARSER_PARSE_WORKERS)
+        parser.add_argument('--fetch-workers', type=int, default=settings.PARSER_FETCH_WORKERS)
+
+    def handle(self, *args, **options):
+        searches = Search.objects.all()
+        if options['search_ids']:
+            searches = searches.filter(id__in=options['search_ids'])
+
+        parse_pool = create_parse_pool(options['parse_workers']) if options['parse_workers'] > 0 else None
+        try:
+            for search in searches.iterator():
+                self.stdout.write(f'Crawling "{search}"...')
+                truncated = search.parse_ads(parse_pool=parse_pool, fetch_workers=options['fetch_workers'])
+                if truncated:
+                    price_ranges = ', '.join(f'{low}-{"" if high is None else high}' for low, high in truncated)
+                    self.stdout.write(f'Price ranges past the page cap, crawled truncated: {price_ranges}')
+                # Thumbnails are fetched while the next searches are crawled.
+                Ad.save_thumbnails(wait=False)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+            thumbnails = Ad.save_thumbnails()
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Thumbnails stored: {thumbnails}')
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Connection pools: {get_transport_stats()}')
+                self.stdout.write(f'Coalesced fetches: {get_coalescing_stats()}')
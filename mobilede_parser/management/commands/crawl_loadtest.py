@@ -0,0 +1,97 @@
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from mobilede_parser.models import Ad, Search
+from mobilede_parser.models.helpers.headers import header_profiles
+from mobilede_parser.models.helpers.parse_pool import create_parse_pool
+from mobilede_parser.models.helpers.transport import get_transport_stats
+
+
+def count_requests() -> int:
+    return sum(stats['requests'] for pools in get_transport_stats().values() for stats in pools.values())
+
+
+class Command(BaseCommand):
+    help = (
+        'Crawl many simulated searches against PARSER_BASE_URL like the crawl command does, and report the '
+        'throughput. Simulated searches and their ads are deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--searches', type=int, default=100)
+        parser.add_argument('--concurrency', type=int, default=8, help='Searches crawled at the same time.')
+        parser.add_argument('--parse-workers', type=int, default=settings.PARSER_PARSE_WORKERS)
+        parser.add_argument('--fetch-workers', type=int, default=settings.PARSER_FETCH_WORKERS)
+
+    def handle(self, *args, **options):
+        if not settings.PARSER_BASE_URL:
+            raise CommandError('Set PARSER_BASE_URL, load tests must not hit the real site.')
+        # Simulated ads must not reach real searches nor be taken for relists of real ads.
+        settings.PARSER_PERCOLATE_ADS = False
+        settings.PARSER_DETECT_DUPLICATES = False
+        settings.PARSER_THUMBNAIL_DIR = None
+
+        searches = [
+            Search.objects.create(name=f'Simulated search {index}', parameters={
+                'makeModelVariant1.makeId': str(random.randint(1000, 30000)),
+                'maxPrice': str(random.randrange(5000, 60000, 500)),
+            })
+            for index in range(options['searches'])
+        ]
+        outcomes = Counter()
+        outcomes_lock = threading.Lock()
+        parse_pool = create_parse_pool(options['parse_workers']) if options['parse_workers'] > 0 else None
+
+        def crawl(search):
+            try:
+                search.parse_ads(parse_pool=parse_pool, fetch_workers=options['fetch_workers'])
+                outcome = 'searches'
+            except requests.HTTPError as e:
+                outcome = f'http_{e.response.status_code}'
+            except requests.RequestException:
+                outcome = 'connection_errors'
+            finally:
+                # Every crawling thread has a connection of its own.
+                connection.close()
+            with outcomes_lock:
+                outcomes[outcome] += 1
+
+        requests_before = count_requests()
+        started_at = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(options['concurrency']) as executor:
+                list(executor.map(crawl, searches))
+            elapsed = time.perf_counter() - started_at
+            pages = count_requests() - requests_before
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+            site_ids = list(
+                Search.ad_set.through.objects.filter(search__in=searches).values_list('ad_id', flat=True).distinct()
+            )
+            for search in searches:
+                search.delete()
+            Ad.delete_orphans(site_ids)
+
+        self.stdout.write(
+            f'{outcomes["searches"]} searches crawled in {elapsed:.1f}s: '
+            f'{pages / elapsed:.1f} pages/s, {len(site_ids) / elapsed:.1f} ads/s'
+        )
+        failures = {key: value for key, value in outcomes.items() if key != 'searches'}
+        if failures:
+            self.stdout.write(f'Failed searches: {failures}')
+        for transport, pools in get_transport_stats().items():
+            for pool, stats in pools.items():
+                self.stdout.write(
+                    f'{transport} {pool}: {stats["requests"]} requests over {stats["connections"]} connections'
+                )
+        profiles = header_profiles.stats()
+        self.stdout.write(f'{len(profiles)} header profiles used, {sum(p["failures"] > 0 for p in profiles)} throttled')
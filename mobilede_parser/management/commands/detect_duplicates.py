@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.db import write_lock
+from mobilede_parser.models import Ad, AdSignatureBucket
+
+
+class Command(BaseCommand):
+    help = 'Compute the MinHash signatures of stored ads that have none and link relisted cars to their first ad.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        ads = (
+            Ad.objects
+            .filter(minhash__isnull=True)
+            .order_by('site_id')
+            .only('site_id', 'name', 'description', 'price', 'image_url')
+        )
+
+        chunk_size = options['chunk_size']
+        signed = duplicates = 0
+        last_site_id = None
+        while True:
+            chunk = ads if last_site_id is None else ads.filter(site_id__gt=last_site_id)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            last_site_id = chunk[-1].site_id
+
+            buckets = Ad.detect_duplicates(chunk)
+            with write_lock(), transaction.atomic():
+                Ad.objects.bulk_update(chunk, ('minhash', 'canonical_ad'))
+                AdSignatureBucket.objects.bulk_create(buckets)
+            chunk_duplicates = [ad.site_id for ad in chunk if ad.canonical_ad_id is not None]
+            # Duplicates are left out of cached ad listings.
+            Ad.bump_search_versions(chunk_duplicates)
+            signed += len(chunk)
+            duplicates += len(chunk_duplicates)
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Up to ad {last_site_id}: {signed} signed, {duplicates} duplicates.')
+
+        self.stdout.write(f'{signed} ads signed, {duplicates} duplicates.')
@@ -0,0 +1,32 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mobilede_parser.models import Search
+from mobilede_parser.models.helpers.exporters import EXPORT_FIELDS, EXPORTERS
+
+
+class Command(BaseCommand):
+    help = "Stream a search's ads to a file as CSV, JSON Lines or Parquet."
+
+    def add_arguments(self, parser):
+        parser.add_argument('search_id', type=int)
+        parser.add_argument('--format', choices=EXPORTERS.keys(), default='csv', dest='export_format')
+        parser.add_argument('--output', help='Output file, stdout if omitted.')
+
+    def handle(self, *args, **options):
+        try:
+            search = Search.objects.get(pk=options['search_id'])
+        except Search.DoesNotExist:
+            raise CommandError(f'Search {options["search_id"]} does not exist.')
+
+        exporter, _ = EXPORTERS[options['export_format']]
+        chunks = exporter(search.iter_ads(EXPORT_FIELDS))
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        else:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
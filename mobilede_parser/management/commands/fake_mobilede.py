@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from mobilede_parser.fakesite import FakeMobileDeServer
+
+
+class Command(BaseCommand):
+    help = 'Serve generated mobile.de pages for load and integration tests (point PARSER_BASE_URL at it).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8001)
+        parser.add_argument('--pages', type=int, default=5, help='Result pages of a search over all prices.')
+        parser.add_argument('--max-pages', type=int, help='Most result pages shown, like the pagination cap of mobile.de.')
+        parser.add_argument('--ads-per-page', type=int, default=20)
+        parser.add_argument('--latency', type=float, default=0.0, help='Mean response delay in seconds.')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Share of 500 responses.')
+        parser.add_argument('--throttle-rate', type=float, default=0.0, help='Share of 429 responses.')
+
+    def handle(self, *args, **options):
+        server = FakeMobileDeServer(
+            (options['host'], options['port']),
+            num_pages=options['pages'],
+            ads_per_page=options['ads_per_page'],
+            latency=options['latency'],
+            error_rate=options['error_rate'],
+            throttle_rate=options['throttle_rate'],
+            max_pages=options['max_pages'],
+        )
+        self.stdout.write(f'Serving fake mobile.de on http://{options["host"]}:{options["port"]}/')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f'Served: {server.stats}')
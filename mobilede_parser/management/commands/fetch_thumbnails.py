@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from mobilede_parser.models import Ad
+
+
+class Command(BaseCommand):
+    help = 'Fetch the images of stored ads without a thumbnail into PARSER_THUMBNAIL_DIR, in chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if not settings.PARSER_THUMBNAIL_DIR:
+            raise CommandError('Set PARSER_THUMBNAIL_DIR to store thumbnails.')
+
+        ads = Ad.objects.filter(thumbnail='').exclude(image_url='').order_by('site_id').only('site_id', 'image_url')
+
+        chunk_size = options['chunk_size']
+        queued = stored = 0
+        last_site_id = None
+        while True:
+            chunk = ads if last_site_id is None else ads.filter(site_id__gt=last_site_id)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            last_site_id = chunk[-1].site_id
+
+            Ad.queue_thumbnails(chunk)
+            queued += len(chunk)
+            stored += Ad.save_thumbnails()
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Up to ad {last_site_id}: {stored} of {queued} stored.')
+
+        self.stdout.write(f'{stored} of {queued} thumbnails stored.')
@@ -0,0 +1,36 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from mobilede_parser.models import Search
+
+
+class Command(BaseCommand):
+    help = 'Create searches from a file of mobile.de search URLs, one per line and optionally preceded by a name.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='File to read the URLs from, "-" for stdin.')
+        parser.add_argument('--subscriber', help='Username to subscribe to the imported searches.')
+
+    def handle(self, *args, **options):
+        subscriber = None
+        if options['subscriber']:
+            try:
+                subscriber = get_user_model().objects.get_by_natural_key(options['subscriber'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f'User "{options["subscriber"]}" does not exist.')
+
+        if options['file'] == '-':
+            result = Search.import_searches(sys.stdin, subscriber=subscriber)
+        else:
+            with open(options['file'], encoding='utf-8') as file:
+                result = Search.import_searches(file, subscriber=subscriber)
+
+        for line_num, search_id in result.duplicates:
+            self.stdout.write(f'Line {line_num}: duplicate of search {search_id}')
+        for line_num, error in result.errors:
+            self.stderr.write(f'Line {line_num}: {error}')
+        self.stdout.write(
+            f'{len(result.created)} searches created, {len(result.duplicates)} duplicates, {len(result.errors)} errors.'
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from mobilede_parser.models import Ad, Search
+from mobilede_parser.models.helpers.percolator import MATCHED_ATTRIBUTES
+
+
+class Command(BaseCommand):
+    help = 'Link the stored ads to every search whose parameters they match, e.g. after adding searches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        percolator = Search.get_percolator()
+        self.stdout.write(
+            f'Matching against {len(percolator.search_ids)} searches, '
+            f'{len(percolator.unsupported_search_ids)} have parameters ads can\'t be matched on.'
+        )
+
+        chunk_size = options['chunk_size']
+        ads = Ad.objects.order_by('site_id').only('site_id', *MATCHED_ATTRIBUTES)
+        linked = 0
+        last_site_id = None
+        while True:
+            chunk = ads if last_site_id is None else ads.filter(site_id__gt=last_site_id)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            linked += Search.link_matching_ads(chunk)
+            last_site_id = chunk[-1].site_id
+        self.stdout.write(f'{linked} links created.')
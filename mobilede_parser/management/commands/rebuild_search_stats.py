@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from mobilede_parser.models import SearchStats
+
+
+class Command(BaseCommand):
+    help = 'Compute the ad statistics of searches from scratch, e.g. after ads were linked by hand.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('search_ids', nargs='*', type=int, help='Searches to rebuild. All searches if omitted.')
+
+    def handle(self, *args, **options):
+        rebuilt = SearchStats.rebuild(options['search_ids'] or None)
+        self.stdout.write(f'Stats of {rebuilt} searches rebuilt.')
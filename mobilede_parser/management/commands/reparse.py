@@ -0,0 +1,144 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from mobilede_parser.models import Ad, Search
+from mobilede_parser.models.Ad import DETAIL_PAGE_FIELDS, SEARCH_PAGE_FIELDS
+from mobilede_parser.models.helpers.archive import KIND_AD, KIND_SEARCH, PageArchive
+from mobilede_parser.models.helpers.parse_pool import create_parse_pool, parse_ad_page, parse_search_page
+
+
+def parse_timestamp(value: str) -> float:
+    date = parse_datetime(value)
+    if date is None:
+        raise CommandError(f'"{value}" is not a valid datetime.')
+    return date.timestamp()
+
+
+class Command(BaseCommand):
+    help = (
+        'Update stored ads from archived pages, without fetching anything. Ads missing from the database '
+        'are stored again from search pages and linked to the search of the page, existing links aren\'t '
+        'marked as seen.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--archive', default=settings.PARSER_PAGE_ARCHIVE_DIR)
+        parser.add_argument('--kind', choices=(KIND_SEARCH, KIND_AD), action='append')
+        parser.add_argument(
+            '--search', type=int, action='append', dest='search_ids', help='Only pages of these searches.',
+        )
+        parser.add_argument('--since', type=parse_timestamp)
+        parser.add_argument('--until', type=parse_timestamp)
+        parser.add_argument('--parse-workers', type=int, default=settings.PARSER_PARSE_WORKERS)
+        parser.add_argument(
+            '--skip-missing', action='store_true', help='Don\'t store ads missing from the database, only count them.',
+        )
+
+    def handle(self, *args, **options):
+        if not options['archive']:
+            raise CommandError('No archive given and PARSER_PAGE_ARCHIVE_DIR is not set.')
+        archive = PageArchive(options['archive'])
+        kinds = options['kind'] or (KIND_SEARCH, KIND_AD)
+
+        parse_workers = options['parse_workers']
+        parse_pool = create_parse_pool(parse_workers) if parse_workers > 0 else None
+        self.batch_size = max(parse_workers, 1) * 4
+        self.skip_missing = options['skip_missing']
+        try:
+            if KIND_SEARCH in kinds:
+                entries = list(archive.filter(
+                    kind=KIND_SEARCH,
+                    owner_ids=options['search_ids'] and set(options['search_ids']),
+                    since=options['since'],
+                    until=options['until'],
+                ))
+                self._reparse_search_pages(archive, entries, parse_pool)
+            if KIND_AD in kinds and not options['search_ids']:
+                entries = list(archive.filter(kind=KIND_AD, since=options['since'], until=options['until']))
+                self._reparse_ad_pages(archive, entries, parse_pool)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+            archive.close()
+
+    def _parse_batches(self, archive, entries, parse, parse_pool):
+        """Yield batches of ``(entry, parsed page)``, pages failing to parse are reported and left out."""
+        for start in range(0, len(entries), self.batch_size):
+            batch = entries[start:start + self.batch_size]
+            if parse_pool is not None:
+                results = [parse_pool.submit(parse, archive.read(entry)) for entry in batch]
+                results = [future.exception() or future.result() for future in results]
+            else:
+                results = []
+                for entry in batch:
+                    try:
+                        results.append(parse(archive.read(entry)))
+                    except Exception as e:
+                        results.append(e)
+
+            parsed = []
+            for entry, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self.failed += 1
+                    self.stderr.write(f'Failed to parse {entry.url}: {result!r}')
+                else:
+                    parsed.append((entry, result))
+            yield parsed
+
+    def _reparse_search_pages(self, archive, entries, parse_pool):
+        self.failed = updated = restored = 0
+        # Ads stored again by this run are linked to the searches of their later pages too.
+        restored_ads_ids, skipped_ads_ids = set(), set()
+        # Batches come in the order pages were fetched, so the latest page of an ad wins.
+        for batch in self._parse_batches(archive, entries, parse_search_page, parse_pool):
+            ads_by_search = defaultdict(list)
+            for entry, parsed_ads in batch:
+                seen_at = datetime.fromtimestamp(entry.fetched_at, timezone.utc)
+                ads_by_search[entry.owner_id].extend(
+                    (parsed_ad, seen_at) for parsed_ad in parsed_ads if parsed_ad.site_id is not None
+                )
+            ads_ids = {parsed_ad.site_id for ads in ads_by_search.values() for parsed_ad, _ in ads}
+            missing_ads_ids = (ads_ids - self._get_stored_ids(ads_ids)) | (ads_ids & restored_ads_ids)
+            searches = Search.objects.in_bulk(ads_by_search) if missing_ads_ids and not self.skip_missing else {}
+            for search_id, ads in ads_by_search.items():
+                missing_ads = [ad for ad in ads if ad[0].site_id in missing_ads_ids]
+                if not missing_ads:
+                    continue
+                if search_id in searches:
+                    restored += searches[search_id].restore_ads(missing_ads)
+                    restored_ads_ids.update(parsed_ad.site_id for parsed_ad, _ in missing_ads)
+                else:
+                    skipped_ads_ids.update(parsed_ad.site_id for parsed_ad, _ in missing_ads)
+
+            updated += Ad.update_from_parsed(
+                (parsed_ad for _, parsed_ads in batch for parsed_ad in parsed_ads), SEARCH_PAGE_FIELDS,
+            )
+
+        self.stdout.write(
+            f'Search pages: {len(entries)} reparsed, {self.failed} failed, {updated} ads updated, '
+            f'{restored} missing ads stored, {len(skipped_ads_ids - restored_ads_ids)} skipped.'
+        )
+
+    def _reparse_ad_pages(self, archive, entries, parse_pool):
+        entries = [entry for entry in entries if entry.owner_id is not None]
+        self.failed = updated = 0
+        skipped_ads_ids = set()
+        for batch in self._parse_batches(archive, entries, parse_ad_page, parse_pool):
+            parsed_ads = [data._replace(site_id=entry.owner_id) for entry, data in batch if data is not None]
+            updated += Ad.update_from_parsed(parsed_ads, DETAIL_PAGE_FIELDS)
+            # Details pages lack the fields of search results, missing ads are stored from search pages only.
+            ads_ids = {parsed_ad.site_id for parsed_ad in parsed_ads}
+            skipped_ads_ids |= ads_ids - self._get_stored_ids(ads_ids)
+
+        self.stdout.write(
+            f'Ad pages: {len(entries)} reparsed, {self.failed} failed, {updated} ads updated, '
+            f'{len(skipped_ads_ids)} missing ads skipped.'
+        )
+
+    @staticmethod
+    def _get_stored_ids(ads_ids) -> set:
+        return set(Ad.objects.filter(site_id__in=ads_ids).values_list('site_id', flat=True))
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.db import write_lock
+from mobilede_parser.models import Ad
+from mobilede_parser.models.helpers.deal_scores import NUMPY_IS_AVAILABLE, get_comparable_group, score_deals
+
+
+class Command(BaseCommand):
+    help = (
+        'Score the price of every ad against comparable ads (same make and model, registration year '
+        'and mileage bucket), positive scores being cheaper than usual.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000, help='Ads per bulk_update.')
+
+    def handle(self, *args, **options):
+        started_at = time.perf_counter()
+        rows = list(
+            Ad.objects.order_by().values_list(
+                'site_id', 'name', 'first_registration', 'mileage', 'price', 'deal_score', 'price_percentile',
+            ).iterator()
+        )
+        loaded_at = time.perf_counter()
+
+        scores, percentiles = score_deals(
+            [get_comparable_group(name, first_registration, mileage) for _, name, first_registration, mileage, *_ in rows],
+            [row[4] for row in rows],
+        )
+        scored_at = time.perf_counter()
+
+        changed = [
+            Ad(site_id=row[0], deal_score=score, price_percentile=percentile)
+            for row, score, percentile in zip(rows, scores, percentiles)
+            if (score, percentile) != (row[5], row[6])
+        ]
+        batch_size = options['batch_size']
+        for start in range(0, len(changed), batch_size):
+            with write_lock(), transaction.atomic():
+                Ad.objects.bulk_update(changed[start:start + batch_size], ('deal_score', 'price_percentile'))
+        # Deal scores are part of cached ad listings.
+        Ad.bump_search_versions(ad.site_id for ad in changed)
+        finished_at = time.perf_counter()
+
+        self.stdout.write(
+            f'{len(rows)} ads, {sum(score is not None for score in scores)} scored, {len(changed)} updated. '
+            f'Loading {loaded_at - started_at:.1f}s, scoring {scored_at - loaded_at:.1f}s '
+            f'({"NumPy" if NUMPY_IS_AVAILABLE else "Python"}), updating {finished_at - scored_at:.1f}s.'
+        )
@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Send concurrent GET requests to a running web server and report requests/s and latency percentiles. '
+        'Run it once against WEB_SERVER_MODE=wsgi and once against WEB_SERVER_MODE=asgi to compare them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', nargs='+', help='URLs requested in turn.')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=32)
+        parser.add_argument('--session-id', help='"sessionid" cookie of a logged in user, for the API views.')
+
+    def handle(self, *args, **options):
+        urls = options['url']
+        local = threading.local()
+        statuses = Counter()
+        latencies = []
+
+        def send(index):
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = requests.Session()
+                if options['session_id']:
+                    session.cookies.set('sessionid', options['session_id'])
+            started_at = time.perf_counter()
+            try:
+                response = session.get(urls[index % len(urls)])
+                response.content
+                status = response.status_code
+            except requests.RequestException:
+                status = 'error'
+            latencies.append(time.perf_counter() - started_at)
+            statuses[status] += 1
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(options['concurrency']) as executor:
+            list(executor.map(send, range(options['requests'])))
+        elapsed = time.perf_counter() - started_at
+
+        latencies.sort()
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000
+
+        self.stdout.write(
+            f'{len(latencies)} requests in {elapsed:.1f}s: {len(latencies) / elapsed:.1f} requests/s, '
+            f'p50 {percentile(50):.1f} ms, p99 {percentile(99):.1f} ms'
+        )
+        self.stdout.write(f'Statuses: {dict(statuses)}')
@@ -0,0 +1,58 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:16
+
+from django.db import migrations, models
+from django.db.models import F, Value
+
+NAME_TRIGRAM_INDEX = 'mobilede_parser_ad_name_trgm'
+
+
+def fill_price_net(apps, schema_editor):
+    Ad = apps.get_model('mobilede_parser', 'Ad')
+    Ad.objects.using(schema_editor.connection.alias).filter(price__isnull=False, vat__isnull=False).update(
+        price_net=(F('price') * (Value(100) - F('vat')) + Value(99)) / Value(100),
+    )
+
+
+def create_name_trigram_index(apps, schema_editor):
+    # Admin search filters with UPPER("name") LIKE UPPER('%...%'), which a trigram
+    # index on the same expression can serve. Only PostgreSQL has pg_trgm.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {NAME_TRIGRAM_INDEX} '
+        'ON mobilede_parser_ad USING gin (UPPER(name::text) gin_trgm_ops)'
+    )
+
+
+def drop_name_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {NAME_TRIGRAM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0003_auto_20210913_0926'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='price_net',
+            field=models.PositiveIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='ad',
+            name='date',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='ad',
+            name='price',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(fill_price_net, migrations.RunPython.noop),
+        migrations.RunPython(create_name_trigram_index, drop_name_trigram_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0004_ad_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='search',
+            name='data_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
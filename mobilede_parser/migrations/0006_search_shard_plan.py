@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0005_search_data_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='search',
+            name='shard_plan',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
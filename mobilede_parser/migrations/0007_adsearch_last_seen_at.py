@@ -0,0 +1,42 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0006_search_shard_plan'),
+    ]
+
+    operations = [
+        # The implicit ad-search table becomes the AdSearch model as is, only its state changes.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='AdSearch',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('ad', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='mobilede_parser.ad')),
+                        ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='mobilede_parser.search')),
+                    ],
+                    options={
+                        'db_table': 'mobilede_parser_ad_searches',
+                        'unique_together': {('ad', 'search')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='ad',
+                    name='searches',
+                    field=models.ManyToManyField(through='mobilede_parser.AdSearch', to='mobilede_parser.Search'),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='adsearch',
+            name='last_seen_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='last seen'),
+        ),
+    ]
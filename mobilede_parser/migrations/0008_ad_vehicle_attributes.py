@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0007_adsearch_last_seen_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='first_registration',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ad',
+            name='fuel',
+            field=models.CharField(blank=True, db_index=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='ad',
+            name='mileage',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ad',
+            name='power_kw',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, null=True, verbose_name='power (kW)'),
+        ),
+        migrations.AddField(
+            model_name='ad',
+            name='transmission',
+            field=models.CharField(blank=True, db_index=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+import mobilede_parser.models.helpers.search_stats
+from mobilede_parser.models.helpers.search_stats import empty_price_histogram, get_price_bucket
+
+
+def compute_search_stats(apps, schema_editor):
+    Search = apps.get_model('mobilede_parser', 'Search')
+    SearchStats = apps.get_model('mobilede_parser', 'SearchStats')
+    AdSearch = apps.get_model('mobilede_parser', 'AdSearch')
+
+    stats = {
+        search_id: SearchStats(search_id=search_id, price_histogram=empty_price_histogram())
+        for search_id in Search.objects.values_list('pk', flat=True)
+    }
+    for search_id, price in AdSearch.objects.values_list('search_id', 'ad__price').iterator():
+        search_stats = stats[search_id]
+        search_stats.ad_count += 1
+        if price is not None:
+            search_stats.priced_ad_count += 1
+            search_stats.price_sum += price
+            search_stats.price_histogram[get_price_bucket(price)] += 1
+    SearchStats.objects.bulk_create(stats.values(), 1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0008_ad_vehicle_attributes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchStats',
+            fields=[
+                ('search', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='mobilede_parser.search')),
+                ('ad_count', models.PositiveIntegerField(default=0, verbose_name='ads')),
+                ('priced_ad_count', models.PositiveIntegerField(default=0, verbose_name='ads with a price')),
+                ('price_sum', models.BigIntegerField(default=0)),
+                ('price_histogram', models.JSONField(default=mobilede_parser.models.helpers.search_stats.empty_price_histogram)),
+                ('new_ad_count', models.PositiveIntegerField(default=0, verbose_name='new ads')),
+                ('new_ads_date', models.DateField(null=True, verbose_name='new ads on')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='last updated')),
+            ],
+            options={
+                'verbose_name_plural': 'search stats',
+            },
+        ),
+        migrations.RunPython(compute_search_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0009_searchstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='deal_score',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='ad',
+            name='price_percentile',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-19 07:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0010_ad_deal_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='canonical_ad',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='mobilede_parser.ad'),
+        ),
+        migrations.AddField(
+            model_name='ad',
+            name='minhash',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.CreateModel(
+            name='AdSignatureBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.BigIntegerField(db_index=True)),
+                ('ad', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signature_buckets', to='mobilede_parser.ad')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 08:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0011_ad_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='thumbnail',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=80),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from mobilede_parser.models.helpers.fulltext import create_full_text_index, drop_full_text_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mobilede_parser', '0012_ad_thumbnail'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_full_text_index, drop_full_text_index),
+    ]
@@ -1,28 +1,82 @@
-import re
 import time
-from math import ceil
+from array import array
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
 
-import requests
-from bs4 import BeautifulSoup
-from django.contrib import admin
-from django.db import models
-from django.db.models import F, Value
-from django.db.models.functions import Ceil
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
 
+from core.db import write_lock
+
+from .AdSignatureBucket import AdSignatureBucket
 from .Search import Search
+from .SearchStats import SearchStats
+from .helpers.archive import KIND_AD, archive_page
 from .helpers.bases import QueryParametersModelBase
+from .helpers.duplicates import Candidate, find_duplicates, get_band_keys, get_features, get_signatures
+from .helpers.extractors import ParsedAd, ad_page_extractor
+from .helpers.fulltext import filter_full_text
+from .helpers.known_ids import KnownIds, get_known_ad_ids
 from .helpers.mixins import SessionMixin
+from .helpers.thumbnails import get_thumbnail_fetcher
 
-try:
-    import selenium
-except ImportError:
-    SELENIUM_IS_AVAILABLE = False
-else:
-    from selenium.webdriver import Chrome, ChromeOptions
+if TYPE_CHECKING:
+    import requests
 
-    SELENIUM_IS_AVAILABLE = True
+# Selenium is imported on first use, so processes that never fetch ads don't load it.
+SELENIUM_IS_AVAILABLE = find_spec('selenium') is not None
 
 DB_CHUNK_SIZE = 5000
+DETAIL_PAGE_FIELDS = ('name', 'price', 'vat', 'image_url')
+SEARCH_PAGE_FIELDS = tuple(field for field in ParsedAd._fields if field != 'site_id')
+KEYSET_SORT_FIELDS = ('site_id', 'date', 'price', 'price_net', 'deal_score')
+
+
+class AdQuerySet(models.QuerySet):
+    def full_text(self, query: str) -> 'AdQuerySet':
+        return filter_full_text(self, query)
+
+    def without_duplicates(self) -> 'AdQuerySet':
+        """Leave out ads duplicating another ad of this queryset."""
+        return self.exclude(canonical_ad__in=self.values('pk'))
+
+    def delete(self, update_stats: bool = True):
+        """Delete the ads and their links, ``update_stats=False`` if the caller accounts for the links itself."""
+        with transaction.atomic():
+            removed_links = list(
+                self.model.searches.through.objects.filter(ad__in=self).values_list('search_id', 'ad__price')
+            ) if update_stats else []
+            deleted = super().delete()
+            SearchStats.apply_changes(removed=removed_links)
+        return deleted
+
+    def keyset_page(self, sort: str = '-site_id', after: tuple = None, limit: int = 50) -> List['Ad']:
+        """
+        Return up to ``limit`` ads ordered by ``sort`` (a field of ``KEYSET_SORT_FIELDS``,
+        optionally prefixed with "-") that come after the ``(sort value, site_id)`` key
+        ``after``. Ads with no value for the sort field are skipped.
+        """
+        descending = sort.startswith('-')
+        field = sort.lstrip('-')
+        if field not in KEYSET_SORT_FIELDS:
+            raise ValueError(f'Ads can\'t be sorted by "{field}".')
+
+        queryset = self
+        if field != 'site_id':
+            queryset = queryset.filter(**{f'{field}__isnull': False})
+        if after is not None:
+            value, site_id = after
+            lookup = 'lt' if descending else 'gt'
+            condition = Q(**{f'site_id__{lookup}': site_id})
+            if field != 'site_id':
+                condition = Q(**{f'{field}__{lookup}': value}) | Q(**{field: value}) & condition
+            queryset = queryset.filter(condition)
+
+        direction = '-' if descending else ''
+        ordering = [f'{direction}site_id'] if field == 'site_id' else [f'{direction}{field}', f'{direction}site_id']
+        return list(queryset.order_by(*ordering)[:limit])
 
 
 class Ad(QueryParametersModelBase, SessionMixin):
@@ -35,13 +89,35 @@ class Ad(QueryParametersModelBase, SessionMixin):
     site_id = models.IntegerField(primary_key=True, db_index=True)
 
     name = models.CharField(max_length=1024, blank=True)
-    price = models.PositiveIntegerField(null=True, blank=True)
+    price = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     vat = models.PositiveSmallIntegerField(null=True, blank=True)
-    date = models.DateTimeField(null=True, blank=True)
+    price_net = models.PositiveIntegerField(null=True, blank=True, db_index=True, editable=False)
+    date = models.DateTimeField(null=True, blank=True, db_index=True)
     description = models.TextField(max_length=4096, blank=True)
     image_url = models.URLField(max_length=2048, blank=True)
+    # Local copy of the image, relative to PARSER_THUMBNAIL_DIR, see queue_thumbnails.
+    thumbnail = models.CharField(max_length=80, blank=True, db_index=True, editable=False)
+
+    # Extracted from the description, see extract_vehicle_attributes.
+    mileage = models.PositiveIntegerField(null=True, blank=True, db_index=True)
+    first_registration = models.DateField(null=True, blank=True, db_index=True)
+    power_kw = models.PositiveSmallIntegerField('power (kW)', null=True, blank=True, db_index=True)
+    fuel = models.CharField(max_length=32, blank=True, db_index=True)
+    transmission = models.CharField(max_length=32, blank=True, db_index=True)
+
+    # Set by the score_deals command, see score_deals in helpers/deal_scores.py.
+    deal_score = models.FloatField(null=True, blank=True, db_index=True, editable=False)
+    price_percentile = models.FloatField(null=True, blank=True, editable=False)
+
+    # The first stored ad of the same car, if this one relists it, see detect_duplicates.
+    canonical_ad = models.ForeignKey(
+        'self', null=True, blank=True, on_delete=models.SET_NULL, related_name='duplicates', editable=False,
+    )
+    minhash = models.BinaryField(null=True, editable=False)
+
+    searches = models.ManyToManyField('mobilede_parser.Search', through='mobilede_parser.AdSearch')
 
-    searches = models.ManyToManyField('mobilede_parser.Search')
+    objects = AdQuerySet.as_manager()
 
     created_at = models.DateTimeField('creation date', auto_now_add=True)
     updated_at = models.DateTimeField('last updated', auto_now=True)
@@ -49,81 +125,247 @@ class Ad(QueryParametersModelBase, SessionMixin):
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def get_price_net(price: Optional[int], vat: Optional[int]) -> Optional[int]:
+        if price is None or vat is None:
+            return None
+        return -(-price * (100 - vat) // 100)
+
+    @classmethod
+    def from_parsed(cls, parsed_ad: ParsedAd) -> 'Ad':
+        ad = cls(**parsed_ad._asdict())
+        ad.price_net = cls.get_price_net(ad.price, ad.vat)
+        return ad
+
+    @classmethod
+    def bump_search_versions(cls, site_ids: Iterable[int]):
+        """Mark the searches linking to the ads of ``site_ids`` as changed, so their cached views go stale."""
+        site_ids = list(site_ids)
+        links = cls.searches.through.objects
+        search_ids = set()
+        for i in range(0, len(site_ids), DB_CHUNK_SIZE):
+            search_ids.update(links.filter(ad_id__in=site_ids[i:i + DB_CHUNK_SIZE]).values_list('search_id', flat=True))
+        if search_ids:
+            Search._bump_data_versions(search_ids)
+
+    @classmethod
+    def update_from_parsed(cls, parsed_ads: Iterable[ParsedAd], fields: Sequence[str] = SEARCH_PAGE_FIELDS) -> int:
+        """
+        Overwrite ``fields`` of the stored ads of ``parsed_ads`` with their parsed values.
+
+        Unlike saving crawled ads, no ads or links are created and links aren't marked as
+        seen, so pages fetched long ago can be parsed again. Later parsed ads of the same
+        site id win. Returns the number of changed ads.
+        """
+        parsed_by_id = {parsed_ad.site_id: parsed_ad for parsed_ad in parsed_ads if parsed_ad.site_id is not None}
+        site_ids = list(parsed_by_id)
+        changed_fields = (*fields, 'price_net', 'thumbnail', 'updated_at')
+        now = timezone.now()
+        changed = 0
+        for i in range(0, len(site_ids), DB_CHUNK_SIZE):
+            ads = (
+                cls.objects
+                .filter(site_id__in=site_ids[i:i + DB_CHUNK_SIZE])
+                .only('site_id', 'price', 'vat', 'image_url', 'thumbnail', *fields)
+            )
+            changed_ads, old_prices = [], {}
+            for ad in ads:
+                data = parsed_by_id[ad.site_id]
+                values = {field: getattr(data, field) for field in fields}
+                if all(getattr(ad, field) == value for field, value in values.items()):
+                    continue
+                if ad.price != values.get('price', ad.price):
+                    old_prices[ad.site_id] = ad.price
+                if ad.image_url != values.get('image_url', ad.image_url):
+                    ad.thumbnail = ''
+                for field, value in values.items():
+                    setattr(ad, field, value)
+                ad.price_net = cls.get_price_net(ad.price, ad.vat)
+                ad.updated_at = now
+                changed_ads.append(ad)
+            if not changed_ads:
+                continue
+
+            with write_lock(), transaction.atomic():
+                cls.objects.bulk_update(changed_ads, changed_fields)
+                if old_prices:
+                    prices = {ad.site_id: ad.price for ad in changed_ads}
+                    links = list(
+                        cls.searches.through.objects.filter(ad_id__in=old_prices).values_list('search_id', 'ad_id')
+                    )
+                    SearchStats.apply_changes(
+                        added=[(search_id, prices[ad_id]) for search_id, ad_id in links],
+                        removed=[(search_id, old_prices[ad_id]) for search_id, ad_id in links],
+                        added_are_new=False,
+                    )
+            cls.bump_search_versions(ad.site_id for ad in changed_ads)
+            changed += len(changed_ads)
+        return changed
+
+    @classmethod
+    def get_known_ids(cls) -> KnownIds:
+        """
+        The ids of stored ads. Ids missing from it may still have been stored by other
+        processes, and ads deleted since may still be in it.
+        """
+        return get_known_ad_ids(lambda: cls.objects.order_by('site_id').values_list('site_id', flat=True).iterator())
+
+    @classmethod
+    def detect_duplicates(cls, ads: List['Ad']) -> List[AdSignatureBucket]:
+        """
+        Set the MinHash signature of ``ads``, and their canonical ad if they duplicate a stored ad.
+
+        Returns the signature buckets of the ads, to be saved with them.
+        """
+        signatures = get_signatures(get_features(ad.name, ad.description, ad.price, ad.image_url) for ad in ads)
+
+        def load_candidates(keys):
+            candidates = (
+                AdSignatureBucket.objects
+                .filter(key__in=keys)
+                .values_list('ad_id', 'ad__canonical_ad_id', 'ad__minhash')
+                .distinct()
+            )
+            return [
+                Candidate(site_id, canonical_id, array('I', bytes(minhash)))
+                for site_id, canonical_id, minhash in candidates
+            ]
+
+        for duplicate in find_duplicates(signatures, load_candidates, [ad.site_id for ad in ads]):
+            ads[duplicate.index].canonical_ad_id = duplicate.canonical_id
+
+        buckets = []
+        for ad, signature in zip(ads, signatures):
+            ad.minhash = signature.tobytes()
+            buckets.extend(AdSignatureBucket(key=key, ad_id=ad.site_id) for key in get_band_keys(signature))
+        return buckets
+
     @property
-    @admin.display(ordering=Ceil(F('price') - F('price') * F('vat') / Value(100)))
-    def price_net(self) -> int:
-        return ceil(self.price * (1 - self.vat / 100))
+    def thumbnail_url(self) -> str:
+        """The local copy of the image if fetched, the image on mobile.de otherwise."""
+        if self.thumbnail:
+            return settings.PARSER_THUMBNAIL_URL + self.thumbnail
+        return self.image_url
+
+    @classmethod
+    def queue_thumbnails(cls, ads: Iterable['Ad']):
+        """Fetch the images of ``ads`` without a thumbnail in the background, if thumbnails are on."""
+        fetcher = get_thumbnail_fetcher()
+        if fetcher is not None:
+            fetcher.submit((ad.site_id, ad.image_url) for ad in ads if ad.image_url and not ad.thumbnail)
+
+    @classmethod
+    def save_thumbnails(cls, wait: bool = True) -> int:
+        """
+        Store the thumbnails fetched since the last call, of all queued images if ``wait``.
+
+        Ads whose thumbnail was evicted from the store fall back to their remote image.
+        Returns the number of ads given a thumbnail.
+        """
+        fetcher = get_thumbnail_fetcher()
+        if fetcher is None:
+            return 0
+        fetched = fetcher.collect(wait)
+        changed_ids = set(fetched.names)
+        with write_lock(), transaction.atomic():
+            if fetched.evicted:
+                evicted_ads = cls.objects.filter(thumbnail__in=fetched.evicted)
+                changed_ids.update(evicted_ads.values_list('site_id', flat=True))
+                evicted_ads.update(thumbnail='')
+            cls.objects.bulk_update(
+                [cls(site_id=site_id, thumbnail=name) for site_id, name in fetched.names.items()],
+                ('thumbnail',),
+                DB_CHUNK_SIZE,
+            )
+        # Cached ad listings link the thumbnails, evicted ones are gone.
+        cls.bump_search_versions(changed_ids)
+        return len(fetched.names)
+
+    @classmethod
+    def delete_orphans(cls, site_ids: Iterable[int], batch_size: int = DB_CHUNK_SIZE) -> int:
+        """Delete the ads of ``site_ids`` no search links to anymore, in batches. Returns how many were deleted."""
+        site_ids = list(site_ids)
+        deleted = 0
+        for i in range(0, len(site_ids), batch_size):
+            orphan_ids = list(
+                cls.objects
+                .filter(site_id__in=site_ids[i:i + batch_size], searches__isnull=True)
+                .values_list('site_id', flat=True)
+            )
+            if orphan_ids:
+                with write_lock():
+                    cls.objects.filter(site_id__in=orphan_ids).delete()
+                deleted += len(orphan_ids)
+        return deleted
+
+    def save(self, *args, **kwargs):
+        self.price_net = self.get_price_net(self.price, self.vat)
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            removed_links = [(search_id, self.price) for search_id in self.searches.values_list('pk', flat=True)]
+            deleted = super().delete(*args, **kwargs)
+            SearchStats.apply_changes(removed=removed_links)
+        return deleted
+
+    def _get_page(self, session: 'requests.Session' = None) -> bytes:
+        return self._coalesce('page', self.fetch_url, lambda: self._load_page(session=session))
 
-    def _get_page(self, session: requests.Session = None) -> bytes:
+    def _load_page(self, session: 'requests.Session' = None) -> bytes:
         if SELENIUM_IS_AVAILABLE:
+            from selenium.webdriver import Chrome, ChromeOptions
+
             webdriver_options = ChromeOptions()
             webdriver_options.add_argument('--headless')
             webdriver_options.add_argument('--no-sandbox')
             # webdriver_options.add_argument("--window-size=854,480")
-            webdriver_options.add_argument(
-                "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36"
-            )
+            webdriver_options.add_argument(f'user-agent={self._header_profile.user_agent}')
             with Chrome(options=webdriver_options) as webdriver:
                 # webdriver.set_window_size(854,480)
-                webdriver.get(self.url)
+                webdriver.get(self.fetch_url)
                 time.sleep(4)
                 content = webdriver.page_source
         else:
-            if session is None:
-                session = self._session
-            response = session.get(self.url)
+            response = self._fetch(self.fetch_url, session=session)
             content = response.content
 
+        archive_page(KIND_AD, self.url, content, owner_id=self.site_id)
         return content
 
-    def _parse_page(self, page: bytes = None, session: requests.Session = None):
+    def _parse_page(self, page: bytes = None, session: 'requests.Session' = None) -> Optional[ParsedAd]:
         if page is None:
-            page = self._get_page(session=session)
-
-        soup = BeautifulSoup(page, 'lxml')
-        viewport = soup.find('div', 'viewport')
-        try:
-            main = viewport.div.contents[1].find_all('div', 'g-row', recursive=False)[-1]
-        except AttributeError:
-            return {}
-
-        name = main.find('h1', id='ad-title').text
-        name = re.sub(r'\s+', ' ', name).strip()
-
-        price = main.find('span', attrs={'data-testid': 'prime-price'}).text
-        price = int(re.sub(r'\D+', '', price))
-
-        try:
-            vat = main.find('span', attrs={'data-testid': 'vat'}).text
-            vat = round(
-                float(re.sub(r'[^\d,.]+|^[.,]|[.,]$', '', vat).replace(',', '.'))
-            )
-        except (AttributeError, ValueError):
-            vat = None
-
-        img_el = main.find('img')
-        try:
-            image_url = img_el.get('src') or img_el.get('data-src')
-            if image_url.startswith('//'):
-                image_url = 'https:' + image_url
-            image_url = re.sub(r'\$_\d+', '$_10', image_url)
-        except AttributeError:
-            image_url = None
-
-        data = {
-            'name': name,
-            'price': price,
-            'vat': vat,
-            # 'description': description, ??
-            'image_url': image_url,
-        }
+            return self._coalesce('parsed_page', self.fetch_url, lambda: self._parse_page(self._get_page(session=session)))
 
+        data = ad_page_extractor.extract_page(page)
+        if data is not None:
+            data = data._replace(site_id=self.site_id)
         return data
 
-    def renew_data(self):
-        page = self._get_page()
-        data = self._parse_page(page)
-        if data:
-            for key, value in data.items():
-                setattr(self, key, value)
-            self.save()
+    def renew_data(self, page: bytes = None, session: 'requests.Session' = None):
+        if page is None:
+            page = self._get_page(session=session)
+        self.apply_parsed(self._parse_page(page))
+
+    def apply_parsed(self, data: Optional[ParsedAd]):
+        """Save the fields of a parsed details page of this ad, nothing if it couldn't be parsed."""
+        if data is not None:
+            old_values = [getattr(self, key) for key in DETAIL_PAGE_FIELDS]
+            old_price, old_image_url = self.price, self.image_url
+            for key in DETAIL_PAGE_FIELDS:
+                setattr(self, key, getattr(data, key))
+            if self.image_url != old_image_url:
+                self.thumbnail = ''
+            with write_lock(), transaction.atomic():
+                self.save()
+                if self.price != old_price:
+                    search_ids = list(self.searches.values_list('pk', flat=True))
+                    SearchStats.apply_changes(
+                        added=[(search_id, self.price) for search_id in search_ids],
+                        removed=[(search_id, old_price) for search_id in search_ids],
+                        added_are_new=False,
+                    )
+            if old_values != [getattr(self, key) for key in DETAIL_PAGE_FIELDS]:
+                type(self).bump_search_versions([self.site_id])
+            if not self.thumbnail:
+                type(self).queue_thumbnails([self])
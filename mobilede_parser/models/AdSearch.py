@@ -0,0 +1,16 @@
+from django.db import models
+from django.utils import timezone
+
+
+class AdSearch(models.Model):
+    """Link of an ad to a search whose results showed it, last at ``last_seen_at``."""
+    ad = models.ForeignKey('mobilede_parser.Ad', on_delete=models.CASCADE)
+    search = models.ForeignKey('mobilede_parser.Search', on_delete=models.CASCADE)
+    last_seen_at = models.DateTimeField('last seen', default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = 'mobilede_parser_ad_searches'
+        unique_together = (('ad', 'search'),)
+
+    def __str__(self):
+        return f'{self.ad_id} in {self.search_id}'
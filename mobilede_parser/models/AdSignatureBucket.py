@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class AdSignatureBucket(models.Model):
+    """Band key of an ad's MinHash signature, ads sharing a key are checked for being duplicates."""
+    key = models.BigIntegerField(db_index=True)
+    ad = models.ForeignKey('mobilede_parser.Ad', on_delete=models.CASCADE, related_name='signature_buckets')
+
+    def __str__(self):
+        return f'{self.key} of {self.ad_id}'
@@ -1,17 +1,32 @@
-import re
-import unicodedata
-from contextlib import suppress
-from typing import Any, Dict, List, Union
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-import requests
-from bs4 import BeautifulSoup
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Q
 from django.utils import timezone
-from furl import furl
 
+from core.db import write_lock
+
+from .AdSignatureBucket import AdSignatureBucket
+from .SearchStats import SearchStats
+from .helpers.archive import KIND_SEARCH, archive_page
 from .helpers.bases import QueryParametersModelBase
+from .helpers.extractors import ParsedAd, search_result_extractor
+from .helpers.known_ids import KnownIds, invalidate_known_ad_ids
 from .helpers.mixins import SessionMixin
+from .helpers.parse_pool import parse_search_page
+from .helpers.percolator import Percolator, get_percolator
+from .helpers.search_import import SearchImportResult, import_searches
+from .helpers.sharding import PriceRange, plan_price_shards, split_price_range
+from .helpers.versions import get_search_versions, set_search_version, set_search_versions
+
+if TYPE_CHECKING:
+    import requests
 
 DB_CHUNK_SIZE = 5000
 
@@ -104,140 +119,506 @@ class Search(QueryParametersModelBase, SessionMixin):
         'lang': 'en',
     }
     excluding_params = ('pageNumber',)
+    session_params = ('sset', 'ssid')
 
     name = models.CharField(max_length=1024)
     subscribers = models.ManyToManyField(get_user_model(), blank=True)
 
+    data_version = models.PositiveIntegerField(default=0, editable=False)
+    # Price ranges this search is crawled in, when it has more results than the site paginates.
+    shard_plan = models.JSONField(default=dict, blank=True, editable=False)
+
     created_at = models.DateTimeField('creation date', auto_now_add=True)
     updated_at = models.DateTimeField('last updated', auto_now=True)
 
+    # Serializes saving of shards crawled in parallel.
+    _save_lock = nullcontext()
+
     def __str__(self):
         return self.name
 
-    def _get_num_of_pages(self, session: requests.Session = None) -> int:
-        if session is None:
-            session = self._session
-        response = session.get(self.url)
-        response.raise_for_status()
+    def _bump_data_version(self):
+        """Mark the ads of this search as changed, so their cached views go stale."""
+        with write_lock():
+            type(self).objects.filter(pk=self.pk).update(data_version=F('data_version') + 1)
+        self.data_version = type(self).objects.values_list('data_version', flat=True).get(pk=self.pk)
+        set_search_version(self.pk, self.data_version)
 
-        soup = BeautifulSoup(response.content, 'lxml')
-        pagination = soup.find('ul', 'pagination')
-        max_page = 0
-        try:
-            for li in pagination.find_all('li'):
-                with suppress(ValueError):
-                    if (cur_page := int(li.text)) > max_page:
-                        max_page = cur_page
-        except AttributeError:
-            return 1
-        return max_page
-
-    def _get_page_by_num(self, page_num: int, session: requests.Session = None) -> bytes:
-        if session is None:
-            session = self._session
-        response = session.get(self.url, params={'pageNumber': page_num})
-        response.raise_for_status()
+    @classmethod
+    def _bump_data_versions(cls, search_ids: Iterable[int]):
+        searches = cls.objects.filter(pk__in=search_ids)
+        with write_lock():
+            searches.update(data_version=F('data_version') + 1)
+        set_search_versions(dict(searches.values_list('pk', 'data_version')))
+
+    @classmethod
+    def _lock_links(cls, search_ids: Iterable[int]):
+        """
+        Lock the searches of ``search_ids`` until the end of the transaction, in primary key order.
+
+        Writers of links hold it from reading which links exist to accounting for the ones they
+        added, so a link inserted concurrently (write_lock serialises nothing on PostgreSQL)
+        isn't counted twice in the search's stats.
+        """
+        list(cls.objects.select_for_update().filter(pk__in=search_ids).order_by('pk').values_list('pk', flat=True))
+
+    @classmethod
+    def import_searches(cls, lines: Iterable[str], subscriber=None) -> SearchImportResult:
+        return import_searches(cls, lines, subscriber=subscriber)
+
+    @classmethod
+    def get_data_versions(cls, search_ids: Iterable[int]) -> Dict[int, int]:
+        return get_search_versions(
+            search_ids,
+            lambda missing: dict(cls.objects.filter(pk__in=missing).values_list('pk', 'data_version')),
+        )
+
+    @classmethod
+    def get_percolator(cls) -> Percolator:
+        """The percolator of all searches, compiled again when searches are added, changed or deleted."""
+        state = cls.objects.aggregate(count=Count('pk'), updated_at=Max('updated_at'))
+        return get_percolator(state, lambda: cls.objects.order_by('pk').values_list('pk', 'parameters').iterator())
+
+    @classmethod
+    def link_matching_ads(cls, ads: Sequence, seen_at=None, exclude_search_id: int = None) -> int:
+        """
+        Link stored ``ads`` (``ParsedAd`` or ``Ad``) to every search whose parameters they match.
+
+        Links that already exist are marked as seen at ``seen_at``, if given. Returns the number of new links.
+        """
+        ad_to_search_model = cls.ad_set.through
+        percolator = cls.get_percolator()
+        matches = {
+            (search_id, ad.site_id)
+            for ad in ads for search_id in percolator.match(ad) if search_id != exclude_search_id
+        }
+        if not matches:
+            return 0
+
+        search_ids = {search_id for search_id, _ in matches}
+        ads_ids = {ad_id for _, ad_id in matches}
+        with write_lock(), transaction.atomic():
+            cls._lock_links(search_ids)
+            linked = set(
+                ad_to_search_model.objects
+                .filter(search_id__in=search_ids, ad_id__in=ads_ids)
+                .values_list('search_id', 'ad_id')
+            )
+            new_links = [ad_to_search_model(search_id=search_id, ad_id=ad_id) for search_id, ad_id in matches - linked]
+            if seen_at is not None:
+                for link in new_links:
+                    link.last_seen_at = seen_at
+            ad_to_search_model.objects.bulk_create(new_links, DB_CHUNK_SIZE, ignore_conflicts=True)
+            if new_links:
+                prices = cls._get_ad_prices({link.ad_id for link in new_links})
+                SearchStats.apply_changes(added=[(link.search_id, prices.get(link.ad_id)) for link in new_links])
 
-        return response.content
+            if seen_at is not None:
+                linked_ads_ids_by_search = {}
+                for search_id, ad_id in linked & matches:
+                    linked_ads_ids_by_search.setdefault(search_id, []).append(ad_id)
+                for search_id, ads_ids in linked_ads_ids_by_search.items():
+                    ad_to_search_model.objects.filter(search_id=search_id, ad_id__in=ads_ids).update(
+                        last_seen_at=seen_at)
 
-    def _parse_page(self, page: Union[int, bytes]) -> List[Dict[str, Any]]:
+        if new_links:
+            cls._bump_data_versions({link.search_id for link in new_links})
+        return len(new_links)
+
+    @classmethod
+    def _get_ad_prices(cls, ads_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+        ads_ids = list(ads_ids)
+        if not ads_ids:
+            return {}
+        return dict(cls.ad_set.field.model.objects.filter(site_id__in=ads_ids).values_list('site_id', 'price'))
+
+    def _get_num_of_pages(self, session: 'requests.Session' = None) -> int:
+        def get_num_of_pages():
+            response = self._fetch(self.fetch_url, session=session)
+            response.raise_for_status()
+            archive_page(KIND_SEARCH, response.url, response.content, owner_id=self.id)
+
+            return search_result_extractor.extract_num_of_pages(response.content)
+
+        return self._coalesce('num_of_pages', self.fetch_url, get_num_of_pages)
+
+    def _get_page_by_num(self, page_num: int, session: 'requests.Session' = None) -> bytes:
+        params = {'pageNumber': page_num}
+
+        def get_page():
+            response = self._fetch(self.fetch_url, session=session, params=params)
+            response.raise_for_status()
+            archive_page(KIND_SEARCH, response.url, response.content, owner_id=self.id)
+
+            return response.content
+
+        return self._coalesce('page', self.fetch_url, get_page, params)
+
+    def _parse_page(self, page: Union[int, bytes], session: 'requests.Session' = None) -> List[ParsedAd]:
         if type(page) is int:
-            page = self._get_page_by_num(page)
-        soup = BeautifulSoup(page, 'lxml')
-        content = soup.find('div', 'cBox--resultList')
-        page_ads = content.find_all('div', re.compile(r'cBox-body--(?:resultitem|eyeCatcher)'))
-        ads = []
-        for ad in page_ads:
-            url = ad.find('a').get('href')
-            site_id = int(furl(url).args.getlist('id')[0])
-            headline_block = ad.find('div', 'headline-block')
-
-            headline_block = headline_block.find_all('span')
-            headline_block = list(
-                filter(
-                    lambda span: {'new-headline-label'} - set(span.get('class')),
-                    headline_block,
+            page_num = page
+
+            def parse_page():
+                return search_result_extractor.extract_page(self._get_page_by_num(page_num, session=session))
+
+            return self._coalesce('parsed_page', self.fetch_url, parse_page, {'pageNumber': page_num})
+        return search_result_extractor.extract_page(page)
+
+    def _save_ads_chunk(self, ads_chunk: List[ParsedAd], known_ads_ids: KnownIds, seen_at) -> Tuple[list, list]:
+        """Store the new ads of ``ads_chunk`` and link all of them to this search. Returns the new ads and links."""
+        ad_model = self.ad_set.model
+        ad_to_search_model = ad_model.searches.through
+
+        # Ads stored by other processes between the lookups and the inserts would fail them.
+        with write_lock(), transaction.atomic():
+            type(self)._lock_links([self.id])
+            ads_by_id = {ad.site_id: ad for ad in ads_chunk}
+            # Only ads unknown to this process may be new, the others needn't be looked up.
+            unknown_ads_ids = [ad_id for ad_id in ads_by_id if ad_id not in known_ads_ids]
+            existed_ads_ids = ads_by_id.keys() - set(unknown_ads_ids)
+            if unknown_ads_ids:
+                stored_ads_ids = set(
+                    ad_model.objects.filter(site_id__in=unknown_ads_ids).values_list('site_id', flat=True)
                 )
+                known_ads_ids.add(stored_ads_ids)
+                existed_ads_ids |= stored_ads_ids
+            linked_ads_ids = set(
+                ad_to_search_model.objects
+                .filter(search_id=self.id, ad_id__in=existed_ads_ids)
+                .values_list('ad_id', flat=True)
             )
+            if linked_ads_ids:
+                ad_to_search_model.objects.filter(search_id=self.id, ad_id__in=linked_ads_ids).update(
+                    last_seen_at=seen_at)
 
-            try:
-                name, date = headline_block
-                name = name.text.strip()
-                date = date.text.strip()
-
-                date = timezone.datetime.strptime(date, 'Ad online since %b %d, %Y, %I:%M %p')
-                current_timezone = timezone.get_current_timezone()
-                date = current_timezone.localize(date)
-            except ValueError:
-                date = None
-                name = headline_block[0].text.strip()
-
-            price_block = ad.find('div', 'price-block')
-            try:
-                price, vat = price_block.find_all('span')[:2]
-                price = int(re.sub(r'\D', '', price.text).strip())
-                vat = round(float(re.sub(r'[^\d,.]', '', vat.text).replace(',', '.')))
-            except ValueError:
-                vat = None
-                price = int(re.sub(r'\D', '', price_block.find('span').text).strip())
-
-            description = re.sub(
-                r'(?:\s+)?(?:</?.*?>)+(?:\s+)?',
-                ' ',
-                str(ad.find('div', re.compile(r'^vehicle-data')))
-            ).strip()
-            description = unicodedata.normalize('NFKD', description)
-
-            image_block = ad.find('div', 'image-block')
-            try:
-                img_el = image_block.find('img')
-                image_url = img_el.get('src') or img_el.get('data-src')
-                if image_url.startswith('//'):
-                    image_url = 'https:' + image_url
-                image_url = re.sub(r'\$_\d+', '$_10', image_url)
-            except AttributeError:
-                image_url = ''
-
-            data = {
-                'url': url,
-                'site_id': site_id,
-                'name': name,
-                'date': date,
-                'price': price,
-                'vat': vat,
-                'description': description,
-                'image_url': image_url,
-            }
-            ads.append(data)
-        return ads
-
-    def _save_ads(self, ads: List[Dict[str, Any]]) -> None:
+            new_ads = [
+                ad_model.from_parsed(ad) for ad_id, ad in ads_by_id.items() if ad_id not in existed_ads_ids
+            ]
+            ad_to_search_links = [
+                ad_to_search_model(ad_id=ad_id, search_id=self.id)
+                for ad_id in ads_by_id if ad_id not in linked_ads_ids
+            ]
+
+            signature_buckets = ad_model.detect_duplicates(new_ads) if settings.PARSER_DETECT_DUPLICATES else []
+            ad_model.objects.bulk_create(new_ads, DB_CHUNK_SIZE)
+            AdSignatureBucket.objects.bulk_create(signature_buckets, DB_CHUNK_SIZE)
+            ad_to_search_model.objects.bulk_create(ad_to_search_links, DB_CHUNK_SIZE, ignore_conflicts=True)
+            if ad_to_search_links:
+                # Ads stored before may have a price other than the parsed one.
+                prices = {ad.site_id: ad.price for ad in new_ads}
+                prices.update(self._get_ad_prices(
+                    link.ad_id for link in ad_to_search_links if link.ad_id in existed_ads_ids
+                ))
+                SearchStats.apply_changes(
+                    added=[(self.id, prices.get(link.ad_id)) for link in ad_to_search_links]
+                )
+        known_ads_ids.add(ad.site_id for ad in new_ads)
+        return new_ads, ad_to_search_links
+
+    def _save_ads(self, ads: List[ParsedAd]) -> None:
         def chunkify(itr, n):
             for i in range(0, len(itr), n):
                 yield itr[i:i + n]
 
+        ad_model = self.ad_set.model
+
+        changed = False
+        seen_at = timezone.now()
+        known_ads_ids = ad_model.get_known_ids()
         ads_chunks = chunkify(ads, DB_CHUNK_SIZE)
-        for ads_chunk in ads_chunks:
-            ads_ids = {ad.get('site_id') for ad in ads_chunk}
-            existed_ads_ids = self.ad_set.model.objects.filter(site_id__in=ads_ids).values_list('site_id', flat=True)
-            ad_to_search_links = []
+        with self._save_lock:
+            for ads_chunk in ads_chunks:
+                try:
+                    new_ads, ad_to_search_links = self._save_ads_chunk(ads_chunk, known_ads_ids, seen_at)
+                except IntegrityError:
+                    # An ad known to this process was deleted by another one since (e.g. expired), so linking
+                    # it failed. Its deletion may not have reached this process, the ids are read again.
+                    invalidate_known_ad_ids()
+                    known_ads_ids = ad_model.get_known_ids()
+                    new_ads, ad_to_search_links = self._save_ads_chunk(ads_chunk, known_ads_ids, seen_at)
+                ad_model.queue_thumbnails(new_ads)
+                changed = changed or bool(ad_to_search_links)
+
+                if settings.PARSER_PERCOLATE_ADS:
+                    type(self).link_matching_ads(ads_chunk, seen_at=seen_at, exclude_search_id=self.id)
+
+            if changed:
+                self._bump_data_version()
+
+    def restore_ads(self, ads: Iterable[Tuple[ParsedAd, datetime]]) -> int:
+        """
+        Store the missing ads of ``ads``, parsed from archived pages of this search, and link them
+        to it as seen at their paired times. Stored ads aren't changed and existing links aren't
+        marked as seen. Later pairs of the same site id win. Returns the number of stored ads.
+        """
+        ad_model = self.ad_set.model
+        ad_to_search_model = ad_model.searches.through
+        ads_by_id = {ad.site_id: (ad, seen_at) for ad, seen_at in ads}
+
+        with write_lock(), transaction.atomic():
+            type(self)._lock_links([self.id])
+            stored_ads_ids = set(ad_model.objects.filter(site_id__in=ads_by_id).values_list('site_id', flat=True))
+            linked_ads_ids = set(
+                ad_to_search_model.objects
+                .filter(search_id=self.id, ad_id__in=stored_ads_ids)
+                .values_list('ad_id', flat=True)
+            )
+            new_ads = [
+                ad_model.from_parsed(ad) for ad_id, (ad, _) in ads_by_id.items() if ad_id not in stored_ads_ids
+            ]
+            new_links = [
+                ad_to_search_model(ad_id=ad_id, search_id=self.id, last_seen_at=seen_at)
+                for ad_id, (_, seen_at) in ads_by_id.items() if ad_id not in linked_ads_ids
+            ]
+
+            signature_buckets = ad_model.detect_duplicates(new_ads) if settings.PARSER_DETECT_DUPLICATES else []
+            ad_model.objects.bulk_create(new_ads, DB_CHUNK_SIZE)
+            AdSignatureBucket.objects.bulk_create(signature_buckets, DB_CHUNK_SIZE)
+            ad_to_search_model.objects.bulk_create(new_links, DB_CHUNK_SIZE)
+            if new_links:
+                prices = {ad.site_id: ad.price for ad in new_ads}
+                prices.update(self._get_ad_prices(
+                    link.ad_id for link in new_links if link.ad_id in stored_ads_ids
+                ))
+                SearchStats.apply_changes(added=[(self.id, prices.get(link.ad_id)) for link in new_links])
+
+        ad_model.queue_thumbnails(new_ads)
+        if new_links:
+            self._bump_data_version()
+        return len(new_ads)
+
+    def expire_ads(self, seen_before, keep_price_ranges: Sequence[PriceRange] = ()) -> int:
+        """
+        Unlink the ads this search's results haven't shown since ``seen_before``.
+
+        Ads priced within ``keep_price_ranges`` are kept, results of truncated ranges may
+        have been past the page cap. Expired ads no other search links to are deleted.
+        Expired links are totalled and deleted in the database, not loaded. Returns the number of unlinked ads.
+        """
+        ad_model = self.ad_set.model
+        links = ad_model.searches.through.objects
+        expired_links = links.filter(search_id=self.id, last_seen_at__lt=seen_before)
+        for low, high in keep_price_ranges:
+            expired_links = expired_links.exclude(
+                Q(ad__price__gte=low) & (Q(ad__price__lte=high) if high is not None else Q())
+            )
+        with write_lock(), transaction.atomic():
+            removed = SearchStats.aggregate_links(expired_links)
+            expired = sum(count for count, _ in removed.values())
+            if not expired:
+                return 0
+            # Their links are among the expired ones, accounted for below.
+            ad_model.objects.filter(pk__in=expired_links.values('ad_id')).exclude(
+                Exists(links.filter(ad_id=OuterRef('pk')).exclude(search_id=self.id))
+            ).delete(update_stats=False)
+            expired_links.delete()
+            SearchStats.apply_removed_totals(self.id, removed)
+        self._bump_data_version()
+        return expired
+
+    def _get_price_range(self) -> Optional[PriceRange]:
+        """The price bounds of this search's own parameters, ``None`` if they aren't plain numbers."""
+        try:
+            low = int(self.parameters.get('minPrice') or 0)
+            high = int(self.parameters['maxPrice']) if self.parameters.get('maxPrice') else None
+        except (TypeError, ValueError):
+            return None
+        return low, high
+
+    def _make_shard(self, price_range: PriceRange) -> 'Search':
+        """An unsaved copy of this search narrowed to ``price_range``, saving its ads to this search."""
+        low, high = price_range
+        parameters = {**self.parameters, 'minPrice': str(low)}
+        if high is None:
+            parameters.pop('maxPrice', None)
+        else:
+            parameters['maxPrice'] = str(high)
+        shard = type(self)(id=self.id, name=self.name, parameters=parameters)
+        shard._chosen_header_profile = self._header_profile
+        return shard
+
+    def _get_planned_shards(self) -> Optional[List[PriceRange]]:
+        plan = self.shard_plan
+        if (plan.get('parameters') != self.get_canonical_parameters(self.parameters)
+                or plan.get('max_pages') != settings.PARSER_MAX_PAGES
+                or plan.get('max_shards') != settings.PARSER_MAX_SHARDS):
+            return None
+        return [tuple(price_range) for price_range in plan['price_ranges']]
+
+    def _set_shard_plan(self, price_ranges: Optional[List[PriceRange]]):
+        self.shard_plan = {
+            'parameters': self.get_canonical_parameters(self.parameters),
+            'max_pages': settings.PARSER_MAX_PAGES,
+            'max_shards': settings.PARSER_MAX_SHARDS,
+            'price_ranges': [list(price_range) for price_range in price_ranges],
+        } if price_ranges else {}
+        with write_lock():
+            type(self).objects.filter(pk=self.pk).update(shard_plan=self.shard_plan)
+
+    def _plan_shards(self, num_of_pages: int, session: 'requests.Session') -> List[PriceRange]:
+        price_ranges = plan_price_shards(
+            lambda price_range: self._make_shard(price_range)._get_num_of_pages(session=session),
+            self._get_price_range(),
+            settings.PARSER_MAX_PAGES,
+            num_of_pages,
+            settings.PARSER_MAX_SHARDS,
+        )
+        self._set_shard_plan(price_ranges if len(price_ranges) > 1 else None)
+        return price_ranges
 
-            for ad_id in existed_ads_ids:
-                ad_to_search_links.append(self.ad_set.model.searches.through(ad_id=ad_id, search_id=self.id))
+    def _parse_shards(
+        self,
+        price_ranges: List[PriceRange],
+        parse_pool: Optional[ProcessPoolExecutor],
+        fetch_workers: int,
+        session: 'requests.Session',
+    ) -> Tuple[bool, List[PriceRange]]:
+        """
+        Crawl the shards of ``price_ranges`` in parallel.
 
-            new_ads = [self.ad_set.model(**ad) for ad in ads_chunk if ad.get('site_id') not in existed_ads_ids]
-            for ad in new_ads:
-                ad_to_search_links.append(self.ad_set.model.searches.through(ad_id=ad.site_id, search_id=self.id))
+        Returns whether no shard that could be split was cut off, and the shards cut off
+        that can't be split (too narrow, or the plan has ``PARSER_MAX_SHARDS`` shards),
+        whose results past the page cap can't be crawled.
+        """
+        save_lock = threading.Lock()
 
-            self.ad_set.model.objects.bulk_create(new_ads, DB_CHUNK_SIZE)
-            self.ad_set.model.searches.through.objects.bulk_create(ad_to_search_links, DB_CHUNK_SIZE, ignore_conflicts=True)
+        def parse_shard(price_range: PriceRange) -> bool:
+            shard = self._make_shard(price_range)
+            shard._save_lock = save_lock
+            try:
+                num_of_pages = shard._get_num_of_pages(session=session)
+                shard._parse_pages(num_of_pages, parse_pool, fetch_workers, session)
+            finally:
+                connections.close_all()
+            return num_of_pages >= settings.PARSER_MAX_PAGES
+
+        with ThreadPoolExecutor(max(settings.PARSER_SHARD_WORKERS, 1)) as shard_pool:
+            capped = [
+                price_range
+                for price_range, is_capped in zip(price_ranges, shard_pool.map(parse_shard, price_ranges))
+                if is_capped
+            ]
+        # Plans of as many shards as allowed can't split theirs any further.
+        can_split = len(price_ranges) < settings.PARSER_MAX_SHARDS
+        truncated = [
+            price_range for price_range in capped if not can_split or split_price_range(price_range) is None
+        ]
+        if len(truncated) < len(capped):
+            # A shard outgrew the page cap since planning, plan again on the next crawl.
+            self._set_shard_plan(None)
+            return False, truncated
+        return True, truncated
+
+    def _parse_pages(
+        self,
+        num_of_pages: int,
+        parse_pool: Optional[ProcessPoolExecutor],
+        fetch_workers: int,
+        session: 'requests.Session',
+    ):
+        if parse_pool is None:
+            for page_num in range(1, num_of_pages + 1):
+                page = self._get_page_by_num(page_num, session=session)
+                parsed_ads = self._parse_page(page)
+                self._save_ads(parsed_ads)
+            return
+
+        def save_parsed(futures):
+            for future in futures:
+                self._save_ads(future.result())
+
+        pending = set()
+        with ThreadPoolExecutor(max(fetch_workers, 1)) as fetch_pool:
+            pages = fetch_pool.map(lambda page_num: self._get_page_by_num(page_num, session=session),
+                                   range(1, num_of_pages + 1))
+            for page in pages:
+                pending.add(parse_pool.submit(parse_search_page, page))
+                done = {future for future in pending if future.done()}
+                pending -= done
+                save_parsed(done)
+        save_parsed(as_completed(pending))
+
+    def parse_ads(
+        self,
+        parse_pool: ProcessPoolExecutor = None,
+        fetch_workers: int = None,
+        session: 'requests.Session' = None,
+    ) -> List[PriceRange]:
+        """
+        Fetch, parse and save all result pages of this search.
+
+        With a ``parse_pool`` (see ``create_parse_pool``), pages are fetched by ``fetch_workers``
+        threads and parsed in worker processes, while the ads are saved from this process
+        as parsed pages come back. Without one, pages are handled one by one.
+        All pages are fetched with ``session``, the shared session of this search by default.
+
+        A search showing ``PARSER_MAX_PAGES`` pages may have more results than the site
+        paginates, so it is split into price ranges that each fit, which are crawled by
+        ``PARSER_SHARD_WORKERS`` threads. The ranges are kept in ``shard_plan`` for later crawls.
+
+        After a crawl that saw all results, ads that weren't among them are expired. Price
+        ranges that can't be split any further and still reach the cap are crawled as far as
+        the site paginates, ads priced within them aren't expired. Returns those truncated ranges.
+        """
+        if fetch_workers is None:
+            fetch_workers = settings.PARSER_FETCH_WORKERS
 
-    def parse_ads(self):
-        num_of_pages = self._get_num_of_pages()
-        for page_num in range(1, num_of_pages + 1):
-            page = self._get_page_by_num(page_num)
-            parsed_ads = self._parse_page(page)
-            self._save_ads(parsed_ads)
+        if session is None:
+            session = self._session
+
+        started_at = timezone.now()
+        price_ranges = self._get_planned_shards()
+        if price_ranges is None:
+            num_of_pages = self._get_num_of_pages(session=session)
+            if num_of_pages >= settings.PARSER_MAX_PAGES and self._get_price_range() is not None:
+                price_ranges = self._plan_shards(num_of_pages, session)
+
+        if price_ranges and len(price_ranges) > 1:
+            complete, truncated = self._parse_shards(price_ranges, parse_pool, fetch_workers, session)
+        else:
+            self._parse_pages(num_of_pages, parse_pool, fetch_workers, session)
+            truncated = [self._get_price_range() or (0, None)] if num_of_pages >= settings.PARSER_MAX_PAGES else []
+            # Capped searches planned into a single range are too narrow to split, others couldn't be planned.
+            complete = not truncated or price_ranges is not None
+
+        if complete:
+            self.expire_ads(started_at, keep_price_ranges=truncated)
+        return truncated
 
     def get_ads(self):
         return list(self.ad_set.all())
+
+    def iter_ads(self, fields: Sequence[str] = None, chunk_size: int = DB_CHUNK_SIZE) -> Iterator:
+        """
+        Stream this search's ads in ``site_id`` order, keeping memory use constant.
+
+        Ads are read in keyset-paginated chunks of ``chunk_size``, each streamed through
+        a server-side cursor where the database supports one. Yields ``Ad`` instances,
+        or tuples of the ``fields`` values if given.
+        """
+        if fields:
+            fields = tuple(fields)
+            with_key = 'site_id' not in fields
+            key_index = 0 if with_key else fields.index('site_id')
+
+        last_site_id = None
+        while True:
+            queryset = self.ad_set.order_by('site_id')
+            if last_site_id is not None:
+                queryset = queryset.filter(site_id__gt=last_site_id)
+            if fields:
+                queryset = queryset.values_list(*(('site_id',) + fields if with_key else fields))
+            queryset = queryset[:chunk_size]
+
+            count = 0
+            for ad in queryset.iterator(chunk_size=chunk_size):
+                count += 1
+                if fields:
+                    last_site_id = ad[key_index]
+                    if with_key:
+                        ad = ad[1:]
+                else:
+                    last_site_id = ad.site_id
+                yield ad
+            if count < chunk_size:
+                return
@@ -0,0 +1,162 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db import models, transaction
+from django.db.models import Case, Count, Sum, Value, When
+from django.utils import timezone
+
+from .helpers.search_stats import (
+    PRICE_HISTOGRAM_BOUNDS, approximate_price_percentile, empty_price_histogram, get_price_bucket,
+)
+
+# (search id, ad price) of a link between an ad and a search.
+LinkPrice = Tuple[int, Optional[int]]
+# (number of links, sum of their ad prices) by price histogram bucket, None for ads without a price.
+BucketTotals = Dict[Optional[int], Tuple[int, int]]
+
+UPDATED_FIELDS = (
+    'ad_count', 'priced_ad_count', 'price_sum', 'price_histogram', 'new_ad_count', 'new_ads_date', 'updated_at',
+)
+
+
+class SearchStats(models.Model):
+    """
+    Ad statistics of a search, updated with its links to ads.
+
+    Links are added and removed through ``apply_changes``, in the transaction changing
+    them, so reading the stats of a search is one primary key lookup. Writers adding links
+    lock their searches first, see ``Search._lock_links``.
+    """
+    search = models.OneToOneField(
+        'mobilede_parser.Search', on_delete=models.CASCADE, primary_key=True, related_name='stats',
+    )
+    ad_count = models.PositiveIntegerField('ads', default=0)
+    priced_ad_count = models.PositiveIntegerField('ads with a price', default=0)
+    price_sum = models.BigIntegerField(default=0)
+    # Number of ads by bucket of PRICE_HISTOGRAM_BOUNDS.
+    price_histogram = models.JSONField(default=empty_price_histogram)
+    new_ad_count = models.PositiveIntegerField('new ads', default=0)
+    new_ads_date = models.DateField('new ads on', null=True)
+
+    updated_at = models.DateTimeField('last updated', auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'search stats'
+
+    def __str__(self):
+        return f'Stats of {self.search_id}'
+
+    @property
+    def average_price(self) -> Optional[int]:
+        return round(self.price_sum / self.priced_ad_count) if self.priced_ad_count else None
+
+    @property
+    def median_price(self) -> Optional[int]:
+        """Approximate median price, from the histogram."""
+        return approximate_price_percentile(self.price_histogram, 50)
+
+    @property
+    def new_today(self) -> int:
+        return self.new_ad_count if self.new_ads_date == timezone.localdate() else 0
+
+    def _add(self, price: Optional[int], sign: int):
+        self.ad_count += sign
+        if price is not None:
+            self.priced_ad_count += sign
+            self.price_sum += sign * price
+            self.price_histogram[get_price_bucket(price)] += sign
+
+    @classmethod
+    def apply_changes(
+        cls,
+        added: Iterable[LinkPrice] = (),
+        removed: Iterable[LinkPrice] = (),
+        added_are_new: bool = True,
+    ):
+        """
+        Account for links ``added`` and ``removed`` after they were written.
+
+        Added links count as new ads of today, unless ``added_are_new`` is false (e.g. for
+        a price change, given as the removal and addition of the link). Searches with no
+        stats yet are computed from scratch instead.
+        """
+        changes = defaultdict(list)
+        for search_id, price in added:
+            changes[search_id].append((price, 1))
+        for search_id, price in removed:
+            changes[search_id].append((price, -1))
+        if not changes:
+            return
+
+        now = timezone.now()
+        today = timezone.localdate(now)
+        with transaction.atomic():
+            stats = cls.objects.select_for_update().in_bulk(changes.keys())
+            for search_id, search_stats in stats.items():
+                for price, sign in changes[search_id]:
+                    search_stats._add(price, sign)
+                if added_are_new and (new_ads := sum(sign > 0 for _, sign in changes[search_id])):
+                    if search_stats.new_ads_date != today:
+                        search_stats.new_ad_count, search_stats.new_ads_date = 0, today
+                    search_stats.new_ad_count += new_ads
+                search_stats.updated_at = now
+            cls.objects.bulk_update(stats.values(), UPDATED_FIELDS)
+            if missing := changes.keys() - stats.keys():
+                cls.rebuild(missing)
+
+    @staticmethod
+    def aggregate_links(links: models.QuerySet) -> BucketTotals:
+        """Count the ``links`` and sum their ad prices by price histogram bucket, in one grouped query."""
+        bucket = Case(
+            *(
+                When(ad__price__gte=low, then=Value(index))
+                for index, low in reversed(list(enumerate(PRICE_HISTOGRAM_BOUNDS)))
+            ),
+            # Like get_price_bucket, prices below the first bound count in the first bucket.
+            When(ad__price__isnull=False, then=Value(0)),
+            output_field=models.IntegerField(),
+        )
+        rows = (
+            links.order_by().annotate(bucket=bucket).values('bucket')
+            .annotate(count=Count('pk'), price_sum=Sum('ad__price'))
+        )
+        return {row['bucket']: (row['count'], row['price_sum'] or 0) for row in rows}
+
+    @classmethod
+    def apply_removed_totals(cls, search_id: int, removed: BucketTotals):
+        """
+        Account for links of a search removed in bulk, totalled by ``aggregate_links`` before they were deleted.
+
+        A search with no stats yet is computed from scratch instead.
+        """
+        if not removed:
+            return
+        with transaction.atomic():
+            search_stats = cls.objects.select_for_update().filter(search_id=search_id).first()
+            if search_stats is None:
+                cls.rebuild([search_id])
+                return
+            for bucket, (count, price_sum) in removed.items():
+                search_stats.ad_count -= count
+                if bucket is not None:
+                    search_stats.priced_ad_count -= count
+                    search_stats.price_sum -= price_sum
+                    search_stats.price_histogram[bucket] -= count
+            search_stats.save(update_fields=UPDATED_FIELDS)
+
+    @classmethod
+    def rebuild(cls, search_ids: Iterable[int] = None) -> int:
+        """Compute the stats of searches (all if ``search_ids`` is ``None``) from their links. Returns their number."""
+        search_model = cls._meta.get_field('search').related_model
+        searches = search_model.objects.all()
+        if search_ids is not None:
+            searches = searches.filter(pk__in=search_ids)
+        links = search_model.ad_set.through.objects.filter(search__in=searches)
+
+        with transaction.atomic():
+            stats = {search_id: cls(search_id=search_id) for search_id in searches.values_list('pk', flat=True)}
+            for search_id, price in links.values_list('search_id', 'ad__price').iterator():
+                stats[search_id]._add(price, 1)
+            cls.objects.filter(search_id__in=stats.keys()).delete()
+            cls.objects.bulk_create(stats.values())
+        return len(stats)
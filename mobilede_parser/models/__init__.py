@@ -1,11 +1,32 @@
-from django.db.models.signals import pre_delete
+from django.db.models.signals import m2m_changed, pre_delete
 from django.db.transaction import atomic
 from django.dispatch import receiver
 
 from .Ad import Ad
+from .AdSearch import AdSearch
+from .AdSignatureBucket import AdSignatureBucket
 from .Search import Search
+from .SearchStats import SearchStats
+from .helpers.versions import forget_user_search_ids
 
-__all__ = ('helpers', 'Search', 'Ad')
+__all__ = ('helpers', 'Search', 'Ad', 'AdSearch', 'AdSignatureBucket', 'SearchStats')
+
+
+@receiver(m2m_changed, sender=Search.subscribers.through)
+def subscribers_changed(sender, instance, action, reverse, pk_set, *args, **kwargs):
+    if action not in ('pre_clear', 'post_add', 'post_remove'):
+        return
+    if reverse:
+        forget_user_search_ids([instance.pk])
+    elif action == 'pre_clear':
+        forget_user_search_ids(instance.subscribers.values_list('pk', flat=True))
+    else:
+        forget_user_search_ids(pk_set)
+
+
+@receiver(pre_delete, sender=Search)
+def search_subscribers_deleted(sender, instance, *args, **kwargs):
+    forget_user_search_ids(instance.subscribers.values_list('pk', flat=True))
 
 
 @receiver(pre_delete, sender=Search)
@@ -1 +1 @@
-__all__ = ('bases', 'mixins', 'functions')
+__all__ = ('bases', 'mixins')
@@ -0,0 +1,205 @@
+import bisect
+import fcntl
+import mmap
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from django.conf import settings
+
+try:
+    import zstandard
+except ImportError:
+    ZSTD_IS_AVAILABLE = False
+else:
+    ZSTD_IS_AVAILABLE = True
+
+SEGMENT_NAME_FORMAT = 'segment-{:06d}'
+DATA_SUFFIX = '.dat'
+INDEX_SUFFIX = '.idx'
+
+KIND_SEARCH = 'search'
+KIND_AD = 'ad'
+
+CODEC_ZLIB = 'zlib'
+CODEC_ZSTD = 'zstd'
+
+
+class ArchiveEntry(NamedTuple):
+    url: str
+    fetched_at: float
+    kind: str
+    owner_id: Optional[int]
+    segment: int
+    codec: str
+    offset: int
+    length: int
+
+    def to_line(self) -> str:
+        owner_id = '' if self.owner_id is None else self.owner_id
+        return f'{self.fetched_at:.6f}\t{self.kind}\t{owner_id}\t{self.codec}\t{self.offset}\t{self.length}\t{self.url}\n'
+
+    @classmethod
+    def from_line(cls, line: str, segment: int) -> 'ArchiveEntry':
+        fetched_at, kind, owner_id, codec, offset, length, url = line.rstrip('\n').split('\t', 6)
+        return cls(
+            url=url,
+            fetched_at=float(fetched_at),
+            kind=kind,
+            owner_id=int(owner_id) if owner_id else None,
+            segment=segment,
+            codec=codec,
+            offset=int(offset),
+            length=int(length),
+        )
+
+
+class PageArchive(object):
+    """
+    Append-only archive of fetched pages.
+
+    Pages are compressed (zstd when ``zstandard`` is installed, zlib otherwise) and appended
+    to segment files; every segment has a text index with one line per page. Several
+    processes may append to the same archive, appends are serialised with ``flock``.
+    Segments are read back through ``mmap``.
+    """
+
+    def __init__(self, root, segment_size: int = 256 * 1024 * 1024):
+        self.root = Path(root)
+        self.segment_size = segment_size
+        self._lock = threading.Lock()
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._entries: Optional[List[ArchiveEntry]] = None
+        self._keys: List[tuple] = []
+
+    def _segment_path(self, segment: int, suffix: str) -> Path:
+        return self.root / (SEGMENT_NAME_FORMAT.format(segment) + suffix)
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(path.stem.split('-', 1)[1])
+            for path in self.root.glob('segment-*' + DATA_SUFFIX)
+        )
+
+    @staticmethod
+    def _compress(content: bytes):
+        if ZSTD_IS_AVAILABLE:
+            return CODEC_ZSTD, zstandard.ZstdCompressor().compress(content)
+        return CODEC_ZLIB, zlib.compress(content)
+
+    @staticmethod
+    def _decompress(codec: str, data) -> bytes:
+        if codec == CODEC_ZSTD:
+            if not ZSTD_IS_AVAILABLE:
+                raise RuntimeError('The archive contains zstd pages, install "zstandard" to read them.')
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def append(self, kind: str, url: str, content: bytes, owner_id: int = None, fetched_at: float = None) -> ArchiveEntry:
+        codec, data = self._compress(content)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, open(self.root / '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                segment = (self._segments() or [1])[-1]
+                data_path = self._segment_path(segment, DATA_SUFFIX)
+                if data_path.exists() and data_path.stat().st_size + len(data) > self.segment_size:
+                    segment += 1
+                    data_path = self._segment_path(segment, DATA_SUFFIX)
+
+                with open(data_path, 'ab') as data_file:
+                    offset = data_file.tell()
+                    data_file.write(data)
+                entry = ArchiveEntry(
+                    url=url,
+                    fetched_at=time.time() if fetched_at is None else fetched_at,
+                    kind=kind,
+                    owner_id=owner_id,
+                    segment=segment,
+                    codec=codec,
+                    offset=offset,
+                    length=len(data),
+                )
+                with open(self._segment_path(segment, INDEX_SUFFIX), 'a', encoding='utf-8') as index_file:
+                    index_file.write(entry.to_line())
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        self._entries = None
+        return entry
+
+    @property
+    def entries(self) -> List[ArchiveEntry]:
+        """All archived pages, sorted by ``(url, fetched_at)``."""
+        if self._entries is None:
+            entries = []
+            for segment in self._segments():
+                index_path = self._segment_path(segment, INDEX_SUFFIX)
+                if index_path.exists():
+                    with open(index_path, encoding='utf-8') as index_file:
+                        entries.extend(ArchiveEntry.from_line(line, segment) for line in index_file)
+            entries.sort()
+            self._entries = entries
+            self._keys = [(entry.url, entry.fetched_at) for entry in entries]
+        return self._entries
+
+    def find(self, url: str, fetched_at: float = None) -> Optional[ArchiveEntry]:
+        """Return the latest page of ``url`` fetched no later than ``fetched_at``."""
+        entries = self.entries
+        position = bisect.bisect_right(self._keys, (url, float('inf') if fetched_at is None else fetched_at))
+        if position and entries[position - 1].url == url:
+            return entries[position - 1]
+        return None
+
+    def filter(self, kind: str = None, owner_ids=None, since: float = None, until: float = None) -> Iterator[ArchiveEntry]:
+        """Yield matching pages in the order they were fetched."""
+        for entry in sorted(self.entries, key=lambda entry: entry.fetched_at):
+            if kind is not None and entry.kind != kind:
+                continue
+            if owner_ids is not None and entry.owner_id not in owner_ids:
+                continue
+            if since is not None and entry.fetched_at < since:
+                continue
+            if until is not None and entry.fetched_at > until:
+                continue
+            yield entry
+
+    def read(self, entry: ArchiveEntry) -> bytes:
+        segment_map = self._maps.get(entry.segment)
+        if segment_map is None or len(segment_map) < entry.offset + entry.length:
+            with open(self._segment_path(entry.segment, DATA_SUFFIX), 'rb') as data_file:
+                segment_map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+            old_map = self._maps.pop(entry.segment, None)
+            if old_map is not None:
+                old_map.close()
+            self._maps[entry.segment] = segment_map
+        return self._decompress(entry.codec, segment_map[entry.offset:entry.offset + entry.length])
+
+    def close(self):
+        for segment_map in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+
+
+_page_archive = None
+
+
+def get_page_archive() -> Optional[PageArchive]:
+    """Return the archive configured by ``PARSER_PAGE_ARCHIVE_DIR``, ``None`` if archiving is off."""
+    global _page_archive
+    if not settings.PARSER_PAGE_ARCHIVE_DIR:
+        return None
+    if _page_archive is None:
+        _page_archive = PageArchive(settings.PARSER_PAGE_ARCHIVE_DIR, settings.PARSER_PAGE_ARCHIVE_SEGMENT_SIZE)
+    return _page_archive
+
+
+def archive_page(kind: str, url: str, content: bytes, owner_id: int = None):
+    page_archive = get_page_archive()
+    if page_archive is not None:
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        page_archive.append(kind, url, content, owner_id=owner_id)
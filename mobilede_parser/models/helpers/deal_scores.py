@@ -0,0 +1,128 @@
+import bisect
+import statistics
+from collections import defaultdict
+from datetime import date
+from importlib.util import find_spec
+from itertools import count
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence
+
+# NumPy scores a million ads in seconds, without it groups are scored in plain Python.
+NUMPY_IS_AVAILABLE = find_spec('numpy') is not None
+
+# Groups with fewer ads get no scores, their median says little about a fair price.
+MIN_GROUP_SIZE = 5
+MILEAGE_BUCKET_SIZE = 25000
+# Scales the median absolute deviation to the standard deviation of normally distributed prices.
+MAD_SCALE = 1.4826
+
+
+class DealScores(NamedTuple):
+    # How many (scaled) median absolute deviations an ad is cheaper than the median of its group.
+    scores: List[Optional[float]]
+    # Share of the group priced below an ad, 0 to 100.
+    percentiles: List[Optional[float]]
+
+
+def get_comparable_group(name: str, first_registration: Optional[date], mileage: Optional[int]) -> Optional[tuple]:
+    """
+    Key of the ads comparable to an ad: make and model, registration year and mileage bucket.
+
+    Ads only have a title, so make and model are its first two words (e.g. "bmw 520"). ``None``
+    if the ad lacks any of them.
+    """
+    words = name.lower().split()
+    if len(words) < 2 or first_registration is None or mileage is None:
+        return None
+    return words[0], words[1], first_registration.year, mileage // MILEAGE_BUCKET_SIZE
+
+
+def _score_with_numpy(codes: Sequence[int], prices: Sequence[int]) -> DealScores:
+    import numpy as np
+
+    codes = np.asarray(codes, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+    num_prices = len(codes)
+
+    # Sorted by group, then price, every group is a slice starting at one of ``starts``.
+    order = np.lexsort((prices, codes))
+    sorted_codes, sorted_prices = codes[order], prices[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, num_prices])
+    groups = np.repeat(np.arange(len(starts)), sizes)
+
+    def slice_medians(sorted_values):
+        return (sorted_values[starts + (sizes - 1) // 2] + sorted_values[starts + sizes // 2]) / 2
+
+    medians = slice_medians(sorted_prices)
+    deviations = np.abs(sorted_prices - medians[groups])
+    mads = slice_medians(deviations[np.lexsort((deviations, groups))])
+
+    # Equal prices share the rank of the first of them.
+    first_of_equal = np.r_[True, (sorted_codes[1:] != sorted_codes[:-1]) | (sorted_prices[1:] != sorted_prices[:-1])]
+    ranks = np.maximum.accumulate(np.where(first_of_equal, np.arange(num_prices), 0)) - starts[groups]
+
+    valid = (sizes[groups] >= MIN_GROUP_SIZE) & (mads[groups] > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sorted_scores = np.where(valid, (medians[groups] - sorted_prices) / (MAD_SCALE * mads[groups]), np.nan)
+        sorted_percentiles = np.where(valid, ranks / sizes[groups] * 100, np.nan)
+
+    scores = np.empty(num_prices)
+    percentiles = np.empty(num_prices)
+    scores[order] = sorted_scores
+    percentiles[order] = sorted_percentiles
+    # NaN is the only float unequal to itself.
+    return DealScores(
+        [None if score != score else score for score in scores.tolist()],
+        [None if percentile != percentile else percentile for percentile in percentiles.tolist()],
+    )
+
+
+def _score_in_python(codes: Sequence[int], prices: Sequence[int]) -> DealScores:
+    indexes_by_group: Dict[int, List[int]] = {}
+    for index, code in enumerate(codes):
+        indexes_by_group.setdefault(code, []).append(index)
+
+    scores: List[Optional[float]] = [None] * len(codes)
+    percentiles: List[Optional[float]] = [None] * len(codes)
+    for indexes in indexes_by_group.values():
+        if len(indexes) < MIN_GROUP_SIZE:
+            continue
+        group_prices = sorted(prices[index] for index in indexes)
+        median = statistics.median(group_prices)
+        mad = statistics.median(abs(price - median) for price in group_prices)
+        if not mad:
+            continue
+        for index in indexes:
+            scores[index] = (median - prices[index]) / (MAD_SCALE * mad)
+            percentiles[index] = bisect.bisect_left(group_prices, prices[index]) / len(group_prices) * 100
+    return DealScores(scores, percentiles)
+
+
+def score_deals(groups: Sequence[Optional[Hashable]], prices: Sequence[Optional[int]]) -> DealScores:
+    """
+    Score every price against the median of the prices of its group, robust to outliers.
+
+    Prices without a group or price get ``None``, as do groups too small or uniform to judge.
+    """
+    # Groups are numbered in order of appearance.
+    codes_by_group: Dict[Hashable, int] = defaultdict(count().__next__)
+    scored = [
+        index for index, (group, price) in enumerate(zip(groups, prices))
+        if group is not None and price is not None
+    ]
+    codes = [codes_by_group[groups[index]] for index in scored]
+    scored_prices = [prices[index] for index in scored]
+
+    if not scored:
+        scored_scores = DealScores([], [])
+    elif NUMPY_IS_AVAILABLE:
+        scored_scores = _score_with_numpy(codes, scored_prices)
+    else:
+        scored_scores = _score_in_python(codes, scored_prices)
+
+    scores: List[Optional[float]] = [None] * len(prices)
+    percentiles: List[Optional[float]] = [None] * len(prices)
+    for index, score, percentile in zip(scored, *scored_scores):
+        scores[index] = score
+        percentiles[index] = percentile
+    return DealScores(scores, percentiles)
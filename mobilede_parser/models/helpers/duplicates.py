@@ -0,0 +1,143 @@
+import hashlib
+import random
+import re
+from array import array
+from importlib.util import find_spec
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# NumPy computes the signatures of a chunk of ads at once, the plain Python fallback gives the same ones.
+NUMPY_IS_AVAILABLE = find_spec('numpy') is not None
+
+NUM_PERMUTATIONS = 64
+# Ads are candidates if all rows of any band match, likely above a similarity of (1 / BANDS) ** (1 / ROWS) ~ 0.5.
+BANDS = 16
+ROWS = NUM_PERMUTATIONS // BANDS
+# Estimated Jaccard similarity of the features of two ads above which they are the same car.
+DUPLICATE_SIMILARITY = 0.8
+# Signatures that similar differ in few rows, so all rows of at least this many bands match.
+MIN_MATCHING_BANDS = BANDS - int(NUM_PERMUTATIONS * (1 - DUPLICATE_SIMILARITY))
+# Relisted cars often get a slightly different price, prices in the same step are the same feature.
+PRICE_STEP = 500
+
+MINHASH_PRIME = 4294967291  # Largest prime below 2 ** 32.
+_rng = random.Random(0x6d696e68)
+PERMUTATIONS = [(_rng.randrange(1, MINHASH_PRIME), _rng.randrange(MINHASH_PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+WORD_RE = re.compile(r'\w+')
+
+
+def _hash(value: str, digest_size: int = 4, signed: bool = False) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=digest_size).digest(), 'little', signed=signed)
+
+
+def get_features(name: str, description: Optional[str], price: Optional[int], image_url: Optional[str]) -> Set[str]:
+    """Words and word pairs of the title and vehicle data, the price step and the image name of an ad."""
+    words = WORD_RE.findall(f'{name} {description or ""}'.lower())
+    features = set(words)
+    features.update(f'{first} {second}' for first, second in zip(words, words[1:]))
+    if price is not None:
+        features.add(f'price:{price // PRICE_STEP}')
+    if image_url:
+        # The image id of ".../z/<id>/$_10.JPG", without the size.
+        parts = image_url.rsplit('/', 2)
+        features.add(f'image:{parts[-2] if len(parts) > 1 else parts[0]}')
+    return features
+
+
+def _get_signatures_with_numpy(hashed_features: List[List[int]]) -> List[array]:
+    import numpy as np
+
+    multipliers = np.array([a for a, _ in PERMUTATIONS], dtype=np.uint64)[:, None]
+    increments = np.array([b for _, b in PERMUTATIONS], dtype=np.uint64)[:, None]
+    signatures = []
+    for hashes in hashed_features:
+        # Both factors are below 2 ** 32, so products and sums fit in 64 bits.
+        values = (multipliers * np.array(hashes, dtype=np.uint64) + increments) % MINHASH_PRIME
+        signatures.append(array('I', values.min(axis=1).astype(np.uint32).tobytes()))
+    return signatures
+
+
+def _get_signatures_in_python(hashed_features: List[List[int]]) -> List[array]:
+    return [
+        array('I', [min([(a * value + b) % MINHASH_PRIME for value in hashes]) for a, b in PERMUTATIONS])
+        for hashes in hashed_features
+    ]
+
+
+def get_signatures(features: Iterable[Set[str]]) -> List[array]:
+    """MinHash signatures of feature sets, empty sets hash like a set of one empty feature."""
+    hashed_features = [[_hash(feature) for feature in ad_features] or [0] for ad_features in features]
+    if NUMPY_IS_AVAILABLE:
+        return _get_signatures_with_numpy(hashed_features)
+    return _get_signatures_in_python(hashed_features)
+
+
+def get_band_keys(signature: array) -> List[int]:
+    """One 64 bit key per band, ads sharing any key are candidate duplicates."""
+    return [
+        _hash(f'{band}:{signature[band * ROWS:(band + 1) * ROWS].tobytes().hex()}', digest_size=8, signed=True)
+        for band in range(BANDS)
+    ]
+
+
+def estimate_similarity(signature: array, other: array) -> float:
+    return sum(a == b for a, b in zip(signature, other)) / NUM_PERMUTATIONS
+
+
+class Candidate(NamedTuple):
+    site_id: int
+    canonical_id: Optional[int]
+    signature: array
+
+
+class Duplicate(NamedTuple):
+    index: int
+    canonical_id: int
+
+
+def find_duplicates(
+    signatures: List[array],
+    load_candidates: Callable[[Set[int]], Iterable[Candidate]],
+    site_ids: List[int],
+) -> List[Duplicate]:
+    """
+    Return which of the ads of ``signatures`` duplicate a stored ad or an earlier one of them.
+
+    ``load_candidates`` returns the stored ads having any of the given band keys. A duplicate's
+    canonical ad is the canonical ad of its most similar candidate, or that candidate itself.
+    """
+    keys = [get_band_keys(signature) for signature in signatures]
+    candidates_by_key: Dict[int, List[Candidate]] = {}
+    for candidate in load_candidates({key for ad_keys in keys for key in ad_keys}):
+        for key in get_band_keys(candidate.signature):
+            candidates_by_key.setdefault(key, []).append(candidate)
+
+    duplicates = []
+    for index, (signature, ad_keys) in enumerate(zip(signatures, keys)):
+        # Only candidates sharing enough bands can be similar enough, the others aren't compared.
+        matching_bands: Dict[int, int] = {}
+        candidates = {}
+        for key in ad_keys:
+            for candidate in candidates_by_key.get(key, ()):
+                matching_bands[candidate.site_id] = matching_bands.get(candidate.site_id, 0) + 1
+                candidates[candidate.site_id] = candidate
+        candidates.pop(site_ids[index], None)
+
+        best: Tuple[float, Optional[Candidate]] = (DUPLICATE_SIMILARITY, None)
+        for site_id, candidate in candidates.items():
+            if matching_bands[site_id] < MIN_MATCHING_BANDS:
+                continue
+            similarity = estimate_similarity(signature, candidate.signature)
+            if similarity >= best[0]:
+                best = (similarity, candidate)
+
+        candidate = best[1]
+        canonical_id = None
+        if candidate is not None:
+            canonical_id = candidate.canonical_id or candidate.site_id
+            duplicates.append(Duplicate(index, canonical_id))
+        # Later ads of the same batch may duplicate this one.
+        own = Candidate(site_ids[index], canonical_id, signature)
+        for key in ad_keys:
+            candidates_by_key.setdefault(key, []).append(own)
+    return duplicates
@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+from importlib.util import find_spec
+from typing import Iterable, Iterator
+
+# pyarrow takes long to import, so it is only imported by Parquet exports.
+PYARROW_IS_AVAILABLE = find_spec('pyarrow') is not None
+
+EXPORT_FIELDS = ('site_id', 'name', 'price', 'price_net', 'vat', 'date', 'description', 'image_url')
+ROWS_PER_CHUNK = 1000
+
+
+def chunked(rows: Iterable[tuple], size: int = ROWS_PER_CHUNK) -> Iterator[list]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def export_csv(rows: Iterable[tuple]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for chunk in chunked(rows):
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def export_jsonl(rows: Iterable[tuple]) -> Iterator[bytes]:
+    for chunk in chunked(rows):
+        yield ''.join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str, ensure_ascii=False) + '\n'
+            for row in chunk
+        ).encode('utf-8')
+
+
+class _StreamSink(io.RawIOBase):
+    """Write-only file collecting what was written since the last ``drain``."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def export_parquet(rows: Iterable[tuple]) -> Iterator[bytes]:
+    """Write every chunk of rows as its own row group, streaming the file as it is written."""
+    if not PYARROW_IS_AVAILABLE:
+        raise RuntimeError('Install "pyarrow" to export ads as Parquet.')
+    import pyarrow
+    import pyarrow.parquet
+
+    schema = pyarrow.schema([
+        ('site_id', pyarrow.int64()),
+        ('name', pyarrow.string()),
+        ('price', pyarrow.int64()),
+        ('price_net', pyarrow.int64()),
+        ('vat', pyarrow.int16()),
+        ('date', pyarrow.timestamp('us', tz='UTC')),
+        ('description', pyarrow.string()),
+        ('image_url', pyarrow.string()),
+    ])
+    sink = _StreamSink()
+    with pyarrow.parquet.ParquetWriter(sink, schema) as writer:
+        for chunk in chunked(rows, ROWS_PER_CHUNK * 10):
+            columns = list(zip(*chunk))
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    yield sink.drain()
+
+
+EXPORTERS = {
+    'csv': (export_csv, 'text/csv'),
+    'jsonl': (export_jsonl, 'application/x-ndjson'),
+    'parquet': (export_parquet, 'application/vnd.apache.parquet'),
+}
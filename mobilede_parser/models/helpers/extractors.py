@@ -0,0 +1,290 @@
+import re
+import unicodedata
+from contextlib import suppress
+from datetime import date, datetime
+from typing import List, NamedTuple, Optional
+
+from django.utils import timezone
+
+AD_ID_QUERY_RE = re.compile(r'[?&]id=(\d+)')
+RESULT_ITEM_CLASS_RE = re.compile(r'cBox-body--(?:resultitem|eyeCatcher)')
+VEHICLE_DATA_CLASS_RE = re.compile(r'^vehicle-data')
+TAGS_RE = re.compile(r'(?:\s+)?(?:</?.*?>)+(?:\s+)?')
+NON_DIGITS_RE = re.compile(r'\D+')
+VAT_JUNK_RE = re.compile(r'[^\d,.]')
+DETAIL_VAT_JUNK_RE = re.compile(r'[^\d,.]+|^[.,]|[.,]$')
+WHITESPACE_RE = re.compile(r'\s+')
+IMAGE_SIZE_RE = re.compile(r'\$_\d+')
+FIRST_REGISTRATION_RE = re.compile(r'\bFR (\d{1,2})/(\d{4})\b')
+MILEAGE_RE = re.compile(r'\b(\d[\d,.]*) km\b')
+POWER_RE = re.compile(r'\b(\d+) kW\b')
+
+IMAGE_SIZE = '$_10'
+NEW_HEADLINE_LABEL_CLASS = 'new-headline-label'
+
+ONLINE_SINCE_PREFIX = 'Ad online since '
+# Labels of the "fuels" and "transmissions" search parameter values, as the English site shows them.
+FUELS = {
+    'Petrol': 'PETROL',
+    'Diesel': 'DIESEL',
+    'Electric': 'ELECTRICITY',
+    'Hybrid (petrol/electric)': 'HYBRID',
+    'Hybrid (diesel/electric)': 'HYBRID_DIESEL',
+    'LPG': 'LPG',
+    'Natural Gas': 'CNG',
+    'Hydrogen': 'HYDROGENIUM',
+    'Ethanol (FFV, E85, etc.)': 'ETHANOL',
+}
+TRANSMISSIONS = {
+    'Manual gearbox': 'MANUAL_GEAR',
+    'Automatic transmission': 'AUTOMATIC_GEAR',
+    'Semi-automatic': 'SEMIAUTOMATIC_GEAR',
+}
+
+
+def _make_label_re(labels) -> re.Pattern:
+    # Labels are items of the comma separated vehicle data, longest first so prefixes don't win.
+    alternatives = '|'.join(re.escape(label) for label in sorted(labels, key=len, reverse=True))
+    return re.compile(rf'(?:^|(?<=, ))({alternatives})(?=,|$)')
+
+
+FUEL_RE = _make_label_re(FUELS)
+TRANSMISSION_RE = _make_label_re(TRANSMISSIONS)
+
+MONTHS = {
+    month: number
+    for number, month in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'),
+        start=1,
+    )
+}
+
+
+class ParsedAd(NamedTuple):
+    """Ad fields as parsed from a page, before they become an ``Ad`` row."""
+    site_id: Optional[int]
+    name: str
+    date: Optional[datetime]
+    price: int
+    vat: Optional[int]
+    description: Optional[str]
+    image_url: Optional[str]
+    mileage: Optional[int] = None
+    first_registration: Optional[date] = None
+    power_kw: Optional[int] = None
+    fuel: str = ''
+    transmission: str = ''
+
+
+class VehicleAttributes(NamedTuple):
+    mileage: Optional[int]
+    first_registration: Optional[date]
+    power_kw: Optional[int]
+    fuel: str
+    transmission: str
+
+
+def extract_vehicle_attributes(description: Optional[str]) -> VehicleAttributes:
+    """
+    Extract the attributes searches filter on from the vehicle data of a result item.
+
+    ``description`` is that data as flattened by ``SearchResultExtractor``, e.g.
+    "FR 03/2015, 123,400 km, 110 kW (150 hp) Saloon, Diesel, Manual gearbox, ...".
+    Attributes missing from it are ``None`` or empty.
+    """
+    description = description or ''
+    mileage = first_registration = power_kw = None
+    if match := MILEAGE_RE.search(description):
+        mileage = int(NON_DIGITS_RE.sub('', match.group(1)))
+    if match := FIRST_REGISTRATION_RE.search(description):
+        with suppress(ValueError):
+            first_registration = date(int(match.group(2)), int(match.group(1)), 1)
+    if match := POWER_RE.search(description):
+        power_kw = int(match.group(1))
+    fuel = FUEL_RE.search(description)
+    transmission = TRANSMISSION_RE.search(description)
+    return VehicleAttributes(
+        mileage=mileage,
+        first_registration=first_registration,
+        power_kw=power_kw,
+        fuel=FUELS[fuel.group(1)] if fuel else '',
+        transmission=TRANSMISSIONS[transmission.group(1)] if transmission else '',
+    )
+
+
+def normalize_image_url(image_url: str) -> str:
+    if image_url.startswith('//'):
+        image_url = 'https:' + image_url
+    return IMAGE_SIZE_RE.sub(IMAGE_SIZE, image_url)
+
+
+def parse_price(text: str) -> int:
+    return int(NON_DIGITS_RE.sub('', text))
+
+
+class OnlineSinceDateParser(object):
+    """
+    Parse "Ad online since Sep 13, 2021, 9:26 AM" headlines without strptime.
+
+    The timezone is looked up once per parser, not once per ad.
+    """
+
+    def __init__(self, tz=None):
+        self._timezone = tz
+
+    @property
+    def timezone(self):
+        if self._timezone is None:
+            self._timezone = timezone.get_current_timezone()
+        return self._timezone
+
+    def parse(self, text: str) -> datetime:
+        if not text.startswith(ONLINE_SINCE_PREFIX):
+            raise ValueError(f'"{text}" is not an "online since" date.')
+        try:
+            month, day, year, clock, meridiem = text[len(ONLINE_SINCE_PREFIX):].replace(',', ' ').split()
+            hour, minute = clock.split(':')
+            hour, minute = int(hour), int(minute)
+            month = MONTHS[month]
+        except (KeyError, ValueError):
+            raise ValueError(f'"{text}" is not an "online since" date.') from None
+
+        meridiem = meridiem.upper()
+        if not 1 <= hour <= 12 or meridiem not in ('AM', 'PM'):
+            raise ValueError(f'"{text}" is not an "online since" date.')
+        hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+
+        date = datetime(int(year), month, int(day), hour, minute)
+        return timezone.make_aware(date, self.timezone)
+
+
+class SearchResultExtractor(object):
+    """Extract ad fields from the result items of a search page."""
+
+    def __init__(self, date_parser: OnlineSinceDateParser = None):
+        self.date_parser = date_parser or OnlineSinceDateParser()
+
+    @staticmethod
+    def _make_soup(page: bytes):
+        # bs4 is only needed by crawlers, web processes never import it.
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(page, 'lxml')
+
+    def extract_num_of_pages(self, page: bytes) -> int:
+        pagination = self._make_soup(page).find('ul', 'pagination')
+        max_page = 0
+        try:
+            for li in pagination.find_all('li'):
+                with suppress(ValueError):
+                    if (cur_page := int(li.text)) > max_page:
+                        max_page = cur_page
+        except AttributeError:
+            return 1
+        return max_page
+
+    def extract_page(self, page: bytes) -> List[ParsedAd]:
+        soup = self._make_soup(page)
+        content = soup.find('div', 'cBox--resultList')
+        return [self.extract(item) for item in content.find_all('div', RESULT_ITEM_CLASS_RE)]
+
+    def extract(self, item) -> ParsedAd:
+        site_id = int(AD_ID_QUERY_RE.search(item.find('a').get('href')).group(1))
+        name, date = self._extract_headline(item)
+        price, vat = self._extract_price(item)
+        description = self._extract_description(item)
+
+        return ParsedAd(
+            site_id=site_id,
+            name=name,
+            date=date,
+            price=price,
+            vat=vat,
+            description=description,
+            image_url=self._extract_image_url(item),
+            **extract_vehicle_attributes(description)._asdict(),
+        )
+
+    def _extract_headline(self, item):
+        spans = [
+            span for span in item.find('div', 'headline-block').find_all('span')
+            if NEW_HEADLINE_LABEL_CLASS not in (span.get('class') or ())
+        ]
+        try:
+            name, date = spans
+            return name.text.strip(), self.date_parser.parse(date.text.strip())
+        except ValueError:
+            return spans[0].text.strip(), None
+
+    @staticmethod
+    def _extract_price(item):
+        price_block = item.find('div', 'price-block')
+        try:
+            price, vat = price_block.find_all('span')[:2]
+            price = parse_price(price.text)
+            vat = round(float(VAT_JUNK_RE.sub('', vat.text).replace(',', '.')))
+        except ValueError:
+            vat = None
+            price = parse_price(price_block.find('span').text)
+        return price, vat
+
+    @staticmethod
+    def _extract_description(item) -> str:
+        vehicle_data = item.find('div', VEHICLE_DATA_CLASS_RE)
+        if vehicle_data is None:
+            return ''
+        description = TAGS_RE.sub(' ', str(vehicle_data)).strip()
+        return unicodedata.normalize('NFKD', description)
+
+    @staticmethod
+    def _extract_image_url(item) -> str:
+        try:
+            img_el = item.find('div', 'image-block').find('img')
+            return normalize_image_url(img_el.get('src') or img_el.get('data-src'))
+        except AttributeError:
+            return ''
+
+
+class AdPageExtractor(object):
+    """
+    Extract ad fields from an ad details page.
+
+    The details page has no id, date or description, so those are left ``None``.
+    """
+
+    def extract_page(self, page: bytes) -> Optional[ParsedAd]:
+        soup = SearchResultExtractor._make_soup(page)
+        viewport = soup.find('div', 'viewport')
+        try:
+            main = viewport.div.contents[1].find_all('div', 'g-row', recursive=False)[-1]
+        except AttributeError:
+            return None
+
+        name = WHITESPACE_RE.sub(' ', main.find('h1', id='ad-title').text).strip()
+        price = parse_price(main.find('span', attrs={'data-testid': 'prime-price'}).text)
+
+        try:
+            vat = main.find('span', attrs={'data-testid': 'vat'}).text
+            vat = round(float(DETAIL_VAT_JUNK_RE.sub('', vat).replace(',', '.')))
+        except (AttributeError, ValueError):
+            vat = None
+
+        img_el = main.find('img')
+        try:
+            image_url = normalize_image_url(img_el.get('src') or img_el.get('data-src'))
+        except AttributeError:
+            image_url = ''
+
+        return ParsedAd(
+            site_id=None,
+            name=name,
+            date=None,
+            price=price,
+            vat=vat,
+            description=None,
+            image_url=image_url,
+        )
+
+
+search_result_extractor = SearchResultExtractor()
+ad_page_extractor = AdPageExtractor()
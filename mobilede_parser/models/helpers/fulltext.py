@@ -0,0 +1,144 @@
+from django.db import OperationalError, connections
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models import Q
+
+AD_TABLE = 'mobilede_parser_ad'
+FTS_TABLE = 'mobilede_parser_ad_fts'
+POSTGRESQL_INDEX = 'mobilede_parser_ad_fts'
+# The migration creating the index, see restore_full_text_index.
+FULL_TEXT_INDEX_MIGRATION = ('mobilede_parser', '0013_ad_full_text_index')
+POSTGRESQL_DOCUMENT = (
+    f"to_tsvector('simple', COALESCE({AD_TABLE}.name, '') || ' ' || COALESCE({AD_TABLE}.description, ''))"
+)
+POSTGRESQL_SETUP = (
+    f"CREATE INDEX IF NOT EXISTS {POSTGRESQL_INDEX} ON {AD_TABLE} "
+    f"USING gin ({POSTGRESQL_DOCUMENT.replace(AD_TABLE + '.', '')})"
+)
+POSTGRESQL_TEARDOWN = f"DROP INDEX IF EXISTS {POSTGRESQL_INDEX}"
+
+SQLITE_TABLE_SETUP = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"name, description, content='{AD_TABLE}', content_rowid='site_id')"
+)
+SQLITE_TRIGGERS = {
+    f'{FTS_TABLE}_ai': (
+        f"AFTER INSERT ON {AD_TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, name, description) VALUES (new.site_id, new.name, new.description); "
+        f"END"
+    ),
+    f'{FTS_TABLE}_ad': (
+        f"AFTER DELETE ON {AD_TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) "
+        f"VALUES ('delete', old.site_id, old.name, old.description); "
+        f"END"
+    ),
+    # Only changes of the indexed columns, crawls update prices and timestamps far more often.
+    f'{FTS_TABLE}_au': (
+        f"AFTER UPDATE OF name, description ON {AD_TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) "
+        f"VALUES ('delete', old.site_id, old.name, old.description); "
+        f"INSERT INTO {FTS_TABLE}(rowid, name, description) VALUES (new.site_id, new.name, new.description); "
+        f"END"
+    ),
+}
+
+_sqlite_fts_is_available = {}
+
+
+def create_full_text_index(apps, schema_editor):
+    """
+    Create the full text index over ad names and descriptions, for ``RunPython`` in migrations.
+
+    On PostgreSQL this is a GIN index over a ``tsvector`` expression. On SQLite it is
+    an FTS5 table kept in sync by triggers, skipped if SQLite is built without FTS5.
+    Triggers dropped by later migrations are created again by ``restore_full_text_index``.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute(POSTGRESQL_SETUP)
+        return
+    if connection.vendor != 'sqlite':
+        return
+
+    try:
+        schema_editor.execute(SQLITE_TABLE_SETUP)
+    except OperationalError:
+        # SQLite built without FTS5.
+        return
+    for name, definition in SQLITE_TRIGGERS.items():
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        schema_editor.execute(f'CREATE TRIGGER {name} {definition}')
+    # Ads changed while the triggers were missing.
+    schema_editor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    _sqlite_fts_is_available.pop(connection.alias, None)
+
+
+def drop_full_text_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute(POSTGRESQL_TEARDOWN)
+    elif connection.vendor == 'sqlite':
+        for name in SQLITE_TRIGGERS:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+        _sqlite_fts_is_available.pop(connection.alias, None)
+
+
+def _sqlite_full_text_index_is_complete(connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE (type = 'table' AND name = %s) OR (type = 'trigger' AND tbl_name = %s)",
+            [FTS_TABLE, AD_TABLE],
+        )
+        names = {name for name, in cursor.fetchall()}
+    return names >= {FTS_TABLE, *SQLITE_TRIGGERS}
+
+
+def restore_full_text_index(using: str):
+    """
+    Create the SQLite full text index again where migrations dropped it, after every ``migrate``.
+
+    SQLite migrations rebuild the ad table on most schema changes, which drops its
+    triggers. Nothing is done before the migration creating the index is applied.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite' or _sqlite_full_text_index_is_complete(connection):
+        return
+    app_label, migration_name = FULL_TEXT_INDEX_MIGRATION
+    if not MigrationRecorder(connection).migration_qs.filter(app=app_label, name=migration_name).exists():
+        return
+    with connection.schema_editor() as schema_editor:
+        create_full_text_index(None, schema_editor)
+
+
+def sqlite_fts_is_available(connection) -> bool:
+    if connection.alias not in _sqlite_fts_is_available:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = %s", [FTS_TABLE])
+            _sqlite_fts_is_available[connection.alias] = bool(cursor.fetchone()[0])
+    return _sqlite_fts_is_available[connection.alias]
+
+
+def to_fts5_query(query: str) -> str:
+    """Quote every word, so user input is matched as plain terms that must all occur."""
+    return ' '.join('"{}"'.format(word.replace('"', '""')) for word in query.split())
+
+
+def filter_full_text(queryset, query: str):
+    """Filter ads by words in their name or description, using the database's full text index."""
+    if not query.split():
+        return queryset
+
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        return queryset.extra(where=[f"{POSTGRESQL_DOCUMENT} @@ plainto_tsquery('simple', %s)"], params=[query])
+    if connection.vendor == 'sqlite' and sqlite_fts_is_available(connection):
+        return queryset.extra(
+            where=[f'{AD_TABLE}.site_id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)'],
+            params=[to_fts5_query(query)],
+        )
+
+    for word in query.split():
+        queryset = queryset.filter(Q(name__icontains=word) | Q(description__icontains=word))
+    return queryset
@@ -0,0 +1,102 @@
+import random
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from django.conf import settings
+
+THROTTLED_STATUS_CODES = (403, 429)
+
+BROWSER_HEADERS = {
+    'chromium': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9,de;q=0.8',
+    },
+    'firefox': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.7,de;q=0.3',
+    },
+}
+
+
+class HeaderProfile(NamedTuple):
+    index: int
+    user_agent: str
+    headers: Dict[str, str]
+
+
+def build_profile(index: int, user_agent: str) -> HeaderProfile:
+    browser = 'firefox' if 'Firefox/' in user_agent else 'chromium'
+    headers = {'User-Agent': user_agent, **BROWSER_HEADERS[browser]}
+    return HeaderProfile(index, user_agent, headers)
+
+
+def load_user_agents(path) -> List[str]:
+    """Read one user agent per line, skipping blank lines and ``#`` comments."""
+    with open(path, encoding='utf-8') as file:
+        return [line.strip() for line in file if line.strip() and not line.startswith('#')]
+
+
+class HeaderProfileRotator(object):
+    """
+    Hands out request header profiles weighted by how well they did in this process.
+
+    A profile's weight is its smoothed success rate. A profile answered with
+    403 or 429 is left out for ``cooldown`` seconds, and its failures keep
+    weighing on it after that. Profiles are read from ``path`` on first use.
+    """
+
+    def __init__(self, path, cooldown: float):
+        self.path = path
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._profiles: Optional[List[HeaderProfile]] = None
+        self._successes: List[int] = []
+        self._failures: List[int] = []
+        self._demoted_until: List[float] = []
+
+    @property
+    def profiles(self) -> List[HeaderProfile]:
+        if self._profiles is None:
+            with self._lock:
+                if self._profiles is None:
+                    user_agents = load_user_agents(self.path)
+                    self._successes = [0] * len(user_agents)
+                    self._failures = [0] * len(user_agents)
+                    self._demoted_until = [0.0] * len(user_agents)
+                    self._profiles = [build_profile(index, user_agent) for index, user_agent in enumerate(user_agents)]
+        return self._profiles
+
+    def _weight(self, index: int) -> float:
+        return (self._successes[index] + 1) / (self._successes[index] + self._failures[index] + 2)
+
+    def choose(self) -> HeaderProfile:
+        profiles = self.profiles
+        now = time.monotonic()
+        candidates = [profile for profile in profiles if self._demoted_until[profile.index] <= now] or profiles
+        weights = [self._weight(profile.index) for profile in candidates]
+        return random.choices(candidates, weights)[0]
+
+    def report(self, profile: HeaderProfile, status_code: int):
+        with self._lock:
+            if status_code in THROTTLED_STATUS_CODES:
+                self._failures[profile.index] += 1
+                self._demoted_until[profile.index] = time.monotonic() + self.cooldown
+            elif status_code < 400:
+                self._successes[profile.index] += 1
+
+    def stats(self) -> List[Dict]:
+        """Return the profiles that were used, best first."""
+        used = [profile for profile in self.profiles if self._successes[profile.index] or self._failures[profile.index]]
+        used.sort(key=lambda profile: self._weight(profile.index), reverse=True)
+        return [
+            {
+                'user_agent': profile.user_agent,
+                'successes': self._successes[profile.index],
+                'failures': self._failures[profile.index],
+            }
+            for profile in used
+        ]
+
+
+header_profiles = HeaderProfileRotator(settings.PARSER_USER_AGENTS_FILE, settings.PARSER_HEADER_PROFILE_COOLDOWN)
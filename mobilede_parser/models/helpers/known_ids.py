@@ -0,0 +1,115 @@
+import bisect
+import heapq
+import mmap
+import os
+import random
+import struct
+import threading
+from array import array
+from typing import Callable, Iterable, Optional, Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+
+KNOWN_AD_IDS_GENERATION_KEY = 'mobilede_parser:known-ad-ids:generation'
+
+FILE_MAGIC = b'ADIDS001'
+# Magic, generation and number of ids, followed by the sorted ids as int64.
+FILE_HEADER = struct.Struct('<8sqq')
+
+
+class KnownIds(object):
+    """
+    Set of ids in a sorted ``array('q')``, 8 bytes per id.
+
+    Ids added later are kept in a small set until there are ``merge_threshold``
+    of them, then merged into the array. Only ever answers ``True`` for ids that
+    were stored at ``generation``, so ids missing from it must be looked up.
+    """
+    merge_threshold = 50000
+
+    def __init__(self, ids: Sequence[int], generation: int):
+        self._ids = ids
+        self._added = set()
+        self.generation = generation
+
+    def __contains__(self, item: int) -> bool:
+        if item in self._added:
+            return True
+        index = bisect.bisect_left(self._ids, item)
+        return index < len(self._ids) and self._ids[index] == item
+
+    def __len__(self):
+        return len(self._ids) + len(self._added)
+
+    def add(self, ids: Iterable[int]):
+        self._added.update(ids)
+        if len(self._added) >= self.merge_threshold:
+            self._ids = array('q', heapq.merge(self._ids, sorted(self._added)))
+            self._added = set()
+
+    def save(self, path):
+        """Write the ids to ``path`` atomically, for other processes to map with ``load``."""
+        ids = array('q', heapq.merge(self._ids, sorted(self._added)))
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(FILE_HEADER.pack(FILE_MAGIC, self.generation, len(ids)))
+            ids.tofile(file)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path) -> Optional['KnownIds']:
+        """Map the ids saved at ``path`` read-only, ``None`` if there is no valid file."""
+        try:
+            with open(path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(mapped) < FILE_HEADER.size:
+            return None
+        magic, generation, count = FILE_HEADER.unpack_from(mapped)
+        if magic != FILE_MAGIC or len(mapped) != FILE_HEADER.size + count * 8:
+            return None
+        return cls(memoryview(mapped)[FILE_HEADER.size:].cast('q'), generation)
+
+
+_known_ad_ids: Optional[KnownIds] = None
+_known_ad_ids_lock = threading.Lock()
+
+
+def get_known_ad_ids_generation() -> int:
+    # A random token rather than a counter, so a cleared cache can't bring back an old generation.
+    return cache.get_or_set(KNOWN_AD_IDS_GENERATION_KEY, lambda: random.getrandbits(62), None)
+
+
+def get_known_ad_ids(load_ids: Callable[[], Iterable[int]]) -> KnownIds:
+    """
+    Return the ids of stored ads, as known to this process.
+
+    The ids are read once per generation, from ``PARSER_KNOWN_AD_IDS_FILE`` if it was
+    written at the current generation, otherwise with ``load_ids`` (which must yield them
+    sorted), and the file is rewritten then. Deleted ads stay known, saving links to one
+    fails and the saver starts a new generation with ``invalidate_known_ad_ids``.
+    """
+    global _known_ad_ids
+    generation = get_known_ad_ids_generation()
+    known_ids = _known_ad_ids
+    if known_ids is not None and known_ids.generation == generation:
+        return known_ids
+
+    with _known_ad_ids_lock:
+        if _known_ad_ids is not None and _known_ad_ids.generation == generation:
+            return _known_ad_ids
+
+        path = settings.PARSER_KNOWN_AD_IDS_FILE
+        known_ids = KnownIds.load(path) if path else None
+        if known_ids is None or known_ids.generation != generation:
+            known_ids = KnownIds(array('q', load_ids()), generation)
+            if path:
+                known_ids.save(path)
+        _known_ad_ids = known_ids
+    return known_ids
+
+
+def invalidate_known_ad_ids():
+    cache.set(KNOWN_AD_IDS_GENERATION_KEY, random.getrandbits(62), None)
@@ -1,12 +1,40 @@
-import requests
-from ..functions import get_headers_for_request
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from ..headers import HeaderProfile, header_profiles
+from ..transport import DEFAULT_TRANSPORT, canonical_url, get_session, page_flights
+
+if TYPE_CHECKING:
+    import requests
 
 
 class SessionMixin(object):
-    def __init__(self):
-        self.__session = requests.Session()
+    transport_name = DEFAULT_TRANSPORT
+    _chosen_header_profile: HeaderProfile = None
+
+    @property
+    def _session(self) -> 'requests.Session':
+        return get_session(self.transport_name)
 
     @property
-    def _session(self) -> requests.Session:
-        self.__session.headers.update(get_headers_for_request())
-        return self.__session
+    def _header_profile(self) -> HeaderProfile:
+        """Header profile of this instance, chosen once so all requests of a crawl look alike."""
+        if self._chosen_header_profile is None:
+            self._chosen_header_profile = header_profiles.choose()
+        return self._chosen_header_profile
+
+    def _fetch(self, url: str, session: 'requests.Session' = None, **kwargs) -> 'requests.Response':
+        if session is None:
+            session = self._session
+        profile = self._header_profile
+        response = session.get(url, headers=profile.headers, **kwargs)
+        header_profiles.report(profile, response.status_code)
+        return response
+
+    @staticmethod
+    def _coalesce(kind: str, url: str, fn: Callable[[], Any], params: Optional[Dict[str, object]] = None) -> Any:
+        """
+        Return ``fn()``, or the result of a call already in flight for the same ``kind`` and URL.
+
+        Searches and refresh jobs running at the same time then fetch and parse each page once.
+        """
+        return page_flights.do((kind, canonical_url(url, params)), fn)
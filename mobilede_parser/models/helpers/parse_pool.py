@@ -0,0 +1,27 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from .extractors import ParsedAd, ad_page_extractor, search_result_extractor
+
+
+def _init_worker():
+    # Under the "spawn" start method workers start with unconfigured Django.
+    import django
+    django.setup()
+
+
+def parse_search_page(page: bytes) -> List[ParsedAd]:
+    """Parse a search result page in a worker process."""
+    return search_result_extractor.extract_page(page)
+
+
+def parse_ad_page(page: bytes) -> Optional[ParsedAd]:
+    """Parse an ad details page in a worker process, its ``site_id`` is set by the caller."""
+    return ad_page_extractor.extract_page(page)
+
+
+def create_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+    )
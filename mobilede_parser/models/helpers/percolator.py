@@ -0,0 +1,291 @@
+import bisect
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Parameters changing how results are shown, not which ads they contain.
+PRESENTATION_PARAMETERS = frozenset((
+    'grossPrice',
+    'isSearchRequest',
+    'lang',
+    'od',
+    'pageNumber',
+    'sb',
+    'sortOption.sortBy',
+    'sortOption.sortOrder',
+))
+# Parameters identifying the user's session on the site.
+SESSION_PARAMETERS = frozenset(('sset', 'ssid'))
+# Vehicle categories of "scopeId" ads are matched in, crawled ads are all cars.
+SUPPORTED_SCOPES = frozenset(('C',))
+
+
+class UnsupportedSearchError(ValueError):
+    pass
+
+
+def parse_number(values: List[str], upper: bool) -> int:
+    return int(values[0])
+
+
+def parse_power(values: List[str], upper: bool) -> int:
+    """Power in kW of ``[number, unit]`` values, the unit being "KW" or "PS" (hp)."""
+    power = int(values[0])
+    unit = values[1].upper() if len(values) > 1 else 'KW'
+    if unit == 'PS':
+        return round(power / 1.36)
+    if unit != 'KW':
+        raise ValueError(f'Unknown power unit "{unit}".')
+    return power
+
+
+def parse_registration_date(values: List[str]) -> date:
+    value = values[0]
+    if len(value) == 4:
+        return date(int(value), 1, 1)
+    return date.fromisoformat(value[:10])
+
+
+def parse_registration(values: List[str], upper: bool) -> date:
+    """Registration date of "YYYY" or "YYYY-MM-DD" values, a year including all of its months as an upper bound."""
+    registration = parse_registration_date(values)
+    if upper and len(values[0]) == 4:
+        registration = registration.replace(month=12, day=31)
+    return registration
+
+
+class RangeAttribute(NamedTuple):
+    """Ad attribute bounded by a pair of search parameters, both inclusive, whose values ``parse`` converts."""
+    attribute: str
+    min_parameter: str
+    max_parameter: str
+    parse: Callable[[List[str], bool], Any] = parse_number
+
+
+class CategoricalAttribute(NamedTuple):
+    """Ad attribute restricted to the values of a multiple value search parameter."""
+    attribute: str
+    parameter: str
+
+
+class RequiredAttribute(NamedTuple):
+    """Ad attribute that must be set when a search parameter is "true"."""
+    attribute: str
+    parameter: str
+
+
+RANGE_ATTRIBUTES = (
+    RangeAttribute('price', 'minPrice', 'maxPrice'),
+    RangeAttribute('mileage', 'minMileage', 'maxMileage'),
+    RangeAttribute('power_kw', 'minPowerAsArray', 'maxPowerAsArray', parse_power),
+    RangeAttribute('first_registration', 'minFirstRegistrationDate', 'maxFirstRegistrationDate', parse_registration),
+)
+CATEGORICAL_ATTRIBUTES = (
+    CategoricalAttribute('fuel', 'fuels'),
+    CategoricalAttribute('transmission', 'transmissions'),
+)
+REQUIRED_ATTRIBUTES = (
+    # Ads showing a VAT rate are those of sellers deducting it.
+    RequiredAttribute('vat', 'vatable'),
+)
+
+# Ad attributes searches are matched on.
+MATCHED_ATTRIBUTES = tuple(
+    attribute.attribute for attribute in RANGE_ATTRIBUTES + CATEGORICAL_ATTRIBUTES + REQUIRED_ATTRIBUTES
+)
+SUPPORTED_PARAMETERS = PRESENTATION_PARAMETERS.union(
+    SESSION_PARAMETERS,
+    ('scopeId',),
+    *((attribute.min_parameter, attribute.max_parameter) for attribute in RANGE_ATTRIBUTES),
+    (attribute.parameter for attribute in CATEGORICAL_ATTRIBUTES),
+    (attribute.parameter for attribute in REQUIRED_ATTRIBUTES),
+)
+
+
+def _get_values(parameters: dict, parameter: str) -> List[str]:
+    value = parameters.get(parameter)
+    if value is None or value == '':
+        return []
+    return value if type(value) is list else [value]
+
+
+def _get_bound(parameters: dict, attribute: RangeAttribute, upper: bool) -> Optional[Any]:
+    parameter = attribute.max_parameter if upper else attribute.min_parameter
+    values = _get_values(parameters, parameter)
+    if not values:
+        return None
+    try:
+        return attribute.parse(values, upper)
+    except ValueError:
+        raise UnsupportedSearchError(f'"{parameter}" has an unsupported value.')
+
+
+def _is_required(parameters: dict, attribute: RequiredAttribute) -> bool:
+    values = _get_values(parameters, attribute.parameter)
+    if not values or values == ['false']:
+        return False
+    if values == ['true']:
+        return True
+    raise UnsupportedSearchError(f'"{attribute.parameter}" has an unsupported value.')
+
+
+class _RangeIndex(object):
+    """
+    Searches bounding one attribute, as sorted bounds with cumulative bitmasks of searches.
+
+    The searches whose lower bound is at most a value are a prefix of the lower bounds in
+    ascending order, those whose upper bound is at least the value a suffix of the upper
+    bounds, so a lookup is two bisections and an ``and`` of two precomputed masks.
+    """
+
+    def __init__(self, bounds: List[Tuple[int, Optional[Any], Optional[Any]]], all_mask: int):
+        lows = sorted((low, bit) for bit, low, _ in bounds if low is not None)
+        highs = sorted((high, bit) for bit, _, high in bounds if high is not None)
+        self._low_values = [low for low, _ in lows]
+        self._high_values = [high for high, _ in highs]
+
+        # _low_masks[i] has the searches of the first i lower bounds.
+        self._low_masks = [0]
+        for _, bit in lows:
+            self._low_masks.append(self._low_masks[-1] | bit)
+        # _high_masks[i] has the searches of the upper bounds from the i-th on.
+        self._high_masks = [0]
+        for _, bit in reversed(highs):
+            self._high_masks.append(self._high_masks[-1] | bit)
+        self._high_masks.reverse()
+
+        self._without_low = all_mask & ~self._low_masks[-1]
+        self._without_high = all_mask & ~self._high_masks[0]
+
+    def match(self, value: Optional[Any]) -> int:
+        if value is None:
+            return self._without_low & self._without_high
+        low_mask = self._low_masks[bisect.bisect_right(self._low_values, value)]
+        high_mask = self._high_masks[bisect.bisect_left(self._high_values, value)]
+        return (self._without_low | low_mask) & (self._without_high | high_mask)
+
+
+class _CategoricalIndex(object):
+    """Inverted index from attribute values to the bitmask of searches accepting them."""
+
+    def __init__(self, values: List[Tuple[int, List[str]]], all_mask: int):
+        self._masks: Dict[str, int] = {}
+        restricted = 0
+        for bit, accepted in values:
+            if accepted:
+                restricted |= bit
+            for value in accepted:
+                self._masks[value] = self._masks.get(value, 0) | bit
+        self._unrestricted = all_mask & ~restricted
+
+    def match(self, value: Optional[Any]) -> int:
+        if value is None or value == '':
+            return self._unrestricted
+        return self._unrestricted | self._masks.get(str(value), 0)
+
+
+class _RequiredIndex(object):
+    """Bitmask of the searches requiring an attribute to be set, the others accept any value."""
+
+    def __init__(self, required: List[Tuple[int, bool]], all_mask: int):
+        self._optional = all_mask
+        for bit, is_required in required:
+            if is_required:
+                self._optional &= ~bit
+        self._all_mask = all_mask
+
+    def match(self, value: Optional[Any]) -> int:
+        return self._optional if value is None or value == '' else self._all_mask
+
+
+class Percolator(object):
+    """
+    Match ads against the parameters of many searches at once.
+
+    Every search is a bit of a mask, each supported attribute an index returning the mask of
+    searches accepting a value, and an ad matches the searches left after ``and``-ing the
+    masks of its attributes. Searches with parameters the ads can't be checked against
+    (e.g. makes or features) are left out and reported in ``unsupported_search_ids``.
+    """
+
+    def __init__(self, searches: Iterable[Tuple[int, dict]]):
+        self.search_ids: List[int] = []
+        self.unsupported_search_ids: List[int] = []
+        bounds = {attribute: [] for attribute in RANGE_ATTRIBUTES}
+        values = {attribute: [] for attribute in CATEGORICAL_ATTRIBUTES}
+        required = {attribute: [] for attribute in REQUIRED_ATTRIBUTES}
+
+        for search_id, parameters in searches:
+            try:
+                self._check_supported(parameters)
+                search_bounds = {
+                    attribute: (_get_bound(parameters, attribute, False), _get_bound(parameters, attribute, True))
+                    for attribute in RANGE_ATTRIBUTES
+                }
+                search_required = {attribute: _is_required(parameters, attribute) for attribute in REQUIRED_ATTRIBUTES}
+            except UnsupportedSearchError:
+                self.unsupported_search_ids.append(search_id)
+                continue
+            bit = 1 << len(self.search_ids)
+            self.search_ids.append(search_id)
+            for attribute, (low, high) in search_bounds.items():
+                bounds[attribute].append((bit, low, high))
+            for attribute in CATEGORICAL_ATTRIBUTES:
+                values[attribute].append((bit, _get_values(parameters, attribute.parameter)))
+            for attribute, is_required in search_required.items():
+                required[attribute].append((bit, is_required))
+
+        self._all_mask = (1 << len(self.search_ids)) - 1
+        self._indexes = [
+            (attribute.attribute, _RangeIndex(attribute_bounds, self._all_mask))
+            for attribute, attribute_bounds in bounds.items()
+        ] + [
+            (attribute.attribute, _CategoricalIndex(attribute_values, self._all_mask))
+            for attribute, attribute_values in values.items()
+        ] + [
+            (attribute.attribute, _RequiredIndex(attribute_required, self._all_mask))
+            for attribute, attribute_required in required.items()
+        ]
+
+    @staticmethod
+    def _check_supported(parameters: dict):
+        for parameter in parameters.keys() - SUPPORTED_PARAMETERS:
+            if _get_values(parameters, parameter):
+                raise UnsupportedSearchError(f'"{parameter}" can\'t be matched.')
+        if any(scope not in SUPPORTED_SCOPES for scope in _get_values(parameters, 'scopeId')):
+            raise UnsupportedSearchError('"scopeId" has an unsupported value.')
+
+    def match(self, ad) -> List[int]:
+        """Ids of the searches ``ad`` (a ``ParsedAd`` or an ``Ad``) matches."""
+        mask = self._all_mask
+        for attribute, index in self._indexes:
+            mask &= index.match(getattr(ad, attribute))
+            if not mask:
+                return []
+
+        search_ids = []
+        while mask:
+            bit = mask & -mask
+            search_ids.append(self.search_ids[bit.bit_length() - 1])
+            mask ^= bit
+        return search_ids
+
+
+_percolator: Optional[Percolator] = None
+_percolator_state = None
+_percolator_lock = threading.Lock()
+
+
+def get_percolator(state: Any, load_searches: Callable[[], Iterable[Tuple[int, dict]]]) -> Percolator:
+    """
+    Return the percolator of the searches ``load_searches`` yields as ``(id, parameters)``.
+
+    It is compiled once per process and again whenever ``state`` (anything changing with
+    the searches) differs from the one it was compiled at.
+    """
+    global _percolator, _percolator_state
+    with _percolator_lock:
+        if _percolator is None or _percolator_state != state:
+            _percolator = Percolator(load_searches())
+            _percolator_state = state
+        return _percolator
@@ -0,0 +1,87 @@
+from typing import Dict, Iterable, List, NamedTuple
+
+from django.db import connections, transaction
+
+from .bases.QueryParametersModelBase import ParametersValidationError
+from .versions import forget_user_search_ids
+
+DB_CHUNK_SIZE = 5000
+
+
+class SearchImportResult(NamedTuple):
+    # (line number, search id) pairs, line numbers start at 1.
+    created: List[tuple]
+    duplicates: List[tuple]
+    errors: List[tuple]
+
+
+def parse_import_line(line: str) -> tuple:
+    """Split an import line into its optional name and URL, the URL being the last word."""
+    name, _, url = line.strip().rpartition(' ')
+    return name.strip(), url
+
+
+def _get_search_ids_by_parameters(search_model) -> Dict[str, int]:
+    return {
+        search_model.get_canonical_parameters(parameters): search_id
+        for search_id, parameters in search_model.objects.order_by('pk').values_list('pk', 'parameters').iterator()
+    }
+
+
+def import_searches(search_model, lines: Iterable[str], subscriber=None) -> SearchImportResult:
+    """
+    Create searches from lines of mobile.de search URLs, each optionally preceded by a name.
+
+    Invalid lines are reported and skipped. URLs with the same parameters as an existing
+    search, or as an earlier line, apart from session parameters, are reported as duplicates
+    of it. Names are cut to the length of ``Search.name``. ``subscriber`` is subscribed to
+    the searches of all valid lines.
+    """
+    errors = []
+    new_searches: Dict[str, tuple] = {}
+    duplicate_lines: Dict[int, str] = {}
+    search_ids = _get_search_ids_by_parameters(search_model)
+    name_max_length = search_model._meta.get_field('name').max_length
+
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        name, url = parse_import_line(line)
+        try:
+            parameters = search_model.parameters_from_url(url)
+        except ParametersValidationError as e:
+            errors.append((line_num, str(e)))
+            continue
+        except ValueError:
+            errors.append((line_num, 'Invalid URL.'))
+            continue
+
+        key = search_model.get_canonical_parameters(parameters)
+        if key in search_ids or key in new_searches:
+            duplicate_lines[line_num] = key
+        else:
+            name = (name or url)[:name_max_length]
+            new_searches[key] = (line_num, search_model(name=name, parameters=parameters))
+
+    with transaction.atomic():
+        search_model.objects.bulk_create([search for _, search in new_searches.values()], DB_CHUNK_SIZE)
+        if not connections[search_model.objects.db].features.can_return_rows_from_bulk_insert:
+            search_ids = _get_search_ids_by_parameters(search_model)
+        else:
+            search_ids.update({key: search.pk for key, (_, search) in new_searches.items()})
+
+        created = sorted((line_num, search_ids[key]) for key, (line_num, _) in new_searches.items())
+        duplicates = sorted((line_num, search_ids[key]) for line_num, key in duplicate_lines.items())
+
+        if subscriber is not None:
+            field = search_model._meta.get_field('subscribers')
+            through_model = field.remote_field.through
+            subscriptions = [
+                through_model(**{f'{field.m2m_field_name()}_id': search_id, f'{field.m2m_reverse_field_name()}_id': subscriber.pk})
+                for search_id in {search_id for _, search_id in created + duplicates}
+            ]
+            through_model.objects.bulk_create(subscriptions, DB_CHUNK_SIZE, ignore_conflicts=True)
+            # bulk_create sends no m2m_changed, so drop the cached search ids of the subscriber here.
+            forget_user_search_ids([subscriber.pk])
+
+    return SearchImportResult(created, duplicates, errors)
@@ -0,0 +1,39 @@
+import bisect
+from typing import List, Optional, Sequence
+
+# Lower bounds of the price histogram buckets, the last bucket has no upper bound.
+PRICE_HISTOGRAM_BOUNDS = (
+    0, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000, 12500, 15000, 17500,
+    20000, 25000, 30000, 35000, 40000, 50000, 60000, 70000, 80000, 100000, 150000, 200000,
+)
+
+
+def empty_price_histogram() -> List[int]:
+    return [0] * len(PRICE_HISTOGRAM_BOUNDS)
+
+
+def get_price_bucket(price: int) -> int:
+    return max(bisect.bisect_right(PRICE_HISTOGRAM_BOUNDS, price) - 1, 0)
+
+
+def approximate_price_percentile(histogram: Sequence[int], percentile: float) -> Optional[int]:
+    """
+    Estimate the price at ``percentile`` (0-100) from a price histogram.
+
+    Prices are assumed to be spread evenly over their bucket, in the open last bucket
+    its lower bound is returned. ``None`` if the histogram is empty.
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    rank = total * percentile / 100
+    seen = 0
+    for bucket, count in enumerate(histogram):
+        if count and seen + count >= rank:
+            low = PRICE_HISTOGRAM_BOUNDS[bucket]
+            if bucket + 1 == len(PRICE_HISTOGRAM_BOUNDS):
+                return low
+            high = PRICE_HISTOGRAM_BOUNDS[bucket + 1]
+            return round(low + (high - low) * (rank - seen) / count)
+        seen += count
+    return PRICE_HISTOGRAM_BOUNDS[-1]
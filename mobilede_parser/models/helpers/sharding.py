@@ -0,0 +1,62 @@
+import logging
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Inclusive (minPrice, maxPrice) bounds of a shard, None for no upper bound.
+PriceRange = Tuple[int, Optional[int]]
+
+# Where an open-ended price range is first split.
+OPEN_RANGE_SPLIT_PRICE = 50000
+# Narrower ranges aren't split any further, even if they still fill every page.
+MIN_PRICE_RANGE_WIDTH = 100
+
+
+def split_price_range(price_range: PriceRange) -> Optional[Tuple[PriceRange, PriceRange]]:
+    """Split a price range into two disjoint halves, ``None`` if it is too narrow to split."""
+    low, high = price_range
+    if high is None:
+        middle = max(low * 2, OPEN_RANGE_SPLIT_PRICE)
+    elif high - low < MIN_PRICE_RANGE_WIDTH:
+        return None
+    else:
+        middle = (low + high) // 2
+    return (low, middle), (middle + 1, high)
+
+
+def plan_price_shards(
+    count_pages: Callable[[PriceRange], int],
+    price_range: PriceRange,
+    max_pages: int,
+    num_of_pages: int = None,
+    max_shards: int = 256,
+) -> List[PriceRange]:
+    """
+    Split ``price_range`` until every part has fewer than ``max_pages`` result pages.
+
+    A search showing ``max_pages`` pages may have had more results cut off, so ranges
+    reaching it are split in two and counted again with ``count_pages``. ``num_of_pages``
+    is the known page count of the whole range, if any. Returns disjoint ranges in price order.
+
+    Open-ended ranges can always be split, so the site ignoring price bounds would make
+    planning endless: ranges are split widest first into at most ``max_shards`` parts.
+    """
+    shards = []
+    pending = deque([(price_range, num_of_pages)])
+    while pending:
+        price_range, num_of_pages = pending.popleft()
+        if num_of_pages is None:
+            num_of_pages = count_pages(price_range)
+        halves = split_price_range(price_range) if num_of_pages >= max_pages else None
+        if halves is not None and len(shards) + len(pending) + len(halves) > max_shards:
+            logger.warning(
+                'Price range %s still reaches %d pages, it is not split beyond %d ranges.',
+                price_range, num_of_pages, max_shards,
+            )
+            halves = None
+        if halves is None:
+            shards.append(price_range)
+        else:
+            pending.extend((half, None) for half in halves)
+    return sorted(shards)
@@ -0,0 +1,201 @@
+import fcntl
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.conf import settings
+
+from .transport import get_session
+
+THUMBNAIL_TRANSPORT = 'thumbnails'
+THUMBNAIL_TIMEOUT = 10
+# Larger responses aren't thumbnails and aren't stored.
+MAX_THUMBNAIL_SIZE = 2 * 1024 * 1024
+# Eviction deletes files down to this share of the size limit, so it doesn't run on every stored file.
+EVICTION_TARGET = 0.9
+
+SUFFIXES = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+}
+
+
+class ThumbnailStore(object):
+    """
+    Content-addressed store of thumbnail files.
+
+    Files are named after the SHA-256 of their content, below a directory of the first two
+    hex digits, so an image shared by several ads is stored once and a name never changes
+    content. Storing or reusing a file updates its modification time; when the store grows
+    past ``max_size`` the files least recently stored or reused are deleted. Several
+    processes may use the same directory, eviction is serialised with ``flock``.
+    """
+
+    def __init__(self, root, max_size: int):
+        self.root = Path(root)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    def _files(self) -> List[Tuple[float, int, Path]]:
+        files = []
+        for path in self.root.glob('??/*'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def touch(self, name: str) -> bool:
+        """Mark a stored file as used. ``False`` if it was evicted."""
+        try:
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put(self, content: bytes, suffix: str) -> Tuple[str, List[str]]:
+        """Store ``content`` unless stored already. Returns its name and the names of evicted files."""
+        digest = hashlib.sha256(content).hexdigest()
+        name = f'{digest[:2]}/{digest[2:]}{suffix}'
+        if self.touch(name):
+            return name, []
+
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name, so nginx never serves a partial file.
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(content)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._files())
+            else:
+                self._size += len(content)
+            if self._size <= self.max_size:
+                return name, []
+            return name, self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> List[str]:
+        evicted = []
+        with open(self.root / '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Other processes may have stored and evicted files meanwhile.
+                files = sorted(self._files())
+                size = sum(file_size for _, file_size, _ in files)
+                target = self.max_size * EVICTION_TARGET
+                for _, file_size, path in files:
+                    if size <= target:
+                        break
+                    if path == keep:
+                        continue
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    size -= file_size
+                    evicted.append(path.relative_to(self.root).as_posix())
+                self._size = size
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return evicted
+
+
+class FetchedThumbnails(NamedTuple):
+    # Stored file of every ad whose image was fetched.
+    names: Dict[int, str]
+    # Files deleted to make room, ads referring to them must not anymore.
+    evicted: Set[str]
+
+
+class ThumbnailFetcher(object):
+    """
+    Fetches ad images into a ``ThumbnailStore`` with a pool of threads.
+
+    ``submit`` returns at once, ``collect`` returns the thumbnails fetched since the last call.
+    """
+
+    def __init__(self, store: ThumbnailStore, workers: int):
+        self.store = store
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='thumbnails')
+        self._lock = threading.Lock()
+        self._futures: List[Future] = []
+
+    def submit(self, images: Iterable[Tuple[int, str]]):
+        """Fetch the images of ``(site_id, image_url)`` pairs in the background."""
+        futures = [self._executor.submit(self._fetch, site_id, url) for site_id, url in images]
+        with self._lock:
+            self._futures.extend(futures)
+
+    def _fetch(self, site_id: int, url: str) -> Optional[Tuple[int, str, List[str]]]:
+        # requests is only imported with the first fetch, see TransportRegistry.
+        import requests
+
+        try:
+            with get_session(THUMBNAIL_TRANSPORT).get(url, timeout=THUMBNAIL_TIMEOUT, stream=True) as response:
+                suffix = SUFFIXES.get(response.headers.get('Content-Type', '').split(';')[0].strip())
+                if response.status_code != 200 or suffix is None:
+                    return None
+                content = response.raw.read(MAX_THUMBNAIL_SIZE + 1, decode_content=True)
+        except (requests.RequestException, OSError):
+            return None
+        if not content or len(content) > MAX_THUMBNAIL_SIZE:
+            return None
+        name, evicted = self.store.put(content, suffix)
+        return site_id, name, evicted
+
+    def collect(self, wait: bool = True) -> FetchedThumbnails:
+        """Return the fetched thumbnails, of all submitted images if ``wait`` or of the finished ones."""
+        with self._lock:
+            if wait:
+                done, self._futures = self._futures, []
+            else:
+                done = [future for future in self._futures if future.done()]
+                self._futures = [future for future in self._futures if not future.done()]
+
+        names, evicted = {}, set()
+        for future in done:
+            result = future.result()
+            if result is not None:
+                site_id, name, evicted_names = result
+                names[site_id] = name
+                evicted.update(evicted_names)
+        # Evicted files may have been fetched again since.
+        evicted = {name for name in evicted if not self.store.path(name).exists()}
+        return FetchedThumbnails(
+            {site_id: name for site_id, name in names.items() if name not in evicted},
+            evicted,
+        )
+
+
+_thumbnail_fetcher = None
+_thumbnail_fetcher_lock = threading.Lock()
+
+
+def get_thumbnail_fetcher() -> Optional[ThumbnailFetcher]:
+    """Return the fetcher storing into ``PARSER_THUMBNAIL_DIR``, ``None`` if thumbnails are off."""
+    global _thumbnail_fetcher
+    if not settings.PARSER_THUMBNAIL_DIR:
+        return None
+    if _thumbnail_fetcher is None:
+        with _thumbnail_fetcher_lock:
+            if _thumbnail_fetcher is None:
+                _thumbnail_fetcher = ThumbnailFetcher(
+                    ThumbnailStore(settings.PARSER_THUMBNAIL_DIR, settings.PARSER_THUMBNAIL_CACHE_SIZE),
+                    settings.PARSER_THUMBNAIL_WORKERS,
+                )
+    return _thumbnail_fetcher
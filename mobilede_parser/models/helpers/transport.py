@@ -0,0 +1,115 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.conf import settings
+
+from core.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_TRANSPORT = 'default'
+
+
+class TransportRegistry(object):
+    """
+    Process-wide ``requests`` sessions, one per transport name.
+
+    Every search and ad fetched through the same transport shares its connection pools,
+    so keep-alive connections to mobile.de are reused across model instances and threads.
+    Sessions are recreated in forked children, which must not share sockets with their parent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, 'requests.Session'] = {}
+        self._pid = os.getpid()
+
+    @staticmethod
+    def _create_session() -> 'requests.Session':
+        # requests is imported by the first fetch, not by every process loading the models.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.PARSER_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.PARSER_HTTP_POOL_MAXSIZE,
+            max_retries=settings.PARSER_HTTP_MAX_RETRIES,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_session(self, name: str = DEFAULT_TRANSPORT) -> 'requests.Session':
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._sessions = {}
+                    self._pid = os.getpid()
+
+        session = self._sessions.get(name)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(name)
+                if session is None:
+                    session = self._sessions[name] = self._create_session()
+        return session
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        Return connection pool counters of every transport, by transport name and pool host.
+
+        ``requests`` per ``connections`` opened is the connection reuse of a pool.
+        """
+        stats = {}
+        for name, session in list(self._sessions.items()):
+            pools = {}
+            for adapter in set(session.adapters.values()):
+                manager = adapter.poolmanager
+                for key in list(manager.pools.keys()):
+                    pool = manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    pools[f'{pool.scheme}://{pool.host}:{pool.port}'] = {
+                        'connections': pool.num_connections,
+                        'requests': pool.num_requests,
+                    }
+            stats[name] = pools
+        return stats
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+transport_registry = TransportRegistry()
+
+
+def get_session(name: str = DEFAULT_TRANSPORT) -> 'requests.Session':
+    return transport_registry.get_session(name)
+
+
+def get_transport_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    return transport_registry.stats()
+
+
+# In-flight fetches and parses of pages, shared by the threads of a process.
+page_flights = SingleFlight()
+
+
+def canonical_url(url: str, params: Optional[Dict[str, object]] = None) -> str:
+    """``url`` with ``params`` added, its query sorted and no fragment, so equal requests get equal URLs."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(key, str(value)) for key, value in params.items()]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(sorted(query)), ''))
+
+
+def get_coalescing_stats() -> Dict[str, int]:
+    return page_flights.stats()
@@ -0,0 +1,46 @@
+from typing import Callable, Dict, Iterable, List
+
+from django.core.cache import cache
+
+SEARCH_VERSION_KEY = 'mobilede_parser:search:{}:version'
+USER_SEARCHES_KEY = 'mobilede_parser:user:{}:searches'
+
+
+def set_search_version(search_id: int, version: int):
+    cache.set(SEARCH_VERSION_KEY.format(search_id), version, None)
+
+
+def set_search_versions(versions: Dict[int, int]):
+    cache.set_many({SEARCH_VERSION_KEY.format(search_id): version for search_id, version in versions.items()}, None)
+
+
+def get_search_versions(
+    search_ids: Iterable[int],
+    load_versions: Callable[[List[int]], Dict[int, int]],
+) -> Dict[int, int]:
+    """
+    Return the data version of every search, from the cache where possible.
+
+    Versions missing from the cache are read with ``load_versions`` and cached.
+    """
+    keys = {SEARCH_VERSION_KEY.format(search_id): search_id for search_id in search_ids}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+    missing = [search_id for search_id in keys.values() if search_id not in versions]
+    if missing:
+        loaded = load_versions(missing)
+        cache.set_many({SEARCH_VERSION_KEY.format(search_id): version for search_id, version in loaded.items()}, None)
+        versions.update(loaded)
+    return versions
+
+
+def get_user_search_ids(user_id: int, load_search_ids: Callable[[], List[int]]) -> List[int]:
+    key = USER_SEARCHES_KEY.format(user_id)
+    search_ids = cache.get(key)
+    if search_ids is None:
+        search_ids = load_search_ids()
+        cache.set(key, search_ids, None)
+    return search_ids
+
+
+def forget_user_search_ids(user_ids: Iterable[int]):
+    cache.delete_many([USER_SEARCHES_KEY.format(user_id) for user_id in user_ids])
@@ -1,3 +1,528 @@
-from django.test import TestCase
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import skipUnless
 
-# Create your tests here.
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from mobilede_parser.fakesite import render_search_page
+from mobilede_parser.management.commands.benchmark_parser import legacy_extract
+from mobilede_parser.models import Ad, Search, SearchStats
+from mobilede_parser.models.helpers.archive import KIND_AD, KIND_SEARCH, PageArchive
+from mobilede_parser.models.helpers.deal_scores import (
+    NUMPY_IS_AVAILABLE, _score_in_python, _score_with_numpy, score_deals,
+)
+from mobilede_parser.models.helpers.duplicates import (
+    Candidate, Duplicate, find_duplicates, get_features, get_signatures,
+)
+from mobilede_parser.models.helpers.extractors import (
+    RESULT_ITEM_CLASS_RE, OnlineSinceDateParser, ParsedAd, SearchResultExtractor, extract_vehicle_attributes,
+)
+from mobilede_parser.models.helpers.fulltext import SQLITE_TRIGGERS, sqlite_fts_is_available
+from mobilede_parser.models.helpers.known_ids import get_known_ad_ids_generation, invalidate_known_ad_ids
+from mobilede_parser.models.helpers.percolator import Percolator
+from mobilede_parser.models.helpers.sharding import MIN_PRICE_RANGE_WIDTH, plan_price_shards
+from mobilede_parser.views.AdSearchApiView import ApiError, decode_cursor, encode_cursor
+
+# Crawler-only dependencies, which web processes must not import.
+CRAWLER_MODULES = ('bs4', 'lxml', 'requests', 'selenium', 'pyarrow')
+# Generous, so the test only fails when something heavy is imported eagerly again.
+IMPORT_TIME_BUDGET_US = 1500000
+SEARCH_URL = 'https://suchen.mobile.de/fahrzeuge/search.html'
+# Test ads get ids of their own, apart from the blocks of the fake site.
+FIRST_SITE_ID = 100000000
+# Crawled ads of the tests must only reach the searches they are saved for.
+isolated_crawl = override_settings(
+    PARSER_PERCOLATE_ADS=False, PARSER_DETECT_DUPLICATES=False, PARSER_THUMBNAIL_DIR=None,
+)
+
+
+class ImportTimeTests(SimpleTestCase):
+    def _import_web_process(self):
+        """Load settings, apps and URLconf like a web worker, return its ``-X importtime`` report."""
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import django; django.setup(); import core.urls'],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'core.settings'},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line.split('|')
+            imports.append((name.rstrip(), int(cumulative)))
+        return imports
+
+    def test_web_process_imports(self):
+        imports = self._import_web_process()
+        imported = {name.strip() for name, _ in imports}
+        for module in CRAWLER_MODULES:
+            self.assertNotIn(module, imported, f'"{module}" is imported when starting a web process')
+
+        # Only count top level imports from django on, the rest is the interpreter's startup.
+        top_level = [(name, cumulative) for name, cumulative in imports if not name.startswith('  ')]
+        start = next(index for index, (name, _) in enumerate(top_level) if name.strip() == 'django')
+        total = sum(cumulative for _, cumulative in top_level[start:])
+        self.assertLess(total, IMPORT_TIME_BUDGET_US, f'Starting a web process took {total} us of imports')
+
+
+class ExtractorTests(SimpleTestCase):
+    def test_search_page_matches_legacy_extraction(self):
+        extractor = SearchResultExtractor()
+        for seed in range(5):
+            page = render_search_page(seed=seed).encode()
+            items = BeautifulSoup(page, 'lxml').find('div', 'cBox--resultList').find_all('div', RESULT_ITEM_CLASS_RE)
+            parsed_ads = extractor.extract_page(page)
+            self.assertEqual(len(parsed_ads), len(items))
+            for parsed_ad, item in zip(parsed_ads, items):
+                expected = legacy_extract(item)
+                del expected['url']
+                self.assertEqual({field: getattr(parsed_ad, field) for field in expected}, expected)
+
+    def test_online_since_date(self):
+        parser = OnlineSinceDateParser(dt_timezone.utc)
+        self.assertEqual(
+            parser.parse('Ad online since Sep 13, 2021, 9:26 AM'),
+            datetime(2021, 9, 13, 9, 26, tzinfo=dt_timezone.utc),
+        )
+        self.assertEqual(parser.parse('Ad online since Jan 1, 2021, 12:05 AM').hour, 0)
+        self.assertEqual(parser.parse('Ad online since Jan 1, 2021, 12:05 PM').hour, 12)
+        for text in (
+            'Sep 13, 2021, 9:26 AM',
+            'Ad online since Foo 13, 2021, 9:26 AM',
+            'Ad online since Sep 13, 2021, 13:26 PM',
+        ):
+            with self.assertRaises(ValueError):
+                parser.parse(text)
+
+
+class PageArchiveTests(SimpleTestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as root:
+            # Small segments, so pages span several of them.
+            archive = PageArchive(root, segment_size=2048)
+            pages = {
+                f'https://example.com/{index}': random.Random(index).randbytes(1000)
+                for index in range(5)
+            }
+            for index, (url, content) in enumerate(pages.items()):
+                archive.append(KIND_SEARCH if index % 2 else KIND_AD, url, content, owner_id=index, fetched_at=index)
+            later = archive.append(KIND_AD, 'https://example.com/0', b'later', fetched_at=10)
+
+            # Read back by another archive, like another process would.
+            reader = PageArchive(root, segment_size=2048)
+            try:
+                self.assertGreater(len({entry.segment for entry in reader.entries}), 1)
+                for url, content in pages.items():
+                    self.assertEqual(reader.read(reader.find(url, fetched_at=5)), content)
+                self.assertEqual(reader.find('https://example.com/0'), later)
+                self.assertEqual(reader.read(reader.find('https://example.com/0')), b'later')
+                self.assertIsNone(reader.find('https://example.com/missing'))
+                self.assertEqual(
+                    [entry.owner_id for entry in reader.filter(kind=KIND_SEARCH)], [1, 3],
+                )
+                self.assertEqual([entry.url for entry in reader.filter(owner_ids={2, 4})], [
+                    'https://example.com/2', 'https://example.com/4',
+                ])
+            finally:
+                reader.close()
+                archive.close()
+
+
+class KeysetPageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        Ad.objects.bulk_create([
+            Ad(
+                site_id=FIRST_SITE_ID + index,
+                name=f'Ad {index}',
+                # Equal prices and dates, so pages must break ties on site_id, and some without any.
+                price=index % 4 * 1000 if index % 7 else None,
+                date=now - timedelta(days=index % 3) if index % 5 else None,
+            )
+            for index in range(30)
+        ])
+
+    def _paginate(self, sort: str, limit: int = 4) -> list:
+        field = sort.lstrip('-')
+        ads, after = [], None
+        while page := Ad.objects.keyset_page(sort, after, limit):
+            ads.extend(page)
+            after = decode_cursor(encode_cursor(page[-1], field), field)
+        return ads
+
+    def test_pages_match_ordering(self):
+        for sort in ('site_id', '-site_id', 'price', '-price', 'date', '-date'):
+            field = sort.lstrip('-')
+            direction = '-' if sort.startswith('-') else ''
+            expected = Ad.objects.all()
+            if field != 'site_id':
+                expected = expected.filter(**{f'{field}__isnull': False})
+            expected = expected.order_by(*dict.fromkeys((sort, f'{direction}site_id')))
+            with self.subTest(sort=sort):
+                self.assertEqual(self._paginate(sort), list(expected))
+
+    def test_invalid_cursors(self):
+        cursor = encode_cursor(Ad.objects.get(site_id=FIRST_SITE_ID + 1), 'date')
+        self.assertIsInstance(decode_cursor(cursor, 'date')[0], datetime)
+        for cursor, field in (
+            ('not base64!', 'price'),
+            (encode_cursor(Ad(site_id=1, price=None), 'price')[:-4], 'price'),
+            (cursor, 'price'),
+            (encode_cursor(Ad(site_id=1, name='x'), 'name'), 'price'),
+            (encode_cursor(Ad(site_id=1, price=10), 'price'), 'date'),
+        ):
+            with self.subTest(cursor=cursor, field=field), self.assertRaises(ApiError):
+                decode_cursor(cursor, field)
+
+
+class FullTextIndexTests(TransactionTestCase):
+    def test_migrate_restores_dropped_triggers(self):
+        if connection.vendor != 'sqlite' or not sqlite_fts_is_available(connection):
+            self.skipTest('Needs SQLite with FTS5.')
+        # Like a migration rebuilding the ad table would.
+        with connection.cursor() as cursor:
+            for name in SQLITE_TRIGGERS:
+                cursor.execute(f'DROP TRIGGER {name}')
+        Ad.objects.create(site_id=FIRST_SITE_ID, name='Zebra Roadster')
+
+        call_command('migrate', verbosity=0)
+        Ad.objects.create(site_id=FIRST_SITE_ID + 1, name='Zebra Coupe')
+        self.assertEqual(
+            sorted(Ad.objects.full_text('zebra').values_list('pk', flat=True)), [FIRST_SITE_ID, FIRST_SITE_ID + 1],
+        )
+
+
+class SearchImportTests(TestCase):
+    def test_duplicates(self):
+        existing = Search.objects.create(
+            name='Existing', parameters={'maxPrice': '10000', 'fuels': ['DIESEL', 'PETROL']},
+        )
+        result = Search.import_searches([
+            f'Cheap diesel {SEARCH_URL}?fuels=PETROL&fuels=DIESEL&maxPrice=10000&sset=1',
+            '',
+            f'{SEARCH_URL}?minPrice=5000&pageNumber=3',
+            f'Same again {SEARCH_URL}?minPrice=5000&ssid=abc',
+            'https://example.com/search.html?minPrice=5000',
+            f'{"x" * 2000} {SEARCH_URL}?minPrice=6000',
+        ])
+
+        created = dict(result.created)
+        self.assertEqual(sorted(created), [3, 6])
+        self.assertEqual(result.duplicates, [(1, existing.pk), (4, created[3])])
+        self.assertEqual([line_num for line_num, _ in result.errors], [5])
+        self.assertEqual(Search.objects.get(pk=created[3]).name, f'{SEARCH_URL}?minPrice=5000&pageNumber=3')
+        self.assertEqual(len(Search.objects.get(pk=created[6]).name), 1024)
+
+        # Importing the same lines again creates nothing.
+        self.assertEqual(Search.import_searches([f'{SEARCH_URL}?minPrice=5000']).created, [])
+
+
+class PriceShardTests(SimpleTestCase):
+    def test_plan(self):
+        # 10 ads per page of a fake site, with ads at every price up to 1000.
+        max_pages = 5
+
+        def count_pages(price_range):
+            low, high = price_range
+            num_ads = max(min(999 if high is None else high, 999) - low + 1, 0)
+            return min(num_ads // 10 + 1, max_pages)
+
+        shards = plan_price_shards(count_pages, (0, None), max_pages)
+        self.assertEqual(shards[0][0], 0)
+        self.assertIsNone(shards[-1][1])
+        for (_, high), (low, _) in zip(shards, shards[1:]):
+            self.assertEqual(low, high + 1)
+        for price_range in shards:
+            self.assertTrue(
+                count_pages(price_range) < max_pages or price_range[1] - price_range[0] < MIN_PRICE_RANGE_WIDTH
+            )
+
+    def test_ignored_price_bounds(self):
+        # Every range of a site ignoring the bounds fills every page, planning must end anyway.
+        with self.assertLogs('mobilede_parser.models.helpers.sharding', 'WARNING'):
+            shards = plan_price_shards(lambda price_range: 5, (0, None), 5)
+        self.assertIsNone(shards[-1][1])
+        for (_, high), (low, _) in zip(shards, shards[1:]):
+            self.assertEqual(low, high + 1)
+
+    def test_ignored_price_bounds(self):
+        counted = []
+
+        def count_pages(price_range):
+            counted.append(price_range)
+            # Every range of a site ignoring the bounds fills every page.
+            return 5
+
+        with self.assertLogs('mobilede_parser.models.helpers.sharding', 'WARNING'):
+            shards = plan_price_shards(count_pages, (0, None), 5, max_shards=16)
+        self.assertEqual(len(shards), 16)
+        self.assertLess(len(counted), 32)
+        self.assertIsNone(shards[-1][1])
+        for (_, high), (low, _) in zip(shards, shards[1:]):
+            self.assertEqual(low, high + 1)
+
+    def test_known_page_count(self):
+        shards = plan_price_shards(lambda price_range: self.fail('Counted pages.'), (0, 1000), 5, num_of_pages=4)
+        self.assertEqual(shards, [(0, 1000)])
+
+
+@isolated_crawl
+class CrawlTestCase(TestCase):
+    def setUp(self):
+        # Ids of ads stored by earlier tests were rolled back since.
+        invalidate_known_ad_ids()
+
+    @staticmethod
+    def _create_searches(num_searches: int) -> list:
+        return [
+            Search.objects.create(name=f'Search {index}', parameters={'minPrice': str(index)})
+            for index in range(num_searches)
+        ]
+
+    @staticmethod
+    def _parsed_ads(site_ids) -> list:
+        """Ads as crawled, priced in steps of 1000 and some without a price."""
+        return [
+            ParsedAd(site_id, f'Ad {site_id}', None, site_id % 40 * 1000 if site_id % 9 else None, None, '', '')
+            for site_id in site_ids
+        ]
+
+    def assertStatsRebuilt(self, searches):
+        """Check the incrementally updated stats of ``searches`` against stats computed from scratch."""
+        fields = ('ad_count', 'priced_ad_count', 'price_sum', 'price_histogram')
+        updated = {stats.pk: [getattr(stats, field) for field in fields] for stats in SearchStats.objects.all()}
+        SearchStats.rebuild([search.pk for search in searches])
+        rebuilt = {stats.pk: [getattr(stats, field) for field in fields] for stats in SearchStats.objects.all()}
+        self.assertEqual(updated, rebuilt)
+
+
+class ExpireAdsTests(CrawlTestCase):
+    def test_expire_ads(self):
+        search, other = self._create_searches(2)
+        search._save_ads(self._parsed_ads(range(FIRST_SITE_ID, FIRST_SITE_ID + 40)))
+        other._save_ads(self._parsed_ads(range(FIRST_SITE_ID + 30, FIRST_SITE_ID + 40)))
+        links = Ad.searches.through.objects.filter(search=search)
+        seen_before = timezone.now() - timedelta(days=1)
+        links.filter(ad_id__lt=FIRST_SITE_ID + 10).update(last_seen_at=seen_before - timedelta(days=1))
+        links.filter(ad_id__gte=FIRST_SITE_ID + 30).update(last_seen_at=seen_before - timedelta(days=1))
+        # Prices of 5000 to 7000 were in a truncated range, their ads are kept.
+        kept = set(Ad.objects.filter(
+            site_id__lt=FIRST_SITE_ID + 10, price__gte=5000, price__lte=7000,
+        ).values_list('site_id', flat=True))
+        self.assertTrue(kept)
+
+        expired = search.expire_ads(seen_before, keep_price_ranges=[(5000, 7000)])
+        self.assertEqual(expired, 20 - len(kept))
+        self.assertEqual(
+            set(links.values_list('ad_id', flat=True)),
+            kept | set(range(FIRST_SITE_ID + 10, FIRST_SITE_ID + 30)),
+        )
+        # Ads of no other search are deleted, those of the other search only unlinked.
+        self.assertEqual(
+            set(Ad.objects.filter(site_id__lt=FIRST_SITE_ID + 10).values_list('site_id', flat=True)), kept,
+        )
+        self.assertEqual(Ad.objects.filter(site_id__gte=FIRST_SITE_ID + 30).count(), 10)
+        self.assertEqual(other.ad_set.count(), 10)
+        self.assertStatsRebuilt([search, other])
+        self.assertEqual(search.expire_ads(seen_before, keep_price_ranges=[(5000, 7000)]), 0)
+
+
+class ReparseTests(CrawlTestCase):
+    def test_missing_ads_are_stored_again(self):
+        search, other, deleted = self._create_searches(3)
+        pages = [
+            (search, render_search_page(first_id=FIRST_SITE_ID).encode()),
+            (other, render_search_page(seed=1, first_id=FIRST_SITE_ID + 10).encode()),
+            (deleted, render_search_page(seed=2, first_id=FIRST_SITE_ID + 100, num_ads=5).encode()),
+        ]
+        extractor = SearchResultExtractor()
+        with tempfile.TemporaryDirectory() as root:
+            archive = PageArchive(root)
+            try:
+                for index, (owner, page) in enumerate(pages):
+                    archive.append(KIND_SEARCH, SEARCH_URL, page, owner_id=owner.id, fetched_at=1000 * (index + 1))
+                    owner._save_ads(extractor.extract_page(page))
+            finally:
+                archive.close()
+            deleted.delete()
+            Ad.objects.filter(site_id__gte=FIRST_SITE_ID + 100).delete()
+            Ad.objects.filter(site_id__gte=FIRST_SITE_ID + 5, site_id__lt=FIRST_SITE_ID + 15).delete()
+
+            def reparse(**options) -> str:
+                out = StringIO()
+                call_command('reparse', archive=root, kind=[KIND_SEARCH], parse_workers=0, stdout=out, **options)
+                return out.getvalue()
+
+            self.assertIn('0 missing ads stored, 15 skipped.', reparse(skip_missing=True))
+            self.assertEqual(Ad.objects.count(), 20)
+            self.assertIn('10 missing ads stored, 5 skipped.', reparse())
+
+        self.assertEqual(
+            sorted(search.ad_set.values_list('pk', flat=True)), list(range(FIRST_SITE_ID, FIRST_SITE_ID + 20)),
+        )
+        self.assertEqual(
+            sorted(other.ad_set.values_list('pk', flat=True)), list(range(FIRST_SITE_ID + 10, FIRST_SITE_ID + 30)),
+        )
+        self.assertEqual(
+            Ad.searches.through.objects.get(search=search, ad_id=FIRST_SITE_ID + 5).last_seen_at,
+            datetime.fromtimestamp(1000, dt_timezone.utc),
+        )
+        self.assertStatsRebuilt([search, other])
+
+
+@isolated_crawl
+class KnownAdIdsTests(TransactionTestCase):
+    # Links to deleted ads only fail when their transaction commits.
+    def test_deleted_ad_is_saved_again(self):
+        invalidate_known_ad_ids()
+        search = Search.objects.create(name='Search', parameters={'minPrice': '0'})
+        parsed_ads = [ParsedAd(FIRST_SITE_ID, 'Ad', None, 1000, None, '', '')]
+        search._save_ads(parsed_ads)
+        generation = get_known_ad_ids_generation()
+
+        # Deleting ads keeps the known ids, the save finding one gone reloads them.
+        Ad.objects.filter(site_id=FIRST_SITE_ID).delete()
+        self.assertEqual(get_known_ad_ids_generation(), generation)
+        search._save_ads(parsed_ads)
+        self.assertEqual(list(search.ad_set.values_list('pk', flat=True)), [FIRST_SITE_ID])
+        self.assertNotEqual(get_known_ad_ids_generation(), generation)
+
+
+class PercolatorTests(SimpleTestCase):
+    def test_match(self):
+        percolator = Percolator([
+            (1, {'maxPrice': '10000'}),
+            (2, {'minPrice': '5000', 'fuels': ['DIESEL', 'PETROL'], 'minFirstRegistrationDate': '2015'}),
+            (3, {'minPowerAsArray': ['150', 'PS'], 'vatable': 'true', 'scopeId': 'C', 'sset': '123'}),
+            (4, {'makeModelVariant1.makeId': '1900'}),
+            (5, {'scopeId': 'MB'}),
+            (6, {'vatable': 'maybe'}),
+        ])
+        self.assertEqual(sorted(percolator.unsupported_search_ids), [4, 5, 6])
+
+        def ad(**fields):
+            return ParsedAd(**{
+                'site_id': 1, 'name': 'BMW 520d', 'date': None, 'price': 8000, 'vat': None,
+                'description': '', 'image_url': '', 'mileage': 100000,
+                'first_registration': date(2016, 5, 1), 'power_kw': 100, 'fuel': 'DIESEL', **fields,
+            })
+
+        self.assertEqual(sorted(percolator.match(ad())), [1, 2])
+        self.assertEqual(sorted(percolator.match(ad(price=12000, vat=19, power_kw=110))), [2, 3])
+        self.assertEqual(sorted(percolator.match(ad(first_registration=date(2014, 12, 31)))), [1])
+        self.assertEqual(sorted(percolator.match(ad(fuel='ELECTRICITY', price=4000))), [1])
+        # 150 hp are 110 kW.
+        self.assertEqual(percolator.match(ad(price=None, vat=19, power_kw=109)), [])
+
+
+class VehicleAttributeTests(SimpleTestCase):
+    def test_extract(self):
+        attributes = extract_vehicle_attributes(
+            'FR 03/2015, 123,400 km, 110 kW (150 hp) Saloon, Hybrid (petrol/electric), Manual gearbox, HU 06/2023'
+        )
+        self.assertEqual(attributes.mileage, 123400)
+        self.assertEqual(attributes.first_registration, date(2015, 3, 1))
+        self.assertEqual(attributes.power_kw, 110)
+        self.assertEqual(attributes.fuel, 'HYBRID')
+        self.assertEqual(attributes.transmission, 'MANUAL_GEAR')
+
+        self.assertEqual(extract_vehicle_attributes(None), (None, None, None, '', ''))
+        # An invalid month isn't a registration, and labels only count as whole items.
+        attributes = extract_vehicle_attributes('FR 13/2015, Petrol tank cover')
+        self.assertIsNone(attributes.first_registration)
+        self.assertEqual(attributes.fuel, '')
+
+
+class SearchStatsTests(CrawlTestCase):
+    def test_apply_changes_matches_rebuild(self):
+        searches = self._create_searches(2)
+        SearchStats.rebuild([search.pk for search in searches])
+        searches[0]._save_ads(self._parsed_ads(range(FIRST_SITE_ID, FIRST_SITE_ID + 60)))
+        searches[1]._save_ads(self._parsed_ads(range(FIRST_SITE_ID + 30, FIRST_SITE_ID + 90)))
+        Ad.objects.filter(site_id__lt=FIRST_SITE_ID + 10).delete()
+        Ad.objects.get(site_id=FIRST_SITE_ID + 40).delete()
+        self.assertEqual(SearchStats.objects.get(pk=searches[0].pk).ad_count, 49)
+        self.assertStatsRebuilt(searches)
+
+    @override_settings(PARSER_PERCOLATE_ADS=True)
+    def test_percolated_links_count_once(self):
+        search, pricier = self._create_searches(1) + [
+            Search.objects.create(name='Pricier', parameters={'minPrice': '5000'}),
+        ]
+        parsed_ads = self._parsed_ads(range(FIRST_SITE_ID, FIRST_SITE_ID + 40))
+        search._save_ads(parsed_ads)
+        self.assertEqual(
+            SearchStats.objects.get(pk=pricier.pk).ad_count,
+            sum(ad.price is not None and ad.price >= 5000 for ad in parsed_ads),
+        )
+        # Crawling the other search finds the ads it was linked to already.
+        pricier._save_ads(parsed_ads)
+        search._save_ads(parsed_ads)
+        self.assertEqual(SearchStats.objects.get(pk=pricier.pk).ad_count, len(parsed_ads))
+        self.assertStatsRebuilt([search, pricier])
+
+
+class DealScoreTests(SimpleTestCase):
+    def test_missing_and_small_groups(self):
+        groups = ['a'] * 5 + ['b'] * 2 + [None, 'a']
+        prices = [10000, 11000, 12000, 13000, 30000, 5000, 6000, 7000, None]
+        scores, percentiles = score_deals(groups, prices)
+        self.assertEqual(scores[5:], [None] * 4)
+        self.assertEqual(percentiles[:5], [0, 20, 40, 60, 80])
+        self.assertGreater(scores[0], 0)
+        self.assertLess(scores[4], 0)
+
+    @skipUnless(NUMPY_IS_AVAILABLE, 'NumPy is not installed.')
+    def test_numpy_matches_python(self):
+        rng = random.Random(0)
+        codes = [rng.randrange(20) for _ in range(2000)]
+        # Few distinct prices, so groups have equal prices and some a zero deviation.
+        prices = [rng.randrange(10) * 1000 if code % 5 else 5000 for code in codes]
+        with_numpy, in_python = _score_with_numpy(codes, prices), _score_in_python(codes, prices)
+        for numpy_values, python_values in zip(with_numpy, in_python):
+            self.assertEqual([value is None for value in numpy_values], [value is None for value in python_values])
+            for numpy_value, python_value in zip(numpy_values, python_values):
+                if python_value is not None:
+                    self.assertAlmostEqual(numpy_value, python_value)
+
+
+class DuplicateTests(SimpleTestCase):
+    description = 'FR 03/2015, 123,400 km, 110 kW (150 hp) Saloon, Diesel, Manual gearbox, HU 06/2023'
+
+    def _signature(self, name: str, price: int, image_url: str = 'https://i.ebayimg.com/00/s/x/z/abc/$_10.JPG'):
+        return get_signatures([get_features(name, self.description, price, image_url)])[0]
+
+    def test_find_duplicates(self):
+        stored = Candidate(1, None, self._signature('BMW 520d Touring', 15000))
+        relisted = Candidate(2, 1, self._signature('BMW 520d Touring', 15100))
+        requested_keys = []
+
+        def load_candidates(keys):
+            requested_keys.append(keys)
+            return [stored, relisted]
+
+        signatures = [
+            # Relisted again, a little cheaper.
+            self._signature('BMW 520d Touring', 14900),
+            self._signature('Audi A4 Avant', 9000, 'https://i.ebayimg.com/00/s/x/z/def/$_10.JPG'),
+            # Duplicates the Audi of the same batch.
+            self._signature('Audi A4 Avant', 9000, 'https://i.ebayimg.com/00/s/x/z/def/$_10.JPG'),
+        ]
+        self.assertEqual(find_duplicates(signatures, load_candidates, [3, 4, 5]), [
+            Duplicate(0, 1), Duplicate(2, 4),
+        ])
+        self.assertEqual(len(requested_keys), 1)
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from .views import AdSearchApiView, MyAdsView, SearchAdsExportView, SearchImportApiView
+
+urlpatterns = [
+    path('ads/', AdSearchApiView.as_view(), name='ad_search_api'),
+    path('my/ads/', MyAdsView.as_view(), name='my_ads'),
+    path('searches/import/', SearchImportApiView.as_view(), name='search_import_api'),
+    path('searches/<int:search_id>/ads.<str:export_format>', SearchAdsExportView.as_view(), name='search_ads_export'),
+]
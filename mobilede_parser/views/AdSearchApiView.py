@@ -0,0 +1,223 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views import View
+
+from core.views import AsyncViewMixin
+from ..models import Ad, Search
+
+MAX_LIMIT = 200
+DEFAULT_LIMIT = 50
+PRICE_FACET_BOUNDS = (5000, 10000, 20000, 30000, 50000)
+DATE_FACET_DAYS = (1, 7, 30)
+FACETS_KEY = 'mobilede_parser:ad-facets:{}'
+# Parameters of the page, not of the filtered set.
+PAGE_PARAMETERS = ('sort', 'limit', 'cursor', 'facets')
+
+
+class ApiError(Exception):
+    pass
+
+
+def encode_cursor(ad: Ad, field: str) -> str:
+    value = getattr(ad, field)
+    if field == 'date':
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, ad.site_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str, field: str) -> tuple:
+    try:
+        value, site_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise ApiError('Invalid cursor.')
+    if not isinstance(site_id, int):
+        raise ApiError('Invalid cursor.')
+    if field == 'date':
+        if not isinstance(value, str) or (value := parse_datetime(value)) is None:
+            raise ApiError('Invalid cursor.')
+    elif value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        raise ApiError('Invalid cursor.')
+    return value, site_id
+
+
+def serialize_ad(ad: Ad) -> Dict[str, Any]:
+    return {
+        'site_id': ad.site_id,
+        'name': ad.name,
+        'price': ad.price,
+        'price_net': ad.price_net,
+        'vat': ad.vat,
+        'date': ad.date and ad.date.isoformat(),
+        'description': ad.description,
+        'image_url': ad.image_url,
+        'thumbnail_url': ad.thumbnail_url,
+        'mileage': ad.mileage,
+        'first_registration': ad.first_registration and ad.first_registration.isoformat(),
+        'power_kw': ad.power_kw,
+        'fuel': ad.fuel,
+        'transmission': ad.transmission,
+        'deal_score': ad.deal_score,
+        'price_percentile': ad.price_percentile,
+        'canonical_ad': ad.canonical_ad_id,
+        'url': ad.url,
+    }
+
+
+class AdSearchApiView(AsyncViewMixin, LoginRequiredMixin, View):
+    """
+    Read-only JSON search over stored ads.
+
+    Query parameters: ``q`` (full text over name and description), ``search`` (a search id),
+    ``min_price``, ``max_price``, ``vat`` (repeatable), ``since``, ``until``, ``min_mileage``, ``max_mileage``,
+    ``min_power`` and ``max_power`` (kW), ``min_registration`` and ``max_registration`` (dates), ``fuel`` and
+    ``transmission`` (repeatable, as in search URLs, e.g. "DIESEL"), ``sort``, ``limit``,
+    ``cursor`` (the ``next_cursor`` of the previous page) and ``facets=1``.
+    """
+    raise_exception = True
+
+    def _get_int(self, name: str) -> Optional[int]:
+        value = self.request.GET.get(name)
+        if value in (None, ''):
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise ApiError(f'Parameter "{name}" must be an integer.')
+
+    def _get_datetime(self, name: str):
+        value = self.request.GET.get(name)
+        if value in (None, ''):
+            return None
+        date = parse_datetime(value)
+        if date is None:
+            raise ApiError(f'Parameter "{name}" must be an ISO 8601 datetime.')
+        return date
+
+    def _get_date(self, name: str):
+        value = self.request.GET.get(name)
+        if value in (None, ''):
+            return None
+        try:
+            date = parse_date(value)
+        except ValueError:
+            date = None
+        if date is None:
+            raise ApiError(f'Parameter "{name}" must be an ISO 8601 date.')
+        return date
+
+    def _filter(self):
+        params = self.request.GET
+        queryset = Ad.objects.all()
+
+        if query := params.get('q', '').strip():
+            queryset = queryset.full_text(query)
+        if (search_id := self._get_int('search')) is not None:
+            queryset = queryset.filter(searches=search_id)
+        if (min_price := self._get_int('min_price')) is not None:
+            queryset = queryset.filter(price__gte=min_price)
+        if (max_price := self._get_int('max_price')) is not None:
+            queryset = queryset.filter(price__lte=max_price)
+        if vats := params.getlist('vat'):
+            try:
+                queryset = queryset.filter(vat__in=[int(vat) for vat in vats])
+            except ValueError:
+                raise ApiError('Parameter "vat" must be an integer.')
+        if (since := self._get_datetime('since')) is not None:
+            queryset = queryset.filter(date__gte=since)
+        if (until := self._get_datetime('until')) is not None:
+            queryset = queryset.filter(date__lte=until)
+        for field, name in (('mileage', 'mileage'), ('power_kw', 'power')):
+            if (low := self._get_int(f'min_{name}')) is not None:
+                queryset = queryset.filter(**{f'{field}__gte': low})
+            if (high := self._get_int(f'max_{name}')) is not None:
+                queryset = queryset.filter(**{f'{field}__lte': high})
+        if (min_registration := self._get_date('min_registration')) is not None:
+            queryset = queryset.filter(first_registration__gte=min_registration)
+        if (max_registration := self._get_date('max_registration')) is not None:
+            queryset = queryset.filter(first_registration__lte=max_registration)
+        if fuels := params.getlist('fuel'):
+            queryset = queryset.filter(fuel__in=fuels)
+        if transmissions := params.getlist('transmission'):
+            queryset = queryset.filter(transmission__in=transmissions)
+        return queryset
+
+    def _get_facets(self, queryset) -> Dict[str, Any]:
+        """
+        Return the facets of the filtered ads, cached for ``PARSER_AD_FACETS_CACHE_TIMEOUT`` seconds.
+
+        They are cached under the filter parameters, and for a ``search`` filter under its
+        data version too, so they go stale as soon as a crawl saves ads for it.
+        """
+        filters = sorted(
+            (name, sorted(values)) for name, values in self.request.GET.lists() if name not in PAGE_PARAMETERS
+        )
+        search_id = self._get_int('search')
+        version = Search.get_data_versions([search_id]).get(search_id) if search_id is not None else None
+        digest = hashlib.sha1(repr((filters, version)).encode()).hexdigest()
+        key = FACETS_KEY.format(digest)
+
+        facets = cache.get(key)
+        if facets is None:
+            facets = self._facets(queryset)
+            cache.set(key, facets, settings.PARSER_AD_FACETS_CACHE_TIMEOUT)
+        return facets
+
+    @staticmethod
+    def _facets(queryset) -> Dict[str, Any]:
+        price_ranges = list(zip((0,) + PRICE_FACET_BOUNDS, PRICE_FACET_BOUNDS + (None,)))
+        now = timezone.now()
+        aggregates = {
+            f'price_{index}': Count('pk', filter=Q(price__gte=low) & (Q(price__lt=high) if high else Q()))
+            for index, (low, high) in enumerate(price_ranges)
+        }
+        aggregates.update({
+            f'date_{days}': Count('pk', filter=Q(date__gte=now - timedelta(days=days)))
+            for days in DATE_FACET_DAYS
+        })
+        counts = queryset.aggregate(**aggregates)
+
+        return {
+            'price': [
+                {'min': low, 'max': high, 'count': counts[f'price_{index}']}
+                for index, (low, high) in enumerate(price_ranges)
+            ],
+            'vat': list(queryset.order_by('vat').values('vat').annotate(count=Count('pk'))),
+            'date': [{'days': days, 'count': counts[f'date_{days}']} for days in DATE_FACET_DAYS],
+        }
+
+    def _get(self, request, *args, **kwargs):
+        sort = request.GET.get('sort', '-site_id')
+        field = sort.lstrip('-')
+        try:
+            limit = max(1, min(self._get_int('limit') or DEFAULT_LIMIT, MAX_LIMIT))
+            queryset = self._filter()
+            cursor = request.GET.get('cursor')
+            after = decode_cursor(cursor, field) if cursor else None
+            ads = queryset.keyset_page(sort=sort, after=after, limit=limit)
+        except (ApiError, ValueError) as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        data = {
+            'results': [serialize_ad(ad) for ad in ads],
+            'next_cursor': encode_cursor(ads[-1], field) if len(ads) == limit else None,
+        }
+        if request.GET.get('facets') in ('1', 'true'):
+            data['facets'] = self._get_facets(queryset)
+        return JsonResponse(data)
+
+    async def get(self, request, *args, **kwargs):
+        # Django 3.2 has no async ORM, the queries run in a thread.
+        return await sync_to_async(self._get)(request, *args, **kwargs)
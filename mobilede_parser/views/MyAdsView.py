@@ -0,0 +1,61 @@
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+
+from core.views import AsyncViewMixin
+from ..models import Search
+from ..models.helpers.versions import get_user_search_ids
+from .AdSearchApiView import serialize_ad
+
+MY_ADS_KEY = 'mobilede_parser:user:{}:my-ads:{}:{}'
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+class MyAdsView(AsyncViewMixin, LoginRequiredMixin, View):
+    """
+    The ad counts and latest ads of every search the user is subscribed to.
+
+    Rendered responses are cached under the data versions of the user's searches,
+    so they are reused until ads of one of them are saved, changed or deleted: every
+    write of a rendered field bumps the versions of the searches linking the ad.
+    """
+    raise_exception = True
+
+    def _get(self, request, *args, **kwargs):
+        try:
+            limit = max(1, min(int(request.GET.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+        except ValueError:
+            return JsonResponse({'error': 'Parameter "limit" must be an integer.'}, status=400)
+
+        user = request.user
+        search_ids = get_user_search_ids(
+            user.pk,
+            lambda: list(Search.objects.filter(subscribers=user).order_by('pk').values_list('pk', flat=True)),
+        )
+        versions = Search.get_data_versions(search_ids)
+        digest = hashlib.sha1(repr(sorted(versions.items())).encode()).hexdigest()
+        key = MY_ADS_KEY.format(user.pk, limit, digest)
+
+        body = cache.get(key)
+        if body is None:
+            body = json.dumps({'searches': [
+                {
+                    'id': search.pk,
+                    'name': search.name,
+                    'count': search.ad_set.without_duplicates().count(),
+                    'ads': [serialize_ad(ad) for ad in search.ad_set.without_duplicates().keyset_page(limit=limit)],
+                }
+                for search in Search.objects.filter(pk__in=search_ids).order_by('pk')
+            ]}).encode('utf-8')
+            cache.set(key, body, settings.PARSER_MY_ADS_CACHE_TIMEOUT)
+        return HttpResponse(body, content_type='application/json')
+
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(self._get)(request, *args, **kwargs)
@@ -0,0 +1,32 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views import View
+
+from core.views import AsyncViewMixin
+from ..models import Search
+from ..models.helpers.exporters import EXPORT_FIELDS, EXPORTERS
+
+
+class SearchAdsExportView(AsyncViewMixin, LoginRequiredMixin, View):
+    """
+    Stream all ads of a search as CSV, JSON Lines or Parquet.
+
+    Under ASGI the rows are read while streaming by ``core.asgi.StreamingASGIHandler``.
+    """
+    raise_exception = True
+
+    async def get(self, request, search_id, export_format, *args, **kwargs):
+        if export_format not in EXPORTERS:
+            raise Http404(f'Unknown export format "{export_format}".')
+
+        searches = Search.objects.all()
+        if not request.user.is_staff:
+            searches = searches.filter(subscribers=request.user)
+        search = await sync_to_async(get_object_or_404)(searches, pk=search_id)
+
+        exporter, content_type = EXPORTERS[export_format]
+        response = StreamingHttpResponse(exporter(search.iter_ads(EXPORT_FIELDS)), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="search-{search.pk}-ads.{export_format}"'
+        return response
@@ -0,0 +1,47 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.views import View
+
+from core.views import AsyncViewMixin
+from ..models import Search
+
+MAX_LINES = 10000
+
+
+class SearchImportApiView(AsyncViewMixin, LoginRequiredMixin, View):
+    """
+    Create searches from mobile.de search URLs and subscribe the user to them.
+
+    The body is either plain text, one URL per line optionally preceded by a name,
+    or JSON ``{"urls": [...]}``. Every line is reported as created, duplicate or error.
+    """
+    raise_exception = True
+
+    def _get_lines(self):
+        if self.request.content_type == 'application/json':
+            try:
+                urls = json.loads(self.request.body)['urls']
+            except (ValueError, KeyError, TypeError):
+                return None
+            return [url for url in urls if isinstance(url, str)] if isinstance(urls, list) else None
+        return self.request.body.decode('utf-8', errors='replace').splitlines()
+
+    def _post(self, request, *args, **kwargs):
+        lines = self._get_lines()
+        if lines is None:
+            return JsonResponse({'error': 'Expected {"urls": [...]}.'}, status=400)
+        if len(lines) > MAX_LINES:
+            return JsonResponse({'error': f'At most {MAX_LINES} URLs can be imported at once.'}, status=400)
+
+        result = Search.import_searches(lines, subscriber=request.user)
+        return JsonResponse({
+            'created': [{'line': line_num, 'search': search_id} for line_num, search_id in result.created],
+            'duplicates': [{'line': line_num, 'search': search_id} for line_num, search_id in result.duplicates],
+            'errors': [{'line': line_num, 'error': error} for line_num, error in result.errors],
+        }, status=201 if result.created else 200)
+
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(self._post)(request, *args, **kwargs)
@@ -0,0 +1,11 @@
+from .AdSearchApiView import AdSearchApiView
+from .MyAdsView import MyAdsView
+from .SearchAdsExportView import SearchAdsExportView
+from .SearchImportApiView import SearchImportApiView
+
+__all__ = (
+    'AdSearchApiView',
+    'MyAdsView',
+    'SearchAdsExportView',
+    'SearchImportApiView',
+)
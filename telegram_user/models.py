@@ -1,4 +1,3 @@
-import requests
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
@@ -66,6 +65,8 @@ class TelegramUser(AbstractBaseUser, PermissionsMixin):
 
     def notify(self, message: str, **kwargs):
         """Send a telegram message via bot to this user."""
+        import requests
+
         message_parse_mode = kwargs.get('parse_mode') or 'MarkdownV2'
 
         request_url = f'https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage'
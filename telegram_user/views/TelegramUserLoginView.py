@@ -1,35 +1,57 @@
-from functools import cache
+from typing import Any, Dict, Optional
 
-import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth.views import LoginView
 
+from core.singleflight import SingleFlight
+from core.views import AsyncViewMixin
 
 # TODO: refactoring. do something with:
 #       <telegram_user.views.TelegramUserLoginView.get_telegram_bot_data>
 #       <telegram_user.views.TelegramUserLoginView.get_telegram_bot_username>
 #       <telegram_user.views.TelegramUserLoginView.TelegramUserLoginView.get_context_data>
 
-@cache
-def get_telegram_bot_data():
-    response = requests.get(f'https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/getMe')
+_telegram_bot_data: Optional[Dict[str, Any]] = None
+
+
+# Logins arriving before the bot data is known wait for one getMe request.
+_telegram_bot_data_flight = SingleFlight()
+
+
+async def _fetch_telegram_bot_data() -> Dict[str, Any]:
+    global _telegram_bot_data
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        response = await client.get(f'https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/getMe')
     response.raise_for_status()
-    response = response.json()
-    return response['result']
+    _telegram_bot_data = response.json()['result']
+    return _telegram_bot_data
+
 
+async def get_telegram_bot_data() -> Dict[str, Any]:
+    if _telegram_bot_data is None:
+        return await _telegram_bot_data_flight.do_async('getMe', _fetch_telegram_bot_data)
+    return _telegram_bot_data
 
-@cache
-def get_telegram_bot_username():
-    return get_telegram_bot_data()['username']
 
+async def get_telegram_bot_username() -> str:
+    return (await get_telegram_bot_data())['username']
 
-class TelegramUserLoginView(LoginView):
+
+class TelegramUserLoginView(AsyncViewMixin, LoginView):
     template_name = 'telegram_login.html'
 
+    async def dispatch(self, request, *args, **kwargs):
+        self.tg_bot_username = await get_telegram_bot_username()
+        # The login form authenticates against the database, which has no async API.
+        return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context.update({
-            'tg_bot_username': get_telegram_bot_username(),
+            'tg_bot_username': self.tg_bot_username,
             'tg_redirect_url': 'http://localhost.com/user/telegram_login/'
         })
         return context
@@ -3,6 +3,7 @@ from collections import OrderedDict
 from hashlib import sha256
 from typing import Dict
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import login as auth_login
 from django.http import HttpResponseBadRequest
@@ -10,10 +11,11 @@ from django.shortcuts import redirect
 from django.views import View
 from furl import furl
 
+from core.views import AsyncViewMixin
 from ..models import TelegramUser
 
 
-class TelegramUserOAuthView(View):
+class TelegramUserOAuthView(AsyncViewMixin, View):
     def _check_tg_hash(self) -> bool:
         request = OrderedDict(sorted(self.request.GET.items()))
         received_hash = request.pop('hash')
@@ -39,18 +41,20 @@ class TelegramUserOAuthView(View):
                             path=referer_url.query.params.get('next'))
         return str(redirect_url) or '/'
 
-    def get(self, request, *args, **kwargs):
-        if self._check_tg_hash():
-            user_data = self._prepare_user_data()
-            username = user_data.pop('username')
+    def _login(self, user_data: Dict[str, str]):
+        username = user_data.pop('username')
+
+        user, created = TelegramUser.objects.get_or_create(username=username, defaults=user_data)
+        if not created:
+            for key, value in user_data.items():
+                setattr(user, key, value)
+            user.save()
 
-            user, created = TelegramUser.objects.get_or_create(username=username, defaults=user_data)
-            if not created:
-                for key, value in user_data.items():
-                    setattr(user, key, value)
-                user.save()
+        auth_login(self.request, user)
 
-            auth_login(request, user)
+    async def get(self, request, *args, **kwargs):
+        if self._check_tg_hash():
+            await sync_to_async(self._login)(self._prepare_user_data())
             return redirect(self._form_redirect_link())
         else:
             return HttpResponseBadRequest()
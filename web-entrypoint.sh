@@ -13,6 +13,23 @@ fi
 
 #python manage.py makemigrations
 python manage.py migrate
-gunicorn core.wsgi:application --reload --bind 0.0.0.0:8000
+
+# WEB_SERVER_MODE=asgi serves core.asgi with uvicorn workers, anything else core.wsgi with sync workers
+if [ "$WEB_SERVER_MODE" = "asgi" ]
+then
+    WEB_APPLICATION="core.asgi:application"
+    WEB_WORKER_CLASS="uvicorn_worker.UvicornWorker"
+else
+    WEB_APPLICATION="core.wsgi:application"
+    WEB_WORKER_CLASS="sync"
+fi
+WEB_WORKERS="${WEB_WORKERS:-$(( 2 * $(nproc) + 1 ))}"
+
+case "$(echo "$DEBUG" | tr '[:upper:]' '[:lower:]')" in
+    1|true) WEB_RELOAD="--reload" ;;
+    *) WEB_RELOAD="" ;;
+esac
+
+gunicorn "$WEB_APPLICATION" --worker-class "$WEB_WORKER_CLASS" --workers "$WEB_WORKERS" $WEB_RELOAD --bind 0.0.0.0:8000
 
 exec "$@"